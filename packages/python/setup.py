@@ -34,6 +34,11 @@ setup(
         ],
     },
     include_package_data=True,
+    entry_points={
+        "console_scripts": [
+            "schema-resume=schema_resume.cli:main",
+        ],
+    },
     python_requires=">=3.8",
     install_requires=[
         "jsonschema>=4.17.0",
@@ -50,6 +55,12 @@ setup(
         "xml": [
             "lxml>=4.9.0",
         ],
+        "parquet": [
+            "pyarrow>=10.0.0",
+        ],
+        "numpy": [
+            "numpy>=1.20.0",
+        ],
     },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
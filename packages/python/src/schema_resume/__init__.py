@@ -1,7 +1,9 @@
 """Schema Resume Validator - JSON Schema validation for resumes/CVs."""
 
-from .validator import ResumeValidator, validate_resume
-from .exceptions import ValidationError, SchemaError
+from .validator import ResumeValidator, error_entry, validate_resume
+from .exceptions import ValidationError, SchemaError, LimitExceededError
+from .limits import ResumeLimits
+from .aggregate import ErrorAggregator, aggregate_results
 
 __version__ = "1.2.0"
 __author__ = "Schema Resume"
@@ -11,6 +13,11 @@ __url__ = "https://schema-resume.org/"
 __all__ = [
     "ResumeValidator",
     "validate_resume",
+    "error_entry",
     "ValidationError",
     "SchemaError",
+    "LimitExceededError",
+    "ResumeLimits",
+    "ErrorAggregator",
+    "aggregate_results",
 ]
@@ -0,0 +1,321 @@
+"""Corpus-wide aggregation of validation errors."""
+
+import csv
+import heapq
+import itertools
+import json
+import random
+import re
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+
+GroupKey = Tuple[str, str, str]
+
+_INDEX_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def normalize_path(path: str) -> str:
+    """
+    Collapse array indices in a document path.
+
+    Args:
+        path: JSON pointer style path as produced by ``ResumeValidator``
+
+    Returns:
+        The path with every numeric segment replaced by ``*``, so that
+        ``/work/3/startDate`` and ``/work/0/startDate`` share one group.
+    """
+    return _INDEX_SEGMENT.sub("/*", path)
+
+
+class _ErrorGroup:
+    """Counters and document samples for a single error group."""
+
+    __slots__ = ("errors", "documents", "overestimate", "message", "samples")
+
+    def __init__(self, overestimate: int = 0) -> None:
+        self.errors = overestimate
+        self.documents = overestimate
+        self.overestimate = overestimate
+        self.message: Optional[str] = None
+        self.samples: List[Any] = []
+
+
+class ErrorAggregator:
+    """
+    Streaming reducer over ``ResumeValidator`` results.
+
+    Errors are grouped by ``(schema_path, validator, normalized path)``.
+    Memory is bounded by ``max_groups`` (Space-Saving eviction of the
+    least frequent group, found in amortized ``O(log max_groups)`` with a
+    lazily updated min-heap) and ``samples_per_group`` (reservoir sampling
+    of document identifiers). Aggregates built by parallel workers can be
+    combined with :meth:`merge`.
+
+    Example:
+        >>> aggregator = ErrorAggregator()
+        >>> for doc_id, resume in corpus:
+        ...     aggregator.add(doc_id, validator.validate(resume))
+        >>> aggregator.write_json(sys.stdout)
+    """
+
+    def __init__(
+        self,
+        max_groups: int = 10000,
+        samples_per_group: int = 5,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an empty aggregate.
+
+        Args:
+            max_groups: Maximum number of error groups kept in memory
+            samples_per_group: Number of sample document IDs kept per group
+            seed: Optional seed for the sampling random generator
+        """
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1")
+        if samples_per_group < 0:
+            raise ValueError("samples_per_group must not be negative")
+        self.max_groups = max_groups
+        self.samples_per_group = samples_per_group
+        self.documents = 0
+        self.invalid_documents = 0
+        self.errors = 0
+        self._groups: Dict[GroupKey, _ErrorGroup] = {}
+        # One (documents, tiebreak, key) entry per group. Counts only grow, so
+        # an entry is a lower bound and is refreshed when it reaches the top.
+        self._heap: List[Tuple[int, int, GroupKey]] = []
+        self._tiebreak = itertools.count()
+        self._random = random.Random(seed)
+
+    def add(self, doc_id: Any, result: Dict[str, Any]) -> None:
+        """
+        Add one validation result to the aggregate.
+
+        Args:
+            doc_id: Identifier of the document (file path, row ID, ...)
+            result: Dictionary returned by ``ResumeValidator.validate``
+        """
+        self.documents += 1
+        errors = result.get("errors") or []
+        if not errors:
+            return
+        self.invalid_documents += 1
+        self.errors += len(errors)
+
+        seen = set()
+        for error in errors:
+            key = (
+                error.get("schema_path", ""),
+                str(error.get("validator", "")),
+                normalize_path(error.get("path", "")),
+            )
+            group = self._group(key)
+            group.errors += 1
+            if group.message is None:
+                group.message = error.get("message")
+            if key not in seen:
+                seen.add(key)
+                group.documents += 1
+                self._sample(group, doc_id)
+
+    def add_many(self, results: Iterable[Tuple[Any, Dict[str, Any]]]) -> "ErrorAggregator":
+        """
+        Add ``(doc_id, result)`` pairs from an iterable.
+
+        Returns:
+            The aggregator itself, to allow chaining
+        """
+        for doc_id, result in results:
+            self.add(doc_id, result)
+        return self
+
+    def _group(self, key: GroupKey) -> _ErrorGroup:
+        """Return the group for ``key``, evicting the rarest one if full."""
+        group = self._groups.get(key)
+        if group is not None:
+            return group
+        overestimate = 0
+        if len(self._groups) >= self.max_groups:
+            overestimate = self._groups.pop(self._rarest()).documents
+        group = _ErrorGroup(overestimate)
+        self._groups[key] = group
+        heapq.heappush(self._heap, (overestimate, next(self._tiebreak), key))
+        return group
+
+    def _rarest(self) -> GroupKey:
+        """Pop the key of the group with the fewest documents off the heap."""
+        heap = self._heap
+        while True:
+            documents, _, key = heap[0]
+            current = self._groups[key].documents
+            if current == documents:
+                heapq.heappop(heap)
+                return key
+            heapq.heapreplace(heap, (current, next(self._tiebreak), key))
+
+    def _sample(self, group: _ErrorGroup, doc_id: Any) -> None:
+        """Reservoir-sample ``doc_id`` into the group (Algorithm R)."""
+        if self.samples_per_group == 0:
+            return
+        if len(group.samples) < self.samples_per_group:
+            group.samples.append(doc_id)
+            return
+        slot = self._random.randrange(group.documents)
+        if slot < self.samples_per_group:
+            group.samples[slot] = doc_id
+
+    def merge(self, other: "ErrorAggregator") -> "ErrorAggregator":
+        """
+        Merge a partial aggregate (e.g. from another worker) into this one.
+
+        Samples are combined so that each document keeps the same
+        probability of being retained as in a single-pass aggregate.
+
+        Args:
+            other: Aggregate to merge; it is left unchanged
+
+        Returns:
+            The aggregator itself, to allow chaining
+        """
+        self.documents += other.documents
+        self.invalid_documents += other.invalid_documents
+        self.errors += other.errors
+
+        for key, theirs in other._groups.items():
+            ours = self._groups.get(key)
+            if ours is None:
+                ours = self._group(key)
+                ours.samples = list(theirs.samples[: self.samples_per_group])
+            else:
+                ours.samples = self._merge_samples(
+                    ours.samples, ours.documents, theirs.samples, theirs.documents
+                )
+            ours.errors += theirs.errors
+            ours.documents += theirs.documents
+            ours.overestimate += theirs.overestimate
+            if ours.message is None:
+                ours.message = theirs.message
+        return self
+
+    def _merge_samples(
+        self, left: List[Any], left_weight: int, right: List[Any], right_weight: int
+    ) -> List[Any]:
+        """Draw a combined sample proportionally to both populations."""
+        left, right = list(left), list(right)
+        self._random.shuffle(left)
+        self._random.shuffle(right)
+        merged: List[Any] = []
+        while len(merged) < self.samples_per_group and (left or right):
+            total = left_weight + right_weight
+            if right and (not left or self._random.randrange(max(total, 1)) >= left_weight):
+                merged.append(right.pop())
+                right_weight = max(right_weight - 1, 0)
+            else:
+                merged.append(left.pop())
+                left_weight = max(left_weight - 1, 0)
+        return merged
+
+    def top(self, k: Optional[int] = None, by: str = "documents") -> List[Dict[str, Any]]:
+        """
+        Return the most frequent error groups.
+
+        Args:
+            k: Number of groups to return (all groups if omitted)
+            by: Sort key, either ``"documents"`` or ``"errors"``
+
+        Returns:
+            List of group dictionaries sorted by descending count
+        """
+        if by not in ("documents", "errors"):
+            raise ValueError("by must be 'documents' or 'errors'")
+        rows: List[Dict[str, Any]] = [
+            {
+                "schema_path": key[0],
+                "validator": key[1],
+                "path": key[2],
+                "documents": group.documents,
+                "errors": group.errors,
+                "overestimate": group.overestimate,
+                "message": group.message,
+                "samples": list(group.samples),
+            }
+            for key, group in self._groups.items()
+        ]
+        rows.sort(key=lambda row: (-row[by], row["schema_path"], row["path"]))
+        return rows if k is None else rows[:k]
+
+    def summary(self, k: Optional[int] = None) -> Dict[str, Any]:
+        """Return the whole aggregate as a JSON-serializable dictionary."""
+        return {
+            "documents": self.documents,
+            "invalid_documents": self.invalid_documents,
+            "errors": self.errors,
+            "groups": self.top(k),
+        }
+
+    def write_json(self, fp: IO[str], k: Optional[int] = None) -> None:
+        """Write the aggregate report as JSON."""
+        json.dump(self.summary(k), fp, indent=2, default=str)
+        fp.write("\n")
+
+    def write_csv(self, fp: IO[str], k: Optional[int] = None) -> None:
+        """Write one CSV row per error group."""
+        fields = [
+            "schema_path",
+            "validator",
+            "path",
+            "documents",
+            "errors",
+            "overestimate",
+            "message",
+            "samples",
+        ]
+        writer = csv.DictWriter(fp, fieldnames=fields)
+        writer.writeheader()
+        for row in self.top(k):
+            row["samples"] = " ".join(str(s) for s in row["samples"])
+            writer.writerow(row)
+
+    def write_html(self, fp: IO[str], k: Optional[int] = None) -> None:
+        """Write a standalone HTML report."""
+        import html
+
+        esc = html.escape
+        fp.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">")
+        fp.write("<title>Schema Resume validation report</title></head><body>\n")
+        fp.write("<h1>Schema Resume validation report</h1>\n")
+        fp.write(
+            f"<p>{self.documents} documents, {self.invalid_documents} invalid, "
+            f"{self.errors} errors</p>\n"
+        )
+        fp.write(
+            "<table border=\"1\"><thead><tr><th>Schema path</th><th>Validator</th>"
+            "<th>Path</th><th>Documents</th><th>Errors</th><th>Message</th>"
+            "<th>Samples</th></tr></thead><tbody>\n"
+        )
+        for row in self.top(k):
+            samples = ", ".join(esc(str(s)) for s in row["samples"])
+            fp.write(
+                f"<tr><td>{esc(row['schema_path'])}</td><td>{esc(row['validator'])}</td>"
+                f"<td>{esc(row['path'])}</td><td>{row['documents']}</td>"
+                f"<td>{row['errors']}</td><td>{esc(str(row['message'] or ''))}</td>"
+                f"<td>{samples}</td></tr>\n"
+            )
+        fp.write("</tbody></table>\n</body></html>\n")
+
+
+def aggregate_results(
+    results: Iterable[Tuple[Any, Dict[str, Any]]], **kwargs: Any
+) -> ErrorAggregator:
+    """
+    Aggregate an iterable of ``(doc_id, result)`` pairs.
+
+    Args:
+        results: Pairs of document identifier and validation result
+        **kwargs: Passed to :class:`ErrorAggregator`
+
+    Returns:
+        The populated aggregator
+    """
+    return ErrorAggregator(**kwargs).add_many(results)
@@ -0,0 +1,228 @@
+"""Dereferenced, minified and content-hashed schema bundles."""
+
+import copy
+import hashlib
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .exceptions import SchemaError
+
+BUNDLE_FORMAT = 1
+
+# Hex digits of the content hash in bundle file names, and the shortest
+# accepted ``expected_hash`` pin.
+HASH_PREFIX_LENGTH = 12
+
+# Keywords that only document the schema and never affect validation.
+ANNOTATIONS = frozenset(["description", "$comment", "title", "examples", "default"])
+
+# Keywords whose values are instance data rather than subschemas.
+DATA_KEYWORDS = frozenset(["enum", "const"])
+
+# Keywords whose values map arbitrary names to subschemas.
+SCHEMA_MAPS = frozenset(["properties", "patternProperties", "definitions", "dependencies"])
+
+# Root keywords kept even when annotations are stripped.
+ROOT_KEYS = frozenset(["$schema", "$id", "version", "title"])
+
+
+def resolve_pointer(root: Dict[str, Any], ref: str) -> Any:
+    """
+    Resolve a local JSON pointer such as ``#/definitions/iso8601``.
+
+    Raises:
+        SchemaError: If the pointer does not resolve
+    """
+    target: Any = root
+    for part in ref[2:].split("/"):
+        part = part.replace("~1", "/").replace("~0", "~")
+        if isinstance(target, list):
+            target = target[int(part)]
+        elif isinstance(target, dict) and part in target:
+            target = target[part]
+        else:
+            raise SchemaError(f"Unresolvable $ref: {ref}")
+    return target
+
+
+def dereference(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Inline every local ``$ref`` of a schema.
+
+    Recursive references are left in place (together with the definitions
+    they point to); all other ``definitions`` are dropped once inlined.
+
+    Args:
+        schema: Schema to dereference; it is not modified
+
+    Returns:
+        A new, dereferenced schema
+
+    Raises:
+        SchemaError: If a local reference cannot be resolved
+    """
+    kept: List[str] = []
+
+    def walk(node: Any, active: tuple) -> Any:
+        if isinstance(node, list):
+            return [walk(item, active) for item in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/"):
+            if ref in active:
+                kept.append(ref)
+                return dict(node)
+            # Draft 7 ignores keywords next to $ref, so the target replaces the node
+            return walk(resolve_pointer(schema, ref), active + (ref,))
+        return {key: walk(value, active) for key, value in node.items()}
+
+    result = {key: walk(value, ()) for key, value in schema.items() if key != "definitions"}
+    if kept and "definitions" in schema:
+        result["definitions"] = copy.deepcopy(schema["definitions"])
+    return result
+
+
+def minify(schema: Any, strip_annotations: bool = True) -> Any:
+    """
+    Remove annotation keywords that do not affect validation.
+
+    Args:
+        schema: Schema to minify
+        strip_annotations: Drop ``description``, ``$comment``, ``title``,
+                           ``examples`` and ``default`` (the root keeps its
+                           ``title``)
+
+    Returns:
+        A new schema without annotations
+    """
+
+    def walk(node: Any, root: bool) -> Any:
+        if isinstance(node, list):
+            return [walk(item, False) for item in node]
+        if not isinstance(node, dict):
+            return node
+        result = {}
+        for key, value in node.items():
+            if strip_annotations and key in ANNOTATIONS and not (root and key in ROOT_KEYS):
+                continue
+            if key in DATA_KEYWORDS:
+                result[key] = value
+            elif key in SCHEMA_MAPS and isinstance(value, dict):
+                # Keys are property names (which may well be "description")
+                result[key] = {name: walk(sub, False) for name, sub in value.items()}
+            else:
+                result[key] = walk(value, False)
+        return result
+
+    return walk(schema, True)
+
+
+def bundle_schema(schema: Dict[str, Any], strip_annotations: bool = True) -> bytes:
+    """
+    Build the canonical bundle of a schema.
+
+    Args:
+        schema: Source schema with ``$ref`` into ``definitions``
+        strip_annotations: Drop annotation keywords
+
+    Returns:
+        Compact UTF-8 JSON of the dereferenced, minified schema
+    """
+    bundled = minify(dereference(schema), strip_annotations)
+    return json.dumps(bundled, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of bundle bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_bundle(
+    schema_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    compiled: bool = True,
+    strip_annotations: bool = True,
+) -> Dict[str, Path]:
+    """
+    Write the bundle artifacts for a schema file.
+
+    Produces ``schema.<hash>.min.json`` and, with ``compiled``,
+    ``schema.<hash>.pickle`` which :meth:`ResumeValidator.from_bundle`
+    loads without JSON decoding. ``<hash>`` is the first 12 hex digits
+    of the SHA-256 of the artifact's own bytes, so each artifact can be
+    verified before it is decoded.
+
+    Args:
+        schema_path: Source schema file
+        output_dir: Directory to write the artifacts to
+        compiled: Also write the pickled form
+        strip_annotations: Drop annotation keywords
+
+    Returns:
+        Dictionary with the written ``json`` (and ``pickle``) paths
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    data = bundle_schema(schema, strip_annotations)
+    digest = content_hash(data)
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    written = {"json": output / f"schema.{digest[:HASH_PREFIX_LENGTH]}.min.json"}
+    written["json"].write_bytes(data)
+
+    if compiled:
+        payload = {
+            "format": BUNDLE_FORMAT,
+            "sha256": digest,
+            "schema": json.loads(data),
+        }
+        pickled = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle_digest = content_hash(pickled)[:HASH_PREFIX_LENGTH]
+        written["pickle"] = output / f"schema.{pickle_digest}.pickle"
+        written["pickle"].write_bytes(pickled)
+    return written
+
+
+def load_bundle(path: Union[str, Path], expected_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load a bundle artifact written by :func:`write_bundle`.
+
+    The file's SHA-256 is checked against ``expected_hash`` before it is
+    decoded, so a pickled bundle whose hash is pinned is never unpickled
+    if it was modified. Without ``expected_hash``, only load pickled
+    bundles from trusted locations: unpickling runs code.
+
+    Args:
+        path: ``.min.json`` or ``.pickle`` bundle file
+        expected_hash: Optional SHA-256 of the file's bytes, or a prefix of
+                       at least 12 hex digits as in its name
+
+    Returns:
+        The dereferenced schema
+
+    Raises:
+        SchemaError: If the bundle is malformed or its hash does not match
+        ValueError: If ``expected_hash`` is shorter than 12 hex digits
+    """
+    if expected_hash is not None and len(expected_hash) < HASH_PREFIX_LENGTH:
+        raise ValueError(
+            f"expected_hash must have at least {HASH_PREFIX_LENGTH} hex digits: "
+            f"{expected_hash!r}"
+        )
+    path = Path(path)
+    data = path.read_bytes()
+    if expected_hash is not None and not content_hash(data).startswith(expected_hash.lower()):
+        raise SchemaError(f"Schema bundle hash mismatch: {path}")
+
+    if path.suffix != ".pickle":
+        schema: Dict[str, Any] = json.loads(data)
+        return schema
+    payload = pickle.loads(data)
+    if not isinstance(payload, dict) or payload.get("format") != BUNDLE_FORMAT:
+        raise SchemaError(f"Unsupported schema bundle format: {path}")
+    schema = payload["schema"]
+    return schema
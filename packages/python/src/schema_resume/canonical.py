@@ -0,0 +1,170 @@
+"""Schema-driven canonical form of resumes.
+
+Two copies of the same resume often differ only in key order, whitespace,
+date precision or the spelling of URLs. :class:`Canonicalizer` walks a
+document alongside ``schema.json`` and rewrites values according to their
+declared types and formats:
+
+- strings are NFC-normalized, stripped and inner whitespace is collapsed;
+- ``format: uri`` values get a lower-case scheme and host, ``https`` instead
+  of ``http``, no ``www.`` prefix, default port, fragment or trailing slash;
+- ``format: email`` values are lower-cased;
+- ``iso8601`` dates are truncated to ``date_precision`` (``year``,
+  ``month`` or ``day``);
+- ``number`` values that are whole become integers (``3.0`` -> ``3``).
+
+Properties the schema does not describe only get the generic string
+treatment. :meth:`Canonicalizer.canonical_bytes` serializes the result with
+sorted keys and no insignificant whitespace, so equal resumes produce equal
+bytes and equal :meth:`Canonicalizer.canonical_hash` digests.
+"""
+
+import hashlib
+import json
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from .bundle import resolve_pointer
+
+DATE_PRECISIONS = {"year": 4, "month": 7, "day": 10}
+DATE_REF = "#/definitions/iso8601"
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+# Plan nodes: (kind, payload)
+_TEXT = ("text", None)
+Plan = Tuple[str, Any]
+
+
+def _compile(schema: Dict[str, Any], node: Any, active: tuple = ()) -> Plan:
+    """Compile a schema node into a canonicalization plan."""
+    if not isinstance(node, dict):
+        return _TEXT
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#/"):
+        if ref == DATE_REF:
+            return ("date", None)
+        if ref in active:
+            return _TEXT
+        return _compile(schema, resolve_pointer(schema, ref), active + (ref,))
+
+    kind = node.get("type")
+    if kind == "object" or "properties" in node:
+        properties = node.get("properties") or {}
+        return (
+            "object",
+            {name: _compile(schema, sub, active) for name, sub in properties.items()},
+        )
+    if kind == "array" or "items" in node:
+        items = node.get("items")
+        return ("array", _compile(schema, items, active) if isinstance(items, dict) else _TEXT)
+    if kind == "number":
+        return ("number", None)
+    if kind == "string":
+        fmt = node.get("format")
+        if fmt == "uri":
+            return ("uri", None)
+        if fmt == "email":
+            return ("email", None)
+    return _TEXT
+
+
+def normalize_text(value: str) -> str:
+    """NFC-normalize a string, strip it and collapse inner whitespace."""
+    return " ".join(unicodedata.normalize("NFC", value).split())
+
+
+def normalize_uri(value: str) -> str:
+    """
+    Normalize the spelling of a URL.
+
+    ``HTTP://www.Example.com:80/path/#top`` becomes
+    ``https://example.com/path``. Values that do not parse as absolute
+    ``http``/``https`` URLs are only stripped.
+    """
+    value = value.strip()
+    try:
+        parts = urlsplit(value)
+        port = parts.port
+    except ValueError:
+        return value
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return value
+
+    host = parts.hostname
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and str(port) != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    if parts.username:
+        host = f"{parts.username}{':' + parts.password if parts.password else ''}@{host}"
+    return urlunsplit(("https", host, parts.path.rstrip("/"), parts.query, ""))
+
+
+def dump_canonical(value: Any) -> bytes:
+    """Serialize an already canonical value with sorted keys as compact UTF-8 JSON."""
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+class Canonicalizer:
+    """Rewrites resumes into their canonical form."""
+
+    def __init__(
+        self, schema: Optional[Dict[str, Any]] = None, date_precision: str = "month"
+    ) -> None:
+        """
+        Args:
+            schema: Schema describing the documents (default: the bundled
+                    ``schema.json``)
+            date_precision: Precision dates are truncated to: ``year``,
+                            ``month`` or ``day``
+        """
+        if schema is None:
+            schema_path = Path(__file__).parent / "schemas" / "schema.json"
+            with open(schema_path, "r", encoding="utf-8") as f:
+                schema = json.load(f)
+        self.date_length = DATE_PRECISIONS[date_precision]
+        self.plan = _compile(schema, schema)
+
+    def canonicalize(self, document: Any) -> Any:
+        """
+        Return the canonical form of a document; the input is not modified.
+        """
+        return self._walk(document, self.plan)
+
+    def _walk(self, value: Any, plan: Plan) -> Any:
+        kind, payload = plan
+        value_type = type(value)
+        if value_type is dict:
+            properties = payload if kind == "object" else {}
+            return {
+                key: self._walk(item, properties.get(key, _TEXT)) for key, item in value.items()
+            }
+        if value_type is list:
+            items = payload if kind == "array" else _TEXT
+            return [self._walk(item, items) for item in value]
+        if value_type is str:
+            if kind == "uri":
+                return normalize_uri(value)
+            text = normalize_text(value)
+            if kind == "email":
+                return text.lower()
+            if kind == "date":
+                return text[: self.date_length]
+            return text
+        if value_type is float and kind == "number" and value.is_integer():
+            return int(value)
+        return value
+
+    def canonical_bytes(self, document: Any) -> bytes:
+        """Serialize the canonical form with sorted keys as compact UTF-8 JSON."""
+        return dump_canonical(self.canonicalize(document))
+
+    def canonical_hash(self, document: Any) -> str:
+        """Return the SHA-256 hex digest of :meth:`canonical_bytes`."""
+        return hashlib.sha256(self.canonical_bytes(document)).hexdigest()
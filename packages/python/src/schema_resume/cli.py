@@ -0,0 +1,391 @@
+"""Command-line interface for schema-resume-validator."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+
+
+def _cmd_scan(args: argparse.Namespace) -> int:
+    """Run ``schema-resume scan``."""
+    from .aggregate import ErrorAggregator
+    from .scan import DEFAULT_PATTERNS, print_progress, scan_directory
+
+    aggregator = ErrorAggregator() if args.report else None
+    stats = scan_directory(
+        args.directory,
+        checkpoint=args.checkpoint,
+        workers=args.workers,
+        patterns=args.pattern or DEFAULT_PATTERNS,
+        use_hash=args.hash,
+        schema_path=args.schema,
+        aggregator=aggregator,
+        progress=None if args.quiet else print_progress,
+    )
+    if not args.quiet:
+        sys.stderr.write("\n")
+    json.dump(stats.as_dict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    if aggregator is not None:
+        writer = {
+            "json": aggregator.write_json,
+            "csv": aggregator.write_csv,
+            "html": aggregator.write_html,
+        }[args.report_format]
+        with open(args.report, "w", encoding="utf-8", newline="") as f:
+            writer(f)
+    return 1 if stats.failed else 0
+
+
+def _cmd_bundle(args: argparse.Namespace) -> int:
+    """Run ``schema-resume bundle``."""
+    from .bundle import write_bundle
+
+    schema = args.schema or Path(__file__).parent / "schemas" / "schema.json"
+    written = write_bundle(
+        schema,
+        args.output,
+        compiled=not args.no_pickle,
+        strip_annotations=not args.keep_annotations,
+    )
+    for path in written.values():
+        print(path)
+    return 0
+
+
+def _cmd_lint(args: argparse.Namespace) -> int:
+    """Run ``schema-resume lint``."""
+    from .lint import LintEngine, format_report
+
+    engine = LintEngine(args.root, use_cache=not args.no_cache)
+    report = engine.run()
+    if args.json:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        print(format_report(report, verbose=args.verbose))
+    return 1 if report["errors"] else 0
+
+
+def _cmd_test(args: argparse.Namespace) -> int:
+    """Run ``schema-resume test``."""
+    from .fixtures import discover_fixtures, format_results, run_fixtures
+
+    fixtures = discover_fixtures(args.paths)
+    if not fixtures:
+        sys.stderr.write("no valid-* or invalid-* fixtures found\n")
+        return 1
+    results = run_fixtures(fixtures, workers=args.workers, schema_path=args.schema)
+    print(format_results(results, slowest=args.slowest))
+    return 0 if all(result["passed"] for result in results) else 1
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    """Run ``schema-resume export``."""
+    from .export import export_files
+    from .scan import iter_files
+
+    paths: List[str] = []
+    for path in args.paths:
+        if path.is_dir():
+            paths.extend(entry[0] for entry in iter_files(path, ("*.json",)))
+        else:
+            paths.append(str(path))
+    totals = export_files(
+        paths, args.output, fmt=args.format, workers=args.workers, batch_size=args.batch_size
+    )
+    json.dump(totals, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def _cmd_dedup(args: argparse.Namespace) -> int:
+    """Run ``schema-resume dedup``."""
+    from .dedup import dedup_files
+    from .scan import iter_files
+
+    paths: List[str] = []
+    for path in args.paths:
+        if path.is_dir():
+            paths.extend(sorted(entry[0] for entry in iter_files(path, ("*.json",))))
+        else:
+            paths.append(str(path))
+    for record in dedup_files(
+        paths, workers=args.workers, threshold=args.threshold, date_precision=args.date_precision
+    ):
+        if not args.unique:
+            print(json.dumps(record))
+        elif "error" not in record and not (
+            record["duplicate_of"] or record["near_duplicate_of"]
+        ):
+            print(record["path"])
+    return 0
+
+
+def _cmd_sample(args: argparse.Namespace) -> int:
+    """Run ``schema-resume sample``."""
+    from .sampling import format_report, sample_corpus
+
+    def progress(report: Dict[str, Any]) -> None:
+        low, high = report["interval"]
+        sys.stderr.write(
+            f"\r{report['sampled']} sampled, failure rate {report['failure_rate'] * 100:.2f}% "
+            f"[{low * 100:.2f}%, {high * 100:.2f}%]"
+        )
+        sys.stderr.flush()
+
+    report = sample_corpus(
+        args.source,
+        precision=args.precision,
+        confidence=args.confidence,
+        max_seconds=args.max_seconds,
+        max_samples=args.max_samples,
+        stratify=args.stratify,
+        workers=args.workers,
+        schema_path=args.schema,
+        seed=args.seed,
+        progress=None if args.quiet else progress,
+    )
+    if not args.quiet:
+        sys.stderr.write("\n")
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_report(report))
+    return 0
+
+
+def _cmd_db(args: argparse.Namespace) -> int:
+    """Run ``schema-resume db``."""
+    from .connector import SQLiteConnector, print_progress
+
+    with SQLiteConnector(
+        args.database,
+        status_table=args.status_table,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        schema_path=args.schema,
+    ) as connector:
+        progress = None if args.quiet else print_progress
+        if args.query:
+            stats = connector.validate_query(args.query, progress=progress)
+        else:
+            where = connector.pending_condition(args.id_column) if args.pending else None
+            stats = connector.validate_table(
+                args.table, args.id_column, args.json_column, where=where, progress=progress
+            )
+    if not args.quiet:
+        sys.stderr.write("\n")
+    json.dump(stats.as_dict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if stats.invalid else 0
+
+
+def _cmd_watch(args: argparse.Namespace) -> int:
+    """Run ``schema-resume watch``."""
+    from .watch import WatchSession, format_cycle
+
+    session = WatchSession(args.root, args.fixtures, use_cache=not args.no_cache)
+    try:
+        session.watch(
+            lambda report: print(format_cycle(report, verbose=args.verbose), flush=True),
+            interval=args.interval,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_diff(args: argparse.Namespace) -> int:
+    """Run ``schema-resume diff``."""
+    from .differential import DiffSummary, diff_corpus
+
+    summary = DiffSummary()
+    for record in diff_corpus(
+        args.sources,
+        old_schema=args.old_schema,
+        new_schema=args.new_schema,
+        workers=args.workers,
+        summary=summary,
+    ):
+        if args.status_only and record["change"] == "changed":
+            continue
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    json.dump(summary.as_dict(), sys.stderr, indent=2)
+    sys.stderr.write("\n")
+    return 1 if summary.newly_invalid else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``schema-resume`` command."""
+    parser = argparse.ArgumentParser(
+        prog="schema-resume", description="Schema Resume validation tools"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    scan = commands.add_parser("scan", help="validate every resume file in a directory tree")
+    scan.add_argument("directory", type=Path, help="directory to scan")
+    scan.add_argument("--checkpoint", type=Path, help="SQLite checkpoint file")
+    scan.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    scan.add_argument(
+        "--pattern", action="append", help="file name glob (repeatable, default *.json and *.xml)"
+    )
+    scan.add_argument(
+        "--hash", action="store_true", help="skip files whose content hash is unchanged"
+    )
+    scan.add_argument("--schema", type=Path, help="custom schema file")
+    scan.add_argument("--report", type=Path, help="write an aggregated error report")
+    scan.add_argument(
+        "--report-format", choices=("json", "csv", "html"), default="json", help="report format"
+    )
+    scan.add_argument("-q", "--quiet", action="store_true", help="do not print progress")
+    scan.set_defaults(func=_cmd_scan)
+
+    bundle = commands.add_parser(
+        "bundle", help="write a dereferenced, minified, content-hashed schema bundle"
+    )
+    bundle.add_argument(
+        "schema", type=Path, nargs="?", help="schema file (default: the bundled schema.json)"
+    )
+    bundle.add_argument("-o", "--output", type=Path, default=Path("."), help="output directory")
+    bundle.add_argument("--no-pickle", action="store_true", help="do not write the pickled form")
+    bundle.add_argument(
+        "--keep-annotations", action="store_true", help="keep descriptions and comments"
+    )
+    bundle.set_defaults(func=_cmd_bundle)
+
+    lint = commands.add_parser(
+        "lint", help="lint and cross-check all schema files and package copies of a repository"
+    )
+    lint.add_argument("root", type=Path, nargs="?", default=Path("."), help="repository root")
+    lint.add_argument("--no-cache", action="store_true", help="ignore and do not write the cache")
+    lint.add_argument("--json", action="store_true", help="print the report as JSON")
+    lint.add_argument(
+        "-v", "--verbose", action="store_true", help="also show informational findings"
+    )
+    lint.set_defaults(func=_cmd_lint)
+
+    test = commands.add_parser("test", help="run valid-*/invalid-* fixture corpora")
+    test.add_argument("paths", type=Path, nargs="+", help="fixture files or directories")
+    test.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    test.add_argument("--schema", type=Path, help="custom schema file")
+    test.add_argument(
+        "--slowest", type=int, default=5, help="number of slowest fixtures to list (0 to disable)"
+    )
+    test.set_defaults(func=_cmd_test)
+
+    export = commands.add_parser("export", help="export valid resumes into analytics tables")
+    export.add_argument("output", type=Path, help="output directory")
+    export.add_argument("paths", type=Path, nargs="+", help="JSON files or directories")
+    export.add_argument(
+        "--format",
+        choices=("auto", "parquet", "sqlite", "csv"),
+        default="auto",
+        help="output format",
+    )
+    export.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    export.add_argument("--batch-size", type=int, default=10000, help="rows per written batch")
+    export.set_defaults(func=_cmd_export)
+
+    dedup = commands.add_parser("dedup", help="find exact and near-duplicate resumes")
+    dedup.add_argument("paths", type=Path, nargs="+", help="JSON files or directories")
+    dedup.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    dedup.add_argument(
+        "--threshold", type=float, default=0.8, help="minimum similarity of near duplicates"
+    )
+    dedup.add_argument(
+        "--date-precision", choices=("year", "month", "day"), default="month",
+        help="precision dates are compared at",
+    )
+    dedup.add_argument(
+        "--unique", action="store_true", help="only print the paths of distinct resumes"
+    )
+    dedup.set_defaults(func=_cmd_dedup)
+
+    sample = commands.add_parser(
+        "sample", help="estimate the failure rate of a corpus from a stratified sample"
+    )
+    sample.add_argument("source", type=Path, help="directory, NDJSON file or resume file")
+    sample.add_argument(
+        "--precision", type=float, default=0.01, help="target half-width of the interval"
+    )
+    sample.add_argument("--confidence", type=float, default=0.95, help="confidence level")
+    sample.add_argument("--max-seconds", type=float, help="time budget")
+    sample.add_argument("--max-samples", type=int, help="maximum number of resumes to validate")
+    sample.add_argument(
+        "--stratify", choices=("size", "directory", "none"), default="size", help="strata"
+    )
+    sample.add_argument("-j", "--workers", type=int, default=1, help="number of worker processes")
+    sample.add_argument("--schema", type=Path, help="custom schema file")
+    sample.add_argument("--seed", type=int, help="random seed")
+    sample.add_argument("--json", action="store_true", help="print the report as JSON")
+    sample.add_argument("-q", "--quiet", action="store_true", help="do not print progress")
+    sample.set_defaults(func=_cmd_sample)
+
+    db = commands.add_parser("db", help="validate resumes stored as JSON in a SQLite database")
+    db.add_argument("database", type=Path, help="SQLite database file")
+    source = db.add_mutually_exclusive_group(required=True)
+    source.add_argument("--table", help="table holding the resumes")
+    source.add_argument("--query", help="SQL query returning (id, JSON document) rows")
+    db.add_argument("--id-column", default="id", help="id column of --table")
+    db.add_argument("--json-column", default="resume", help="JSON column of --table")
+    db.add_argument(
+        "--pending", action="store_true", help="only rows of --table without a status row"
+    )
+    db.add_argument(
+        "--status-table", default="resume_validation", help="table results are written to"
+    )
+    db.add_argument("--batch-size", type=int, default=500, help="rows per fetch and transaction")
+    db.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    db.add_argument("--schema", type=Path, help="custom schema file")
+    db.add_argument("-q", "--quiet", action="store_true", help="do not print progress")
+    db.set_defaults(func=_cmd_db)
+
+    watch = commands.add_parser(
+        "watch", help="re-lint schemas and re-run fixtures whenever a file changes"
+    )
+    watch.add_argument("root", type=Path, nargs="?", default=Path("."), help="repository root")
+    watch.add_argument(
+        "--fixtures", type=Path, nargs="+", default=[], help="fixture files or directories"
+    )
+    watch.add_argument("--interval", type=float, default=0.25, help="seconds between polls")
+    watch.add_argument("--no-cache", action="store_true", help="ignore and do not write the cache")
+    watch.add_argument(
+        "-v", "--verbose", action="store_true", help="also show informational findings"
+    )
+    watch.set_defaults(func=_cmd_watch)
+
+    diff = commands.add_parser(
+        "diff", help="list resumes whose validation result differs between two schemas"
+    )
+    diff.add_argument("old_schema", type=Path, help="old schema file")
+    diff.add_argument("new_schema", type=Path, help="new schema file")
+    diff.add_argument(
+        "sources", type=Path, nargs="+", help="JSON files, directories or NDJSON files"
+    )
+    diff.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    diff.add_argument(
+        "--status-only",
+        action="store_true",
+        help="only list resumes that became valid or invalid",
+    )
+    diff.set_defaults(func=_cmd_diff)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``schema-resume`` command."""
+    args = build_parser().parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""Bulk validation of resumes stored as JSON text in a SQL database.
+
+:class:`BulkConnector` works with any DB-API 2.0 connection. It runs a query
+whose first two columns are a resume id and its JSON document and streams
+the rows with ``cursor.fetchmany``. Each batch is handed to a pool of worker
+processes that decode and validate it while the next batch is fetched.
+Results are written to a status table, one transaction per batch::
+
+    resume_id | valid | error_count | errors (JSON) | validated_at
+
+:class:`SQLiteConnector` is the built-in implementation for SQLite
+databases; other databases only need a subclass overriding
+:attr:`BulkConnector.placeholder` and, where the generic DDL or upsert does
+not fit, :meth:`BulkConnector.create_status_table` and
+:meth:`BulkConnector.write_status`.
+"""
+
+import collections
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from .validator import ResumeValidator, error_entry
+from .workers import WorkerPool, make_validators, worker_state
+
+DEFAULT_STATUS_TABLE = "resume_validation"
+
+# (resume_id, valid, error_count, errors as JSON, validated_at)
+StatusRow = Tuple[Any, int, int, str, float]
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+
+def _identifier(name: str) -> str:
+    """Return ``name`` if it is a plain (optionally schema-qualified) SQL identifier."""
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def validate_document(validator: ResumeValidator, document: Any) -> Dict[str, Any]:
+    """
+    Decode and validate one JSON column value.
+
+    Args:
+        validator: Validator to use
+        document: Column value: JSON text, bytes, or NULL
+
+    Returns:
+        Dictionary with ``valid`` and ``errors``
+    """
+    if document is None:
+        return {"valid": False, "errors": [error_entry("Document is NULL", "json")]}
+    if isinstance(document, str):
+        # Never let the validator treat the text as a file path
+        document = document.encode("utf-8")
+    elif isinstance(document, memoryview):
+        document = document.tobytes()
+    try:
+        return validator.validate(document)
+    except ValueError as exc:
+        return {"valid": False, "errors": [error_entry(f"Invalid JSON: {exc}", "json")]}
+
+
+def _validate_batch(rows: Sequence[Sequence[Any]]) -> List[StatusRow]:
+    """Worker entry point: validate a batch of ``(id, document)`` rows."""
+    (validator,) = worker_state()
+    now = time.time()
+    status = []
+    for row in rows:
+        result = validate_document(validator, row[1])
+        errors = result["errors"]
+        status.append(
+            (row[0], 1 if result["valid"] else 0, len(errors), json.dumps(errors, default=str), now)
+        )
+    return status
+
+
+class BulkStats:
+    """Counters and throughput of a bulk validation run."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.valid = 0
+        self.invalid = 0
+        self.batches = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows validated per second."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "rows": self.rows,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class BulkConnector:
+    """Validates the JSON column of a query over a DB-API 2.0 connection."""
+
+    #: Parameter marker of the driver (``?`` for qmark, ``%s`` for format)
+    placeholder = "?"
+
+    def __init__(
+        self,
+        connection: Any,
+        status_table: str = DEFAULT_STATUS_TABLE,
+        batch_size: int = 500,
+        workers: Optional[int] = None,
+        schema_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            connection: Open DB-API 2.0 connection
+            status_table: Table validation results are written to
+            batch_size: Rows per ``fetchmany`` call, worker task and
+                        status transaction
+            workers: Number of worker processes (default: CPU count, 1
+                     validates in-process)
+            schema_path: Optional custom schema file
+        """
+        self.connection = connection
+        self.status_table = _identifier(status_table)
+        self.batch_size = batch_size
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.schema_path = schema_path
+
+    def create_status_table(self) -> None:
+        """Create the status table if it does not exist."""
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.status_table} ("
+            "resume_id VARCHAR(255) PRIMARY KEY, "
+            "valid INTEGER NOT NULL, "
+            "error_count INTEGER NOT NULL, "
+            "errors TEXT NOT NULL, "
+            "validated_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def write_status(self, rows: Sequence[StatusRow]) -> None:
+        """
+        Replace the status of a batch of resumes in one transaction.
+
+        The generic implementation deletes and re-inserts the rows, which
+        every SQL database supports; subclasses may use a native upsert.
+        """
+        mark = self.placeholder
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(
+                f"DELETE FROM {self.status_table} WHERE resume_id = {mark}",
+                [(row[0],) for row in rows],
+            )
+            cursor.executemany(
+                f"INSERT INTO {self.status_table} VALUES ({mark}, {mark}, {mark}, {mark}, {mark})",
+                rows,
+            )
+        except Exception:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+
+    def validate_query(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+        progress: Optional[Callable[[BulkStats], None]] = None,
+    ) -> BulkStats:
+        """
+        Validate the documents returned by a query.
+
+        While the workers validate, the parent keeps fetching: up to two
+        batches per worker are in flight, and finished batches are written
+        to the status table in query order.
+
+        Args:
+            query: SQL query whose first two columns are the resume id and
+                   the JSON document
+            params: Query parameters
+            progress: Optional callback invoked with the running stats after
+                      every written batch
+
+        Returns:
+            Statistics of the run
+        """
+        stats = BulkStats()
+        self.create_status_table()
+        schema_arg = str(self.schema_path) if self.schema_path else None
+
+        def record(status: List[StatusRow]) -> None:
+            self.write_status(status)
+            stats.batches += 1
+            stats.rows += len(status)
+            valid = sum(row[1] for row in status)
+            stats.valid += valid
+            stats.invalid += len(status) - valid
+            stats.elapsed = time.monotonic() - stats.started
+            if progress is not None:
+                progress(stats)
+
+        # Status writes go through their own cursor on the same connection,
+        # so the query cursor is left open between batches.
+        cursor = self.connection.cursor()
+        try:
+            with WorkerPool(self.workers, make_validators, (schema_arg,)) as pool:
+                cursor.execute(query, tuple(params))
+                pending: Deque[Any] = collections.deque()
+                max_pending = 2 * self.workers
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if rows:
+                        pending.append(pool.submit(_validate_batch, rows))
+                    while pending and (
+                        not rows or len(pending) >= max_pending or pending[0].ready()
+                    ):
+                        record(pending.popleft().get())
+                    if not rows:
+                        break
+        finally:
+            cursor.close()
+
+        stats.elapsed = time.monotonic() - stats.started
+        return stats
+
+    def validate_table(
+        self,
+        table: str,
+        id_column: str = "id",
+        json_column: str = "resume",
+        where: Optional[str] = None,
+        params: Sequence[Any] = (),
+        progress: Optional[Callable[[BulkStats], None]] = None,
+    ) -> BulkStats:
+        """
+        Validate a JSON column of a table.
+
+        Args:
+            table: Table holding the resumes
+            id_column: Column identifying a resume
+            json_column: Column holding the JSON document
+            where: Optional SQL condition selecting the rows
+            params: Parameters of ``where``
+            progress: Optional callback invoked with the running stats
+
+        Returns:
+            Statistics of the run
+        """
+        query = (
+            f"SELECT {_identifier(id_column)}, {_identifier(json_column)} "
+            f"FROM {_identifier(table)}"
+        )
+        if where:
+            query += f" WHERE {where}"
+        return self.validate_query(query, params, progress)
+
+    def pending_condition(self, id_column: str = "id") -> str:
+        """
+        Return a ``where`` condition selecting resumes without a status row.
+
+        Useful to resume an interrupted run with :meth:`validate_table`.
+        """
+        return (
+            f"{_identifier(id_column)} NOT IN "
+            f"(SELECT resume_id FROM {self.status_table})"
+        )
+
+
+class SQLiteConnector(BulkConnector):
+    """Bulk validation of resumes in a SQLite database."""
+
+    def __init__(
+        self,
+        database: Union[str, Path, sqlite3.Connection],
+        status_table: str = DEFAULT_STATUS_TABLE,
+        batch_size: int = 500,
+        workers: Optional[int] = None,
+        schema_path: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            database: SQLite database file or open connection
+            status_table: Table validation results are written to
+            batch_size: Rows per ``fetchmany`` call, worker task and
+                        status transaction
+            workers: Number of worker processes (default: CPU count, 1
+                     validates in-process)
+            schema_path: Optional custom schema file
+        """
+        if isinstance(database, sqlite3.Connection):
+            connection = database
+            self._owned = False
+        else:
+            connection = sqlite3.connect(str(database))
+            self._owned = True
+        super().__init__(connection, status_table, batch_size, workers, schema_path)
+
+    def create_status_table(self) -> None:
+        """Create the status table if it does not exist."""
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.status_table} ("
+                "resume_id PRIMARY KEY, "
+                "valid INTEGER NOT NULL, "
+                "error_count INTEGER NOT NULL, "
+                "errors TEXT NOT NULL, "
+                "validated_at REAL NOT NULL)"
+            )
+
+    def write_status(self, rows: Sequence[StatusRow]) -> None:
+        """Upsert the status of a batch of resumes in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.status_table} VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        """Close the connection if this connector opened it."""
+        if self._owned:
+            self.connection.close()
+
+    def __enter__(self) -> "SQLiteConnector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def print_progress(stats: BulkStats) -> None:
+    """Progress callback writing a one-line status to stderr."""
+    sys.stderr.write(
+        f"\r{stats.rows} rows, {stats.invalid} invalid ({stats.rows_per_second:.0f} rows/s)"
+    )
+    sys.stderr.flush()
@@ -0,0 +1,278 @@
+"""Exact and near-duplicate detection across a resume corpus.
+
+Exact duplicates share a :meth:`Canonicalizer.canonical_hash`. Near
+duplicates are found with MinHash signatures over the content of
+``basics``, ``work`` and ``skills`` and locality-sensitive hashing (LSH):
+
+- short values become tokens such as ``work.name=acme corp``; longer text
+  (summaries, highlights) becomes word 3-shingles;
+- each token is hashed once (64-bit BLAKE2b) and the signature is a
+  one-permutation MinHash: the smallest hash per bin, with empty bins
+  filled from their right neighbour ("densified"), so computing it costs
+  one pass over the tokens;
+- signatures are split into ``bands`` of ``rows`` values; resumes sharing
+  any band are candidates, confirmed by their estimated Jaccard similarity.
+
+:func:`dedup_files` streams a corpus through worker processes that parse,
+canonicalize and sign files, while the parent keeps the hash table and the
+LSH buckets, so each distinct resume needs to be validated and stored once.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .canonical import Canonicalizer, dump_canonical
+from .workers import WorkerPool, worker_state
+
+DEFAULT_SECTIONS = ("basics", "work", "skills")
+DEFAULT_NUM_PERM = 128
+DEFAULT_THRESHOLD = 0.8
+
+# Values with more words than this are shingled instead of kept whole.
+TOKEN_WORDS = 4
+SHINGLE_SIZE = 3
+
+_EMPTY = (1 << 64) - 1
+_MASK = (1 << 64) - 1
+
+
+def _tokens(value: Any, path: str, out: Set[str]) -> None:
+    """Collect the tokens of a canonical subtree."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _tokens(item, f"{path}.{key}", out)
+    elif isinstance(value, list):
+        for item in value:
+            _tokens(item, path, out)
+    elif isinstance(value, str):
+        words = value.casefold().split()
+        if len(words) <= TOKEN_WORDS:
+            if words:
+                out.add(f"{path}={' '.join(words)}")
+        else:
+            for i in range(len(words) - SHINGLE_SIZE + 1):
+                out.add(f"{path}~{' '.join(words[i:i + SHINGLE_SIZE])}")
+    elif value is not None:
+        out.add(f"{path}={json.dumps(value)}")
+
+
+def content_tokens(
+    document: Dict[str, Any], sections: Sequence[str] = DEFAULT_SECTIONS
+) -> Set[str]:
+    """
+    Return the token set compared between resumes.
+
+    Args:
+        document: Canonical resume (see :class:`Canonicalizer`)
+        sections: Top-level properties to compare
+
+    Returns:
+        Tokens such as ``skills.keywords=docker`` or
+        ``work.highlights~reduced deployment time``
+    """
+    out: Set[str] = set()
+    for section in sections:
+        if section in document:
+            _tokens(document[section], section, out)
+    return out
+
+
+def minhash(tokens: Iterable[str], num_perm: int = DEFAULT_NUM_PERM) -> Tuple[int, ...]:
+    """
+    Compute a densified one-permutation MinHash signature.
+
+    Args:
+        tokens: Token set
+        num_perm: Signature length (number of bins)
+
+    Returns:
+        ``num_perm`` 64-bit values; all ``2**64 - 1`` for an empty set
+    """
+    bins = [_EMPTY] * num_perm
+    for token in tokens:
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+        b = h % num_perm
+        if h < bins[b]:
+            bins[b] = h
+    if all(value == _EMPTY for value in bins):
+        return tuple(bins)
+
+    # Rotation densification: an empty bin borrows the value of the next
+    # non-empty bin to its right, offset by the distance so borrowed values
+    # stay distinguishable.
+    signature = list(bins)
+    for i in range(num_perm):
+        if bins[i] == _EMPTY:
+            distance = 1
+            while bins[(i + distance) % num_perm] == _EMPTY:
+                distance += 1
+            borrowed = bins[(i + distance) % num_perm]
+            signature[i] = (borrowed + distance * 0x9E3779B97F4A7C15) & _MASK
+    return tuple(signature)
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def lsh_parameters(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose ``(bands, rows)`` for a similarity threshold.
+
+    Pairs with similarity ``s`` become candidates with probability
+    ``1 - (1 - s**rows)**bands``, a curve that rises steeply around
+    ``(1 / bands) ** (1 / rows)``. The split whose midpoint is the highest
+    one not above ``threshold`` is chosen, so few true near duplicates are
+    missed; candidates are then confirmed against the threshold.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0:
+            bands = num_perm // rows
+            if (1 / bands) ** (1 / rows) <= threshold:
+                best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """LSH index of MinHash signatures."""
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM
+    ) -> None:
+        """
+        Args:
+            threshold: Minimum estimated Jaccard similarity of near duplicates
+            num_perm: Signature length
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_parameters(threshold, num_perm)
+        self.signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _band_keys(self, signature: Sequence[int]) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, tuple(signature[band * rows:(band + 1) * rows])
+
+    def query(self, signature: Sequence[int]) -> List[Tuple[str, float]]:
+        """
+        Find indexed keys similar to a signature.
+
+        Returns:
+            ``(key, similarity)`` pairs at or above the threshold, most
+            similar first
+        """
+        candidates: Set[str] = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        matches = []
+        for candidate in candidates:
+            score = similarity(signature, self.signatures[candidate])
+            if score >= self.threshold:
+                matches.append((candidate, score))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def add(self, key: str, signature: Sequence[int]) -> None:
+        """Index a signature under ``key``."""
+        signature = tuple(signature)
+        self.signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+
+def sign_document(
+    canonicalizer: Canonicalizer,
+    document: Any,
+    sections: Sequence[str] = DEFAULT_SECTIONS,
+    num_perm: int = DEFAULT_NUM_PERM,
+) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Return the canonical hash and MinHash signature of a document.
+    """
+    canonical = canonicalizer.canonicalize(document)
+    digest = hashlib.sha256(dump_canonical(canonical)).hexdigest()
+    tokens = content_tokens(canonical, sections) if isinstance(canonical, dict) else set()
+    return digest, minhash(tokens, num_perm)
+
+
+def _make_canonicalizer(date_precision: str) -> Canonicalizer:
+    """Worker factory: one canonicalizer per process."""
+    return Canonicalizer(date_precision=date_precision)
+
+
+def _sign_file(task: Tuple[str, Sequence[str], int]) -> Dict[str, Any]:
+    """Worker entry point: parse and sign one JSON file."""
+    path, sections, num_perm = task
+    try:
+        with open(path, "rb") as f:
+            document = json.loads(f.read())
+    except (OSError, ValueError) as exc:
+        return {"path": path, "error": str(exc)}
+    digest, signature = sign_document(worker_state(), document, sections, num_perm)
+    return {"path": path, "sha256": digest, "signature": signature}
+
+
+def dedup_files(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    sections: Sequence[str] = DEFAULT_SECTIONS,
+    date_precision: str = "month",
+    chunksize: int = 64,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Classify JSON resume files as distinct, exact duplicates or near duplicates.
+
+    Files are processed as a stream, in input order; the first file of
+    each group is the one kept.
+
+    Args:
+        paths: JSON files
+        workers: Number of worker processes (default: CPU count; 1 runs
+                 in-process)
+        threshold: Minimum estimated Jaccard similarity of near duplicates
+        num_perm: Signature length
+        sections: Top-level properties compared for near duplicates
+        date_precision: Precision dates are canonicalized to
+        chunksize: Files sent to a worker at a time
+
+    Yields:
+        One dictionary per file with ``path``, ``sha256``, ``duplicate_of``
+        (first file with the same canonical hash), ``near_duplicate_of``
+        and ``similarity`` (most similar distinct file), or ``error`` if the
+        file could not be parsed
+    """
+    index = NearDuplicateIndex(threshold, num_perm)
+    seen: Dict[str, str] = {}
+    tasks = ((str(path), tuple(sections), num_perm) for path in paths)
+
+    def classify(results: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for result in results:
+            if "error" in result:
+                yield result
+                continue
+            signature = result.pop("signature")
+            record = dict(result, duplicate_of=None, near_duplicate_of=None, similarity=None)
+            first = seen.get(result["sha256"])
+            if first is not None:
+                record["duplicate_of"] = first
+            else:
+                seen[result["sha256"]] = result["path"]
+                matches = index.query(signature)
+                if matches:
+                    record["near_duplicate_of"], record["similarity"] = matches[0]
+                else:
+                    index.add(result["path"], signature)
+            yield record
+
+    with WorkerPool(workers, _make_canonicalizer, (date_precision,)) as pool:
+        yield from classify(pool.map(_sign_file, tasks, chunksize=chunksize))
@@ -0,0 +1,312 @@
+"""Differential validation of a corpus against two schema versions.
+
+:func:`diff_corpus` validates every document against an old and a new
+``schema.json`` and yields only the documents whose result differs, with
+the errors the new schema adds and the ones it removes. Errors are paired
+by document path, keyword and message first, then by document path and
+keyword alone (``/work/0/workType`` + ``enum``), so a changed error message
+alone does not count as a difference, while a second error of the same kind
+at the same path (another missing required property) does.
+
+Each document is read and decoded once; the decoded value is validated by
+both validators. A corpus is any mix of JSON files, directories of
+``*.json`` files and NDJSON files (``.ndjson``/``.jsonl``). Work is split
+into tasks of files or of NDJSON line ranges that worker processes read,
+decode and validate themselves, so the parent only enumerates and collects
+results.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .sampling import NDJSON_SUFFIXES
+from .scan import iter_files
+from .validator import ResumeValidator
+from .workers import WorkerPool, make_validators, worker_state
+
+# Summary key of an error: (schema path, keyword)
+ErrorKey = Tuple[str, str]
+
+# ("files", [path, ...]) or ("ndjson", (path, offset, length, first line number))
+Task = Tuple[str, Any]
+
+
+def _exact_key(error: Dict[str, Any]) -> Tuple[str, str, str]:
+    return error["path"], error["validator"], error["message"]
+
+
+def _error_key(error: Dict[str, Any]) -> Tuple[str, str]:
+    return error["path"], error["validator"]
+
+
+def _unmatched(
+    old: List[Dict[str, Any]], new: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Pair old and new errors one to one; return the unpaired ones of each side."""
+    for key in (_exact_key, _error_key):
+        available: Dict[Tuple[str, ...], List[int]] = {}
+        for i, error in enumerate(old):
+            available.setdefault(key(error), []).append(i)
+        paired = set()
+        unpaired = []
+        for error in new:
+            indices = available.get(key(error))
+            if indices:
+                paired.add(indices.pop(0))
+            else:
+                unpaired.append(error)
+        old = [error for i, error in enumerate(old) if i not in paired]
+        new = unpaired
+    return old, new
+
+
+def _summarize(error: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "path": error["path"],
+        "validator": error["validator"],
+        "message": error["message"],
+        "schema_path": error["schema_path"],
+    }
+
+
+def diff_document(
+    old: ResumeValidator, new: ResumeValidator, document: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate one document against two validators and compare the results.
+
+    Args:
+        old: Validator of the old schema
+        new: Validator of the new schema
+        document: Resume as dict or JSON text/bytes, decoded once for both
+
+    Returns:
+        None if both results agree, otherwise a dictionary with ``change``
+        (``newly_invalid``, ``newly_valid`` or ``changed``), ``old_valid``,
+        ``new_valid``, ``added`` and ``removed`` (errors with ``path``,
+        ``validator``, ``message`` and ``schema_path``). Documents that are
+        not valid JSON fail both schemas alike and return None.
+    """
+    if isinstance(document, (bytes, bytearray, str)):
+        try:
+            document = json.loads(document)
+        except ValueError:
+            return None
+    before = old.validate(document)
+    after = new.validate(document)
+    old_errors, new_errors = _unmatched(before["errors"], after["errors"])
+    added = [_summarize(error) for error in new_errors]
+    removed = [_summarize(error) for error in old_errors]
+    if before["valid"] == after["valid"] and not added and not removed:
+        return None
+    if before["valid"] and not after["valid"]:
+        change = "newly_invalid"
+    elif after["valid"] and not before["valid"]:
+        change = "newly_valid"
+    else:
+        change = "changed"
+    return {
+        "change": change,
+        "old_valid": before["valid"],
+        "new_valid": after["valid"],
+        "added": added,
+        "removed": removed,
+    }
+
+
+def _ndjson_ranges(path: str, lines_per_task: int) -> Iterator[Tuple[int, int, int]]:
+    """Split an NDJSON file into ``(offset, length, first line number)`` ranges."""
+    offset = 0
+    line = 1
+    start, start_line = 0, 1
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            position = 0
+            while True:
+                end = chunk.find(b"\n", position)
+                if end < 0:
+                    offset += len(chunk) - position
+                    break
+                offset += end - position + 1
+                position = end + 1
+                line += 1
+                if line - start_line >= lines_per_task:
+                    yield start, offset - start, start_line
+                    start, start_line = offset, line
+    if offset > start:
+        yield start, offset - start, start_line
+
+
+def iter_tasks(
+    sources: Iterable[Union[str, Path]], files_per_task: int = 64, lines_per_task: int = 500
+) -> Iterator[Task]:
+    """
+    Split a corpus into worker tasks without reading any documents.
+
+    Args:
+        sources: JSON files, directories and NDJSON files
+        files_per_task: Files per task
+        lines_per_task: NDJSON lines per task
+
+    Yields:
+        ``("files", paths)`` and ``("ndjson", (path, offset, length, first_line))``
+    """
+    files: List[str] = []
+    for source in sources:
+        source = os.fspath(source)
+        if os.path.isdir(source):
+            paths: Iterable[str] = (entry[0] for entry in iter_files(source, ("*.json",)))
+        elif source.endswith(NDJSON_SUFFIXES):
+            for offset, length, first_line in _ndjson_ranges(source, lines_per_task):
+                yield "ndjson", (source, offset, length, first_line)
+            continue
+        else:
+            paths = (source,)
+        for path in paths:
+            files.append(path)
+            if len(files) >= files_per_task:
+                yield "files", files
+                files = []
+    if files:
+        yield "files", files
+
+
+def _task_documents(task: Task) -> Iterator[Tuple[str, Optional[int], bytes]]:
+    """Yield ``(path, line, data)`` of the documents of a task."""
+    kind, payload = task
+    if kind == "files":
+        for path in payload:
+            try:
+                with open(path, "rb") as f:
+                    yield path, None, f.read()
+            except OSError:
+                continue
+        return
+    path, offset, length, line = payload
+    with open(path, "rb") as f:
+        f.seek(offset)
+        block = f.read(length)
+    for data in block.split(b"\n"):
+        if data.strip():
+            yield path, line, data
+        line += 1
+
+
+def diff_task(
+    old: ResumeValidator, new: ResumeValidator, task: Task
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Compare the documents of one task.
+
+    Returns:
+        Number of documents compared and the records of those that differ,
+        each extended with ``path`` and ``line`` (None for JSON files)
+    """
+    count = 0
+    records = []
+    for path, line, data in _task_documents(task):
+        count += 1
+        record = diff_document(old, new, data)
+        if record is not None:
+            records.append(dict(record, path=path, line=line))
+    return count, records
+
+
+def _diff_in_worker(task: Task) -> Tuple[int, List[Dict[str, Any]]]:
+    """Worker entry point."""
+    old, new = worker_state()
+    return diff_task(old, new, task)
+
+
+class DiffSummary:
+    """Counts of a differential validation run."""
+
+    def __init__(self) -> None:
+        self.documents = 0
+        self.newly_invalid = 0
+        self.newly_valid = 0
+        self.changed = 0
+        self.added: Dict[ErrorKey, int] = {}
+        self.removed: Dict[ErrorKey, int] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Count a differing document, once per kind of error it adds or removes."""
+        setattr(self, record["change"], getattr(self, record["change"]) + 1)
+        for errors, counts in ((record["added"], self.added), (record["removed"], self.removed)):
+            for key in {(error["schema_path"], error["validator"]) for error in errors}:
+                counts[key] = counts.get(key, 0) + 1
+
+    def as_dict(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Return the counts as a dictionary.
+
+        Args:
+            top: Number of most frequent added and removed errors to list,
+                 by schema path and keyword
+        """
+
+        def most_common(counts: Dict[ErrorKey, int]) -> List[Dict[str, Any]]:
+            ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:top]
+            return [
+                {"schema_path": key[0], "validator": key[1], "documents": count}
+                for key, count in ranked
+            ]
+
+        return {
+            "documents": self.documents,
+            "unchanged": self.documents - self.newly_invalid - self.newly_valid - self.changed,
+            "newly_invalid": self.newly_invalid,
+            "newly_valid": self.newly_valid,
+            "changed": self.changed,
+            "added": most_common(self.added),
+            "removed": most_common(self.removed),
+        }
+
+
+def diff_corpus(
+    sources: Sequence[Union[str, Path]],
+    old_schema: Optional[Path] = None,
+    new_schema: Optional[Path] = None,
+    workers: Optional[int] = None,
+    summary: Optional[DiffSummary] = None,
+    files_per_task: int = 64,
+    lines_per_task: int = 500,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the documents of a corpus whose validation result differs
+    between two schemas.
+
+    Records are yielded in corpus order as tasks complete.
+
+    Args:
+        sources: JSON files, directories of ``*.json`` files and NDJSON files
+        old_schema: Old schema file (default: the bundled schema.json)
+        new_schema: New schema file (default: the bundled schema.json)
+        workers: Number of worker processes (default: CPU count; 1 runs
+                 in-process)
+        summary: Optional summary updated with every task
+        files_per_task: Files per worker task
+        lines_per_task: NDJSON lines per worker task
+
+    Yields:
+        Records from :func:`diff_document` with ``path`` and ``line``
+    """
+    old_arg = str(old_schema) if old_schema else None
+    new_arg = str(new_schema) if new_schema else None
+    tasks = iter_tasks(sources, files_per_task, lines_per_task)
+
+    def collect(results: Iterable[Tuple[int, List[Dict[str, Any]]]]) -> Iterator[Dict[str, Any]]:
+        for count, records in results:
+            if summary is not None:
+                summary.documents += count
+                for record in records:
+                    summary.add(record)
+            yield from records
+
+    with WorkerPool(workers, make_validators, (old_arg, new_arg)) as pool:
+        yield from collect(pool.map(_diff_in_worker, tasks))
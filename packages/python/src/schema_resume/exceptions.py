@@ -14,3 +14,13 @@ class ValidationError(SchemaResumeError):
 class SchemaError(SchemaResumeError):
     """Raised when schema loading or parsing fails."""
     pass
+
+
+class LimitExceededError(ValidationError):
+    """Raised when an input exceeds a configured size, depth or time limit."""
+
+    def __init__(self, limit: str, value: object, path: str = "/") -> None:
+        self.limit = limit
+        self.value = value
+        self.path = path
+        super().__init__(f"Input exceeds {limit} limit of {value} at {path}")
@@ -0,0 +1,460 @@
+"""Columnar export of validated resumes for analytics.
+
+Table layouts are derived from ``schema.json``: one ``resume`` table with a
+row per document (top-level scalars and flattened objects such as
+``basics.location.city``), plus one table per array in the schema — e.g.
+``work`` (a row per ``work[]`` entry), ``work.positions`` (a row per
+``work[].positions[]``) and ``skills.keywords`` (a row per keyword, in a
+``value`` column). Every row carries ``document_id`` and one ``<array>_index``
+column per enclosing array, so tables can be joined back together.
+
+Rows are buffered column by column and written in batches of
+``batch_size`` rows per table, so memory stays bounded. Output is Parquet
+when ``pyarrow`` is installed (``pip install schema-resume-validator[parquet]``),
+SQLite or CSV otherwise. Parallel workers write separate partitions; an
+export replaces the partitions an earlier export left in the same directory.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from .validator import ResumeValidator
+from .workers import WorkerPool, make_validators, worker_state
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+FORMATS = ("parquet", "sqlite", "csv")
+_EXTENSIONS = {"parquet": ".parquet", "sqlite": ".sqlite", "csv": ".csv"}
+SCALAR_TYPES = ("string", "number", "integer", "boolean")
+ROOT_TABLE = "resume"
+
+# Exact Python types accepted per JSON type (``bool`` is not an integer here).
+_PYTHON_TYPES: Dict[str, frozenset] = {
+    "string": frozenset([str]),
+    "number": frozenset([int, float]),
+    "integer": frozenset([int]),
+    "boolean": frozenset([bool]),
+}
+_SQLITE_TYPES = {"string": "TEXT", "number": "REAL", "integer": "INTEGER", "boolean": "INTEGER"}
+
+
+class TableLayout:
+    """Column layout of one output table."""
+
+    def __init__(self, name: str, steps: Tuple[Tuple[str, ...], ...]) -> None:
+        """
+        Args:
+            name: Table name (dotted path of the array, or ``resume``)
+            steps: Key paths leading from the document (or the enclosing
+                   array item) to each array on the way to this table
+        """
+        self.name = name
+        self.steps = steps
+        self.index_columns = [f"{step[-1]}_index" for step in steps]
+        # (column name, JSON type, key path inside the row item)
+        self.fields: List[Tuple[str, str, Tuple[str, ...]]] = []
+        # Tables of arrays nested in this table's items
+        self.children: List["TableLayout"] = []
+
+    @property
+    def columns(self) -> List[str]:
+        """All column names, key columns first."""
+        return ["document_id"] + self.index_columns + [field[0] for field in self.fields]
+
+    @property
+    def types(self) -> List[str]:
+        """JSON types of :attr:`columns`."""
+        keys = ["string"] + ["integer"] * len(self.index_columns)
+        return keys + [field[1] for field in self.fields]
+
+
+def _resolve(node: Any, root: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow a local ``$ref``."""
+    ref = node.get("$ref") if isinstance(node, dict) else None
+    if isinstance(ref, str) and ref.startswith("#/"):
+        target: Any = root
+        for part in ref[2:].split("/"):
+            target = target.get(part, {})
+        return _resolve(target, root)
+    return node if isinstance(node, dict) else {}
+
+
+def _json_type(node: Dict[str, Any]) -> Optional[str]:
+    """Return the single JSON type of a subschema, if it has one."""
+    kind = node.get("type")
+    if kind is None and "properties" in node:
+        return "object"
+    return kind if isinstance(kind, str) else None
+
+
+def derive_layouts(schema: Dict[str, Any]) -> Dict[str, TableLayout]:
+    """
+    Derive table layouts from a Schema Resume JSON Schema.
+
+    Args:
+        schema: The JSON Schema (``ResumeValidator.get_schema()``)
+
+    Returns:
+        ``{table name: TableLayout}``
+    """
+    layouts: Dict[str, TableLayout] = {}
+
+    def visit(node: Dict[str, Any], table: TableLayout, prefix: Tuple[str, ...]) -> None:
+        for name, sub in node.get("properties", {}).items():
+            sub = _resolve(sub, schema)
+            kind = _json_type(sub)
+            path = prefix + (name,)
+            if kind in SCALAR_TYPES:
+                table.fields.append((".".join(path), kind, path))
+            elif kind == "object":
+                visit(sub, table, path)
+            elif kind == "array":
+                items = _resolve(sub.get("items", {}), schema)
+                child_name = ".".join(
+                    ([] if table.name == ROOT_TABLE else [table.name]) + list(path)
+                )
+                child = TableLayout(child_name, table.steps + (path,))
+                layouts[child_name] = child
+                table.children.append(child)
+                item_kind = _json_type(items)
+                if item_kind == "object":
+                    visit(items, child, ())
+                elif item_kind in SCALAR_TYPES:
+                    child.fields.append(("value", item_kind, ()))
+
+    root = TableLayout(ROOT_TABLE, ())
+    layouts[ROOT_TABLE] = root
+    visit(schema, root, ())
+    return layouts
+
+
+def _partition_files(output: Path, fmt: str, partition: str = "part-*") -> List[Path]:
+    """Files of the partitions matching ``partition`` written in format ``fmt``."""
+    pattern = partition + _EXTENSIONS[fmt]
+    return sorted(output.glob(pattern if fmt == "sqlite" else f"*/{pattern}"))
+
+
+def _lookup(item: Any, path: Tuple[str, ...]) -> Any:
+    """Follow a key path through nested objects."""
+    value = item
+    for key in path:
+        if type(value) is not dict:
+            return None
+        value = value.get(key)
+    return value
+
+
+class _Sink:
+    """Output of one partition, written a batch at a time."""
+
+    #: Output format, one of :data:`FORMATS`
+    fmt = ""
+
+    def __init__(self, output: Path, partition: str) -> None:
+        """Replace the files an earlier export wrote for ``partition``."""
+        output.mkdir(parents=True, exist_ok=True)
+        for path in _partition_files(output, self.fmt, partition):
+            path.unlink()
+        self.output = output
+        self.partition = partition
+
+    def write(self, layout: TableLayout, columns: List[List[Any]]) -> None:
+        """Write one batch of a table, given column by column."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the output files."""
+        raise NotImplementedError
+
+
+class _CSVSink(_Sink):
+    """One CSV file per table."""
+
+    fmt = "csv"
+
+    def __init__(self, output: Path, partition: str) -> None:
+        super().__init__(output, partition)
+        self.files: Dict[str, Any] = {}
+
+    def write(self, layout: TableLayout, columns: List[List[Any]]) -> None:
+        handle = self.files.get(layout.name)
+        if handle is None:
+            directory = self.output / layout.name
+            directory.mkdir(parents=True, exist_ok=True)
+            f = open(directory / f"{self.partition}.csv", "w", encoding="utf-8", newline="")
+            writer = csv.writer(f)
+            writer.writerow(layout.columns)
+            handle = self.files[layout.name] = (f, writer)
+        handle[1].writerows(zip(*columns))
+
+    def close(self) -> None:
+        for f, _ in self.files.values():
+            f.close()
+
+
+class _SQLiteSink(_Sink):
+    """One SQLite database per partition, one table per layout."""
+
+    fmt = "sqlite"
+
+    def __init__(self, output: Path, partition: str) -> None:
+        super().__init__(output, partition)
+        self.connection = sqlite3.connect(str(output / f"{partition}.sqlite"))
+        self.created: Dict[str, str] = {}
+
+    def write(self, layout: TableLayout, columns: List[List[Any]]) -> None:
+        statement = self.created.get(layout.name)
+        if statement is None:
+            quoted = ", ".join(
+                f'"{name}" {_SQLITE_TYPES[kind]}'
+                for name, kind in zip(layout.columns, layout.types)
+            )
+            self.connection.execute(f'CREATE TABLE "{layout.name}" ({quoted})')
+            marks = ", ".join("?" for _ in layout.columns)
+            statement = self.created[layout.name] = f'INSERT INTO "{layout.name}" VALUES ({marks})'
+        with self.connection:
+            self.connection.executemany(statement, zip(*columns))
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class _ParquetSink(_Sink):
+    """One Parquet file per table; every batch becomes a row group."""
+
+    fmt = "parquet"
+
+    _ARROW_TYPES = {"string": "string", "number": "float64", "integer": "int64", "boolean": "bool_"}
+
+    def __init__(self, output: Path, partition: str) -> None:
+        super().__init__(output, partition)
+        self.writers: Dict[str, Any] = {}
+
+    def write(self, layout: TableLayout, columns: List[List[Any]]) -> None:
+        writer = self.writers.get(layout.name)
+        schema = pyarrow.schema(
+            [
+                (name, getattr(pyarrow, self._ARROW_TYPES[kind])())
+                for name, kind in zip(layout.columns, layout.types)
+            ]
+        )
+        if writer is None:
+            directory = self.output / layout.name
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = pyarrow.parquet.ParquetWriter(
+                str(directory / f"{self.partition}.parquet"), schema
+            )
+            self.writers[layout.name] = writer
+        writer.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)],
+            schema=schema,
+        ))
+
+    def close(self) -> None:
+        for writer in self.writers.values():
+            writer.close()
+
+
+_SINKS: Dict[str, Type[_Sink]] = {
+    "parquet": _ParquetSink,
+    "sqlite": _SQLiteSink,
+    "csv": _CSVSink,
+}
+
+
+def resolve_format(fmt: str = "auto") -> str:
+    """Return the concrete output format for ``fmt`` (``auto`` prefers Parquet)."""
+    if fmt == "auto":
+        return "parquet" if pyarrow is not None else "sqlite"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt == "parquet" and pyarrow is None:
+        raise ImportError(
+            "Parquet export requires pyarrow: pip install schema-resume-validator[parquet]"
+        )
+    return fmt
+
+
+class ColumnarExporter:
+    """
+    Stream validated resumes into columnar batches.
+
+    Example:
+        >>> with ColumnarExporter("out/", fmt="sqlite") as exporter:
+        ...     for doc_id, resume in documents:
+        ...         exporter.add(doc_id, resume)
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        fmt: str = "auto",
+        batch_size: int = 10000,
+        schema: Optional[Dict[str, Any]] = None,
+        partition: str = "part-00000",
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            output_dir: Directory receiving the output files
+            fmt: ``parquet``, ``sqlite``, ``csv`` or ``auto``
+            batch_size: Rows buffered per table before a batch is written
+            schema: Schema to derive layouts from (default: bundled schema)
+            partition: Partition name; parallel writers need distinct names.
+                       Files of an earlier export of the same partition are
+                       replaced.
+        """
+        if schema is None:
+            schema = ResumeValidator().get_schema()
+        self.format = resolve_format(fmt)
+        self.batch_size = batch_size
+        self.layouts = derive_layouts(schema)
+        self.documents = 0
+        self.rows: Dict[str, int] = {name: 0 for name in self.layouts}
+        self._buffers: Dict[str, List[List[Any]]] = {
+            name: [[] for _ in layout.columns] for name, layout in self.layouts.items()
+        }
+        self._sink = _SINKS[self.format](Path(output_dir), partition)
+
+    def add(self, doc_id: Any, document: Dict[str, Any]) -> None:
+        """
+        Append one (already validated) resume to the batches.
+
+        Args:
+            doc_id: Document identifier, stored in ``document_id``
+            document: Resume data
+        """
+        self.documents += 1
+        self._emit(self.layouts[ROOT_TABLE], document, (str(doc_id),))
+        for name, buffer in self._buffers.items():
+            if len(buffer[0]) >= self.batch_size:
+                self._flush_table(name)
+
+    def _emit(self, layout: TableLayout, item: Any, keys: Tuple[Any, ...]) -> None:
+        """Append the row for ``item`` and recurse into its nested arrays."""
+        buffer = self._buffers[layout.name]
+        for position, key in enumerate(keys):
+            buffer[position].append(key)
+        position = len(keys)
+        is_object = type(item) is dict
+        for _, kind, path in layout.fields:
+            if not path:
+                value = item
+            elif not is_object:
+                value = None
+            elif len(path) == 1:
+                value = item.get(path[0])
+            else:
+                value = _lookup(item, path)
+            buffer[position].append(value if type(value) in _PYTHON_TYPES[kind] else None)
+            position += 1
+        self.rows[layout.name] += 1
+
+        for child in layout.children:
+            values = _lookup(item, child.steps[-1])
+            if type(values) is list:
+                for index, value in enumerate(values):
+                    self._emit(child, value, keys + (index,))
+
+    def _flush_table(self, name: str) -> None:
+        """Write the buffered batch of one table."""
+        buffer = self._buffers[name]
+        if buffer[0]:
+            self._sink.write(self.layouts[name], buffer)
+            self._buffers[name] = [[] for _ in buffer]
+
+    def flush(self) -> None:
+        """Write all buffered batches."""
+        for name in self.layouts:
+            self._flush_table(name)
+
+    def close(self) -> None:
+        """Flush and close the output files."""
+        self.flush()
+        self._sink.close()
+
+    def __enter__(self) -> "ColumnarExporter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _export_partition(task: Tuple[Sequence[str], str, str, int, str]) -> Dict[str, Any]:
+    """Validate and export one partition of files (worker entry point)."""
+    paths, output_dir, fmt, batch_size, partition = task
+    (validator,) = worker_state()
+    skipped = 0
+    with ColumnarExporter(
+        output_dir, fmt, batch_size, validator.get_schema(), partition
+    ) as exporter:
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    document = json.loads(f.read())
+            except (OSError, ValueError):
+                skipped += 1
+                continue
+            if validator.validate(document)["valid"]:
+                exporter.add(path, document)
+            else:
+                skipped += 1
+        return {"documents": exporter.documents, "skipped": skipped, "rows": dict(exporter.rows)}
+
+
+def export_files(
+    paths: Sequence[Union[str, Path]],
+    output_dir: Union[str, Path],
+    fmt: str = "auto",
+    workers: Optional[int] = None,
+    batch_size: int = 10000,
+) -> Dict[str, Any]:
+    """
+    Validate JSON resume files and export the valid ones, partitioned across workers.
+
+    Worker ``n`` writes partition ``part-0000n``; invalid or unreadable
+    files are skipped. Partitions of an earlier export in the same format
+    are removed first, including those of workers this run does not have.
+
+    Args:
+        paths: JSON resume files
+        output_dir: Output directory
+        fmt: ``parquet``, ``sqlite``, ``csv`` or ``auto``
+        workers: Number of worker processes (default: CPU count; 1 runs
+                 in-process)
+        batch_size: Rows buffered per table before a batch is written
+
+    Returns:
+        Totals with ``documents``, ``skipped`` and ``rows`` per table
+    """
+    fmt = resolve_format(fmt)
+    files = [os.fspath(path) for path in paths]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files) or 1))
+    partitions = [f"part-{n:05d}" for n in range(workers)]
+    for path in _partition_files(Path(output_dir), fmt):
+        if path.stem not in partitions:
+            path.unlink()
+    tasks = [
+        (files[n::workers], os.fspath(output_dir), fmt, batch_size, partition)
+        for n, partition in enumerate(partitions)
+    ]
+
+    with WorkerPool(workers, make_validators, (None,)) as pool:
+        parts = list(pool.map(_export_partition, tasks))
+
+    totals: Dict[str, Any] = {"documents": 0, "skipped": 0, "rows": {}}
+    for part in parts:
+        totals["documents"] += part["documents"]
+        totals["skipped"] += part["skipped"]
+        for table, count in part["rows"].items():
+            totals["rows"][table] = totals["rows"].get(table, 0) + count
+    return totals
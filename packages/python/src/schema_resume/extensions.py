@@ -0,0 +1,242 @@
+"""Extension schemas overlaid on the bundled base schema.
+
+An extension is a small schema that mirrors the parts of ``schema.json`` it
+changes, for example a tenant that adds ``work[].costCenter`` and a required
+top-level ``acme`` object::
+
+    {
+      "$id": "https://example.com/acme-extension.json",
+      "required": ["acme"],
+      "properties": {
+        "acme": {"type": "object", "required": ["employeeId"]},
+        "work": {"items": {"properties": {"costCenter": {"type": "string"}}}}
+      }
+    }
+
+:func:`overlay` merges an extension into a schema: ``properties``,
+``patternProperties`` and ``definitions`` are merged by name, ``items`` and
+other subschemas recursively, ``required`` lists are united, and any other
+keyword of the extension replaces the base value. Draft-07 ignores the
+keywords next to a ``$ref``, so an extension of a referenced subschema (such
+as ``work[].startDate``) is combined with it as
+``{"allOf": [{"$ref": ...}, extension]}``. Subschemas an extension does not
+touch are shared with the base rather than copied, so many variants of the
+schema cost little more memory than one.
+
+:class:`ExtensionRegistry` caches one composed schema per chain of
+extensions (each chain reusing its cached prefix) and one compiled
+:class:`ResumeValidator` per combination of extensions and limit values.
+Extension files are re-read only when their size or modification time
+changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import SchemaError
+from .limits import ResumeLimits
+from .validator import ResumeValidator
+
+Extension = Union[str, Path, Dict[str, Any]]
+
+# Keywords whose values map names to subschemas.
+NAMED_SUBSCHEMAS = frozenset(["properties", "patternProperties", "definitions"])
+
+# Keywords whose values are a single subschema.
+SUBSCHEMAS = frozenset(["items", "additionalItems", "additionalProperties", "propertyNames", "not"])
+
+# Root keywords describing the extension itself rather than the schema.
+EXTENSION_KEYS = frozenset(["$id", "$schema", "title", "description", "$comment"])
+
+# (extension hash, extension)
+LoadedExtension = Tuple[str, Dict[str, Any]]
+
+
+def overlay(base: Any, extension: Any) -> Any:
+    """
+    Merge an extension subschema into a base subschema.
+
+    Neither argument is modified; untouched parts of ``base`` are shared by
+    the result.
+
+    Args:
+        base: Base subschema
+        extension: Extension subschema
+
+    Returns:
+        The merged subschema
+    """
+    if not isinstance(base, dict) or not isinstance(extension, dict):
+        return extension
+    if "$ref" in base and "$ref" not in extension:
+        return {"allOf": [base, extension]}
+    merged = dict(base)
+    for key, value in extension.items():
+        if key not in base:
+            merged[key] = value
+        elif key in NAMED_SUBSCHEMAS and isinstance(value, dict) and isinstance(base[key], dict):
+            named = dict(base[key])
+            for name, sub in value.items():
+                named[name] = overlay(base[key][name], sub) if name in named else sub
+            merged[key] = named
+        elif key in SUBSCHEMAS:
+            merged[key] = overlay(base[key], value)
+        elif key == "required" and isinstance(value, list) and isinstance(base[key], list):
+            merged[key] = base[key] + [name for name in value if name not in base[key]]
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_extension(extension: Extension) -> Dict[str, Any]:
+    """
+    Load an extension given as a dict or a path to a JSON file.
+
+    Raises:
+        SchemaError: If the extension is not a JSON object
+    """
+    if isinstance(extension, dict):
+        return extension
+    with open(extension, "r", encoding="utf-8") as f:
+        loaded = json.load(f)
+    if not isinstance(loaded, dict):
+        raise SchemaError(f"Extension schema must be a JSON object: {extension}")
+    return loaded
+
+
+def extension_hash(extension: Dict[str, Any]) -> str:
+    """Return the SHA-256 hex digest of an extension's sorted, compact JSON."""
+    data = json.dumps(extension, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def compose_schema(base: Dict[str, Any], extensions: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Overlay extensions on a base schema, in order.
+
+    Root ``$id``, ``$schema``, ``title``, ``description`` and ``$comment``
+    of the extensions are ignored.
+    """
+    schema = base
+    for extension in extensions:
+        schema = overlay(
+            schema, {key: value for key, value in extension.items() if key not in EXTENSION_KEYS}
+        )
+    return schema
+
+
+class ExtensionRegistry:
+    """Cache of composed schemas and validators per extension chain."""
+
+    def __init__(self, base_path: Optional[Path] = None) -> None:
+        """
+        Args:
+            base_path: Base schema file (default: the bundled schema.json)
+        """
+        self.base_path = base_path or Path(__file__).parent / "schemas" / "schema.json"
+        self._base: Optional[Dict[str, Any]] = None
+        self._schemas: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._validators: Dict[Tuple[Tuple[str, ...], Any], ResumeValidator] = {}
+        # path -> ((size, mtime_ns), hash, extension)
+        self._files: Dict[str, Tuple[Tuple[int, int], str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base(self) -> Dict[str, Any]:
+        """The base schema, loaded on first access."""
+        if self._base is None:
+            with open(self.base_path, "r", encoding="utf-8") as f:
+                self._base = json.load(f)
+        return self._base
+
+    def _load(self, extension: Extension) -> LoadedExtension:
+        """Load and hash an extension; files are cached until they change."""
+        if isinstance(extension, dict):
+            return extension_hash(extension), extension
+        path = os.fspath(extension)
+        stat = os.stat(path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._files.get(path)
+        if cached is None or cached[0] != signature:
+            loaded = load_extension(path)
+            cached = self._files[path] = (signature, extension_hash(loaded), loaded)
+        return cached[1], cached[2]
+
+    def _compose(self, loaded: List[LoadedExtension]) -> Dict[str, Any]:
+        key: Tuple[str, ...] = ()
+        schema = self.base
+        for digest, extension in loaded:
+            key += (digest,)
+            cached = self._schemas.get(key)
+            if cached is None:
+                cached = self._schemas[key] = compose_schema(schema, [extension])
+            schema = cached
+        return schema
+
+    def schema(self, extensions: Sequence[Extension]) -> Dict[str, Any]:
+        """
+        Return the composed schema for a chain of extensions.
+
+        Compositions are cached per prefix: ``[a, b]`` and ``[a, c]`` both
+        start from the cached composition of ``[a]``.
+        """
+        return self._compose([self._load(extension) for extension in extensions])
+
+    def validator(
+        self, extensions: Sequence[Extension] = (), limits: Optional[ResumeLimits] = None
+    ) -> ResumeValidator:
+        """
+        Return the validator for the base schema with ``extensions`` applied.
+
+        Validators are built once per combination of extensions and limit
+        values and are safe to share between threads.
+
+        Args:
+            extensions: Extension schemas (dicts or JSON file paths), in order
+            limits: Optional size, depth and time limits for untrusted input
+
+        Returns:
+            A cached :class:`ResumeValidator`
+        """
+        loaded = [self._load(extension) for extension in extensions]
+        key = (tuple(digest for digest, _ in loaded), limits.key() if limits else None)
+        validator = self._validators.get(key)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(key)
+                if validator is None:
+                    validator = ResumeValidator.__new__(ResumeValidator)
+                    validator.schema_dir = Path(__file__).parent / "schemas"
+                    validator._setup(self._compose(loaded), limits)
+                    self._validators[key] = validator
+        return validator
+
+    def clear(self) -> None:
+        """Drop all cached schemas and validators."""
+        with self._lock:
+            self._schemas.clear()
+            self._validators.clear()
+            self._files.clear()
+
+
+_registry = ExtensionRegistry()
+
+
+def extended_validator(
+    *extensions: Extension, limits: Optional[ResumeLimits] = None
+) -> ResumeValidator:
+    """
+    Return the shared, cached validator for the bundled schema plus ``extensions``.
+
+    Args:
+        extensions: Extension schemas (dicts or JSON file paths), in order
+        limits: Optional size, depth and time limits for untrusted input
+
+    Returns:
+        A cached :class:`ResumeValidator`
+    """
+    return _registry.validator(extensions, limits)
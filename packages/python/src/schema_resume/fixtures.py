@@ -0,0 +1,151 @@
+"""Parallel runner for fixture corpora of valid and invalid resumes.
+
+Fixtures are discovered by naming convention:
+
+- ``valid-*.json`` / ``valid-*.xml`` must validate without errors;
+- ``invalid-*.json`` / ``invalid-*.xml`` must produce at least one error.
+
+An invalid fixture may have a sidecar file with the same stem and the suffix
+``.errors.json`` (e.g. ``invalid-null-positions.errors.json``) holding a JSON
+list of document paths such as ``["/work/0/positions"]``; every listed path
+must appear among the reported errors.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .scan import ERRORS_SUFFIX, validate_file
+from .validator import ResumeValidator
+from .workers import WorkerPool, make_validators, worker_state
+
+FIXTURE_SUFFIXES = (".json", ".xml")
+
+
+def _fixture(path: Path) -> Optional[Dict[str, Any]]:
+    """Describe ``path`` as a fixture, or return None if it is not one."""
+    name = path.name
+    if name.endswith(ERRORS_SUFFIX) or path.suffix not in FIXTURE_SUFFIXES:
+        return None
+    if name.startswith("valid-"):
+        expect_valid = True
+    elif name.startswith("invalid-"):
+        expect_valid = False
+    else:
+        return None
+
+    expected_paths: List[str] = []
+    sidecar = path.with_name(path.stem + ERRORS_SUFFIX)
+    if sidecar.is_file():
+        with open(sidecar, "r", encoding="utf-8") as f:
+            expected_paths = list(json.load(f))
+    return {"path": str(path), "expect_valid": expect_valid, "expected_paths": expected_paths}
+
+
+def discover_fixtures(paths: Iterable[Union[str, Path]]) -> List[Dict[str, Any]]:
+    """
+    Find fixtures in the given files and directories (recursively).
+
+    Args:
+        paths: Fixture files or directories to search
+
+    Returns:
+        Fixture descriptions with ``path``, ``expect_valid`` and
+        ``expected_paths``, sorted by path
+    """
+    fixtures = []
+    for root in paths:
+        root = Path(root)
+        candidates = sorted(root.rglob("*")) if root.is_dir() else [root]
+        for path in candidates:
+            if path.is_file():
+                fixture = _fixture(path)
+                if fixture is not None:
+                    fixtures.append(fixture)
+    return fixtures
+
+
+def check_fixture(validator: ResumeValidator, fixture: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate one fixture and compare the outcome with its expectation.
+
+    Returns:
+        The fixture description extended with ``passed``, ``valid``,
+        ``errors``, ``missing_paths`` and ``elapsed`` (seconds)
+    """
+    started = time.perf_counter()
+    result = validate_file(validator, fixture["path"])
+    elapsed = time.perf_counter() - started
+
+    reported = {error["path"] for error in result["errors"]}
+    missing = [path for path in fixture["expected_paths"] if path not in reported]
+    valid = bool(result["valid"])
+    passed = valid == fixture["expect_valid"] and not missing
+    return dict(
+        fixture,
+        passed=passed,
+        valid=valid,
+        errors=result["errors"],
+        missing_paths=missing,
+        elapsed=elapsed,
+    )
+
+
+def _check_in_worker(fixture: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point."""
+    (validator,) = worker_state()
+    return check_fixture(validator, fixture)
+
+
+def run_fixtures(
+    fixtures: Sequence[Dict[str, Any]],
+    workers: Optional[int] = None,
+    schema_path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Check fixtures, in parallel when ``workers`` is greater than one.
+
+    Each process compiles the schema once and reuses it for all of its
+    fixtures.
+
+    Args:
+        fixtures: Fixtures from :func:`discover_fixtures`
+        workers: Number of worker processes (default: CPU count)
+        schema_path: Optional custom schema file
+
+    Returns:
+        Results from :func:`check_fixture`, in fixture order
+    """
+    schema_arg = str(schema_path) if schema_path else None
+    with WorkerPool(workers if len(fixtures) > 1 else 1, make_validators, (schema_arg,)) as pool:
+        chunksize = max(1, len(fixtures) // (pool.workers * 8))
+        return list(pool.map(_check_in_worker, fixtures, chunksize=chunksize))
+
+
+def format_results(results: Sequence[Dict[str, Any]], slowest: int = 5) -> str:
+    """Render results in the style of the positions test runner."""
+    lines = []
+    for result in results:
+        status = "PASS" if result["passed"] else "FAIL"
+        lines.append(f"  {status}  {result['path']}  ({result['elapsed'] * 1000:.1f} ms)")
+        if result["passed"]:
+            continue
+        if result["expect_valid"]:
+            for error in result["errors"][:5]:
+                lines.append(f"          unexpected error: {error['path']}: {error['message']}")
+        elif result["valid"]:
+            lines.append("          expected validation to fail, but it passed")
+        for path in result["missing_paths"]:
+            lines.append(f"          expected an error at {path}")
+
+    if slowest and results:
+        lines.append("")
+        lines.append(f"slowest {min(slowest, len(results))} fixtures:")
+        for result in sorted(results, key=lambda r: r["elapsed"], reverse=True)[:slowest]:
+            lines.append(f"  {result['elapsed'] * 1000:8.1f} ms  {result['path']}")
+
+    passed = sum(1 for result in results if result["passed"])
+    lines.append("")
+    lines.append(f"fixture suite: {passed} passed, {len(results) - passed} failed")
+    return "\n".join(lines)
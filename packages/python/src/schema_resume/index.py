@@ -0,0 +1,388 @@
+"""Inverted index of skills, keywords, tools and languages.
+
+Terms are taken from ``skills[].name`` (field ``skill``),
+``skills[].keywords[]`` (``keyword``), ``tools[].name`` (``tool``) and
+``languages[].language`` (``language``), normalized with
+:func:`normalize_term` and stored as ``field:term``. Documents get dense
+integer IDs in insertion order, so every posting list is an ascending
+``array('I')`` of IDs. Removal marks a document as deleted; deleted IDs are
+filtered at query time and dropped when the index is saved.
+
+:meth:`SkillIndex.save` writes a single file that :meth:`SkillIndex.load`
+memory-maps: posting lists are read straight from the page cache and only
+the term directory and document keys are decoded. Queries use NumPy when it
+is installed and Python sets otherwise.
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import unicodedata
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+numpy: Optional[ModuleType]
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+MAGIC = b"SRIDX001"
+INDEX_FORMAT = 1
+
+# Weight of a match in each field for ranked queries.
+FIELD_WEIGHTS = {"skill": 2.0, "keyword": 1.0, "tool": 1.0, "language": 1.0}
+
+_HEADER = struct.Struct("<8sQ")
+
+
+def normalize_term(value: str) -> str:
+    """
+    Normalize a skill, keyword, tool or language name.
+
+    Applies NFKC, case folding and whitespace collapsing, so ``"  Node.JS "``
+    and ``"node.js"`` are the same term. Punctuation is kept (``c++``,
+    ``c#``).
+    """
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+@lru_cache(maxsize=262144)
+def _term(field: str, value: str) -> str:
+    """Return the qualified term of a value, or "" if it is blank."""
+    term = normalize_term(value)
+    return f"{field}:{term}" if term else ""
+
+
+def _add_names(terms: Set[str], field: str, items: Any, key: str) -> None:
+    """Add the terms of ``item[key]`` for the objects of an array."""
+    if isinstance(items, list):
+        for item in items:
+            if isinstance(item, dict):
+                value = item.get(key)
+                if isinstance(value, str):
+                    terms.add(_term(field, value))
+
+
+def extract_terms(resume: Dict[str, Any]) -> Set[str]:
+    """
+    Collect the ``field:term`` entries of a resume.
+
+    Args:
+        resume: Resume document (ideally already validated)
+
+    Returns:
+        Set of qualified terms such as ``skill:devops`` or ``tool:docker``
+    """
+    terms: Set[str] = set()
+    skills = resume.get("skills")
+    _add_names(terms, "skill", skills, "name")
+    if isinstance(skills, list):
+        for skill in skills:
+            keywords = skill.get("keywords") if isinstance(skill, dict) else None
+            if isinstance(keywords, list):
+                for keyword in keywords:
+                    if isinstance(keyword, str):
+                        terms.add(_term("keyword", keyword))
+    _add_names(terms, "tool", resume.get("tools"), "name")
+    _add_names(terms, "language", resume.get("languages"), "language")
+    terms.discard("")
+    return terms
+
+
+def _qualify(query: str, field: Optional[str]) -> List[str]:
+    """Expand a query term into the qualified terms it matches."""
+    prefix, sep, rest = query.partition(":")
+    if sep and prefix in FIELD_WEIGHTS:
+        return [f"{prefix}:{normalize_term(rest)}"]
+    term = normalize_term(query)
+    if field is not None:
+        return [f"{field}:{term}"]
+    return [f"{name}:{term}" for name in FIELD_WEIGHTS]
+
+
+class SkillIndex:
+    """Inverted index from normalized skill terms to document IDs."""
+
+    def __init__(self) -> None:
+        self.keys: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._deleted = bytearray()
+        self._deleted_count = 0
+        # Postings added in memory, per qualified term
+        self._delta: Dict[str, array] = {}
+        # Postings of a loaded index: term -> (offset, count) into _base
+        self._directory: Dict[str, Tuple[int, int]] = {}
+        self._base: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        """Number of live documents."""
+        return len(self.keys) - self._deleted_count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    @property
+    def terms(self) -> List[str]:
+        """All qualified terms, sorted."""
+        return sorted(set(self._directory) | set(self._delta))
+
+    def add(self, key: str, resume: Dict[str, Any]) -> int:
+        """
+        Index a resume, replacing any document with the same key.
+
+        Args:
+            key: Caller's document identifier (file name, database key, ...)
+            resume: Resume document
+
+        Returns:
+            The integer ID assigned to the document
+        """
+        self.remove(key)
+        doc_id = len(self.keys)
+        self.keys.append(key)
+        self._ids[key] = doc_id
+        self._deleted.append(0)
+        delta = self._delta
+        for term in extract_terms(resume):
+            postings = delta.get(term)
+            if postings is None:
+                postings = delta[term] = array("I")
+            postings.append(doc_id)
+        return doc_id
+
+    def add_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Index ``(key, resume)`` pairs."""
+        for key, resume in items:
+            self.add(key, resume)
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the key was indexed
+        """
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return False
+        self._deleted[doc_id] = 1
+        self._deleted_count += 1
+        self.keys[doc_id] = None
+        return True
+
+    def postings(self, term: str) -> Any:
+        """
+        Return the live document IDs of one qualified term, ascending.
+
+        Returns:
+            A NumPy ``uint32`` array when NumPy is installed, a list otherwise
+        """
+        parts: List[Any] = []
+        if term in self._directory and self._base is not None:
+            offset, count = self._directory[term]
+            parts.append(self._base[offset:offset + count])
+        if term in self._delta:
+            parts.append(self._delta[term])
+
+        if numpy is not None:
+            if not parts:
+                return numpy.empty(0, dtype=numpy.uint32)
+            ids = numpy.concatenate([numpy.frombuffer(part, dtype=numpy.uint32) for part in parts])
+            if self._deleted_count:
+                ids = ids[numpy.frombuffer(self._deleted, dtype=numpy.uint8)[ids] == 0]
+            return ids
+        deleted = self._deleted
+        return [doc_id for part in parts for doc_id in part if not deleted[doc_id]]
+
+    def _matches(self, query: str, field: Optional[str]) -> Any:
+        """Live IDs matching a query term in any of its fields."""
+        lists = [self.postings(term) for term in _qualify(query, field)]
+        if numpy is not None:
+            return numpy.unique(numpy.concatenate(lists)) if len(lists) > 1 else lists[0]
+        return set().union(*lists)
+
+    def search(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = (),
+        field: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Boolean query.
+
+        Query terms are matched in every field unless qualified
+        (``tool:docker``) or restricted with ``field``.
+
+        Args:
+            all_of: Terms that must all match
+            any_of: Terms of which at least one must match
+            none_of: Terms that must not match
+            field: Restrict unqualified terms to one field
+
+        Returns:
+            Keys of the matching documents, in ID (insertion) order
+        """
+        if numpy is not None:
+            result = None
+            for query in all_of:
+                ids = self._matches(query, field)
+                result = (
+                    ids if result is None
+                    else numpy.intersect1d(result, ids, assume_unique=True)
+                )
+            if any_of:
+                union = numpy.unique(numpy.concatenate([self._matches(q, field) for q in any_of]))
+                result = (
+                    union if result is None
+                    else numpy.intersect1d(result, union, assume_unique=True)
+                )
+            if result is None:
+                live = numpy.frombuffer(self._deleted, dtype=numpy.uint8) == 0
+                result = numpy.flatnonzero(live)
+            for query in none_of:
+                result = numpy.setdiff1d(result, self._matches(query, field), assume_unique=True)
+            ids = result.tolist()
+        else:
+            found: Optional[Set[int]] = None
+            for query in all_of:
+                matches = self._matches(query, field)
+                found = matches if found is None else found & matches
+            if any_of:
+                union = set().union(*(self._matches(q, field) for q in any_of))
+                found = union if found is None else found & union
+            if found is None:
+                found = {i for i, flag in enumerate(self._deleted) if not flag}
+            for query in none_of:
+                found -= self._matches(query, field)
+            ids = sorted(found)
+        keys = self.keys
+        return [keys[doc_id] for doc_id in ids]  # type: ignore[misc]
+
+    def rank(
+        self, terms: Sequence[str], limit: int = 10, field: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Ranked query: documents matching the most (and rarest) terms first.
+
+        A document scores ``idf * field weight`` for every qualified term it
+        contains, with ``idf = log(1 + N / df)``; skill names weigh twice as
+        much as keywords, tools and languages.
+
+        Args:
+            terms: Query terms
+            limit: Maximum number of results
+            field: Restrict unqualified terms to one field
+
+        Returns:
+            ``(key, score)`` pairs, best first
+        """
+        total = max(len(self), 1)
+        weighted = []
+        for query in terms:
+            for term in _qualify(query, field):
+                ids = self.postings(term)
+                if len(ids):
+                    field_weight = FIELD_WEIGHTS[term.partition(":")[0]]
+                    weight = math.log(1.0 + total / len(ids)) * field_weight
+                    weighted.append((ids, weight))
+        if not weighted:
+            return []
+
+        if numpy is not None:
+            ids = numpy.concatenate([ids for ids, _ in weighted])
+            weights = numpy.concatenate([numpy.full(len(ids), w) for ids, w in weighted])
+            unique, inverse = numpy.unique(ids, return_inverse=True)
+            scores = numpy.bincount(inverse, weights=weights)
+            top = numpy.argsort(-scores, kind="stable")[:limit]
+            best = [(int(unique[i]), float(scores[i])) for i in top]
+        else:
+            totals: Dict[int, float] = {}
+            for ids, weight in weighted:
+                for doc_id in ids:
+                    totals[doc_id] = totals.get(doc_id, 0.0) + weight
+            best = heapq.nsmallest(limit, totals.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.keys[doc_id], score) for doc_id, score in best]  # type: ignore[misc]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the index to a single file that :meth:`load` memory-maps.
+
+        Deleted documents are dropped from the posting lists; their IDs
+        stay reserved. The file is written next to ``path`` and renamed
+        into place, so an index may be saved over the file it was loaded
+        from.
+        """
+        path = Path(path)
+        directory: Dict[str, List[int]] = {}
+        postings = array("I")
+        for term in self.terms:
+            ids = self.postings(term)
+            if len(ids):
+                directory[term] = [len(postings), len(ids)]
+                if numpy is not None:
+                    postings.frombytes(ids.tobytes())
+                else:
+                    postings.extend(ids)
+        header = json.dumps(
+            {
+                "format": INDEX_FORMAT,
+                "byteorder": sys.byteorder,
+                "keys": self.keys,
+                "terms": directory,
+            },
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        header += b" " * (-len(header) % postings.itemsize)
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(header)))
+            f.write(header)
+            postings.tofile(f)
+            f.write(self._deleted)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SkillIndex":
+        """
+        Memory-map an index written by :meth:`save`.
+
+        The loaded index accepts further :meth:`add` and :meth:`remove`
+        calls; new postings are kept in memory until the next :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a compatible index
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a skill index: {path}")
+        start = _HEADER.size
+        header = json.loads(bytes(mapped[start:start + header_size]))
+        if header.get("format") != INDEX_FORMAT or header.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Unsupported skill index format: {path}")
+
+        index = cls()
+        index.keys = header["keys"]
+        index._ids = {key: doc_id for doc_id, key in enumerate(index.keys) if key is not None}
+        index._directory = {term: (entry[0], entry[1]) for term, entry in header["terms"].items()}
+        count = sum(entry[1] for entry in index._directory.values())
+        offset = start + header_size
+        view = memoryview(mapped)
+        index._base = view[offset:offset + 4 * count].cast("I")
+        index._deleted = bytearray(view[offset + 4 * count:offset + 4 * count + len(index.keys)])
+        index._deleted_count = len(index.keys) - len(index._ids)
+        index._mmap = mapped
+        return index
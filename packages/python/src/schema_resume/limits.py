@@ -0,0 +1,220 @@
+"""Size, depth and time limits for untrusted resume input."""
+
+import re
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .exceptions import LimitExceededError
+
+# A backslash escape (consumed as a pair) or a character that changes the
+# string/nesting state. Everything else is skipped by the regex engine.
+_STRUCTURAL = re.compile(rb'\\.|["\[\]{}]', re.DOTALL)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ResumeLimits:
+    """
+    Limits enforced by ``ResumeValidator`` before and during validation.
+
+    Every limit is optional; ``None`` disables it.
+
+    Example:
+        >>> limits = ResumeLimits(
+        ...     max_bytes=1_000_000,
+        ...     max_depth=32,
+        ...     max_items=1000,
+        ...     max_items_by_key={"work": 100, "highlights": 50, "keywords": 100},
+        ...     max_seconds=0.5,
+        ... )
+        >>> validator = ResumeValidator(limits=limits)
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_items_by_key: Optional[Dict[str, int]] = None,
+        max_seconds: Optional[float] = None,
+        max_cpu_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the limits.
+
+        Args:
+            max_bytes: Maximum size of the encoded input
+            max_depth: Maximum nesting depth of objects and arrays
+            max_items: Maximum length of any array
+            max_items_by_key: Maximum array length per property name
+                              (e.g. ``{"work": 100, "keywords": 50}``),
+                              overriding ``max_items``
+            max_seconds: Wall-clock budget for reading, parsing and validating
+            max_cpu_seconds: CPU-time budget for reading, parsing and validating
+        """
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_items_by_key = dict(max_items_by_key or {})
+        self.max_seconds = max_seconds
+        self.max_cpu_seconds = max_cpu_seconds
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return the values of every limit, for use as a cache key."""
+        return (
+            self.max_bytes,
+            self.max_depth,
+            self.max_items,
+            tuple(sorted(self.max_items_by_key.items())),
+            self.max_seconds,
+            self.max_cpu_seconds,
+        )
+
+    def budget(self) -> "Budget":
+        """Start a new time budget."""
+        return Budget(self.max_seconds, self.max_cpu_seconds)
+
+
+class Budget:
+    """Wall-clock and CPU deadline started at construction time."""
+
+    def __init__(self, max_seconds: Optional[float], max_cpu_seconds: Optional[float]) -> None:
+        self.max_seconds = max_seconds
+        self.max_cpu_seconds = max_cpu_seconds
+        self.deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+        self.cpu_deadline = (
+            time.process_time() + max_cpu_seconds if max_cpu_seconds is not None else None
+        )
+
+    def check(self, path: str = "/") -> None:
+        """Raise LimitExceededError if the budget is spent."""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise LimitExceededError("max_seconds", self.max_seconds, path)
+        if self.cpu_deadline is not None and time.process_time() > self.cpu_deadline:
+            raise LimitExceededError("max_cpu_seconds", self.max_cpu_seconds, path)
+
+
+class DepthScanner:
+    """Incremental nesting-depth check over raw JSON bytes."""
+
+    def __init__(self, max_depth: int) -> None:
+        self.max_depth = max_depth
+        self.depth = 0
+        self.in_string = False
+        self._carry = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk; raises LimitExceededError on excess nesting."""
+        if self._carry:
+            chunk = self._carry + chunk
+            self._carry = b""
+        trailing = len(chunk) - len(chunk.rstrip(b"\\"))
+        if trailing % 2:
+            self._carry = b"\\"
+            chunk = chunk[:-1]
+
+        depth = self.depth
+        in_string = self.in_string
+        for match in _STRUCTURAL.finditer(chunk):
+            token = match.group()
+            if token == b'"':
+                in_string = not in_string
+            elif in_string or len(token) == 2:
+                continue
+            elif token in (b"{", b"["):
+                depth += 1
+                if depth > self.max_depth:
+                    raise LimitExceededError("max_depth", self.max_depth)
+            else:
+                depth -= 1
+        self.depth = depth
+        self.in_string = in_string
+
+
+def read_limited(
+    stream: BinaryIO, limits: ResumeLimits, budget: Optional[Budget] = None
+) -> bytes:
+    """
+    Read a stream in chunks, enforcing size, depth and time limits.
+
+    Args:
+        stream: Binary stream to read
+        limits: Limits to enforce
+        budget: Running time budget
+
+    Returns:
+        The complete input
+
+    Raises:
+        LimitExceededError: As soon as a limit is exceeded
+    """
+    scanner = DepthScanner(limits.max_depth) if limits.max_depth is not None else None
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if limits.max_bytes is not None and size > limits.max_bytes:
+            raise LimitExceededError("max_bytes", limits.max_bytes)
+        if scanner is not None:
+            scanner.feed(chunk)
+        if budget is not None:
+            budget.check()
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def check_bytes(data: bytes, limits: ResumeLimits) -> None:
+    """Enforce size and depth limits on an in-memory input."""
+    if limits.max_bytes is not None and len(data) > limits.max_bytes:
+        raise LimitExceededError("max_bytes", limits.max_bytes)
+    if limits.max_depth is not None:
+        DepthScanner(limits.max_depth).feed(data)
+
+
+def check_document(document: Any, limits: ResumeLimits) -> None:
+    """
+    Enforce depth and array-length limits on a parsed document.
+
+    Raises:
+        LimitExceededError: With the JSON pointer of the offending value
+    """
+    if limits.max_depth is None and limits.max_items is None and not limits.max_items_by_key:
+        return
+    containers = (dict, list)
+    stack: List[Tuple[Any, str, Optional[str], int]] = [(document, "", None, 0)]
+    while stack:
+        value, path, key, depth = stack.pop()
+        if not isinstance(value, containers):
+            continue
+        depth += 1
+        if limits.max_depth is not None and depth > limits.max_depth:
+            raise LimitExceededError("max_depth", limits.max_depth, path or "/")
+        if isinstance(value, dict):
+            stack.extend(
+                (item, f"{path}/{name}", name, depth)
+                for name, item in value.items()
+                if isinstance(item, containers)
+            )
+        else:
+            limit = limits.max_items_by_key.get(key, limits.max_items) if key else limits.max_items
+            if limit is not None and len(value) > limit:
+                raise LimitExceededError("max_items", limit, path or "/")
+            stack.extend(
+                (item, f"{path}/{index}", None, depth)
+                for index, item in enumerate(value)
+                if isinstance(item, containers)
+            )
+
+
+def limit_error(exc: LimitExceededError) -> Dict[str, Any]:
+    """Format a LimitExceededError like a validation error."""
+    return {
+        "path": exc.path,
+        "message": str(exc),
+        "schema_path": "/",
+        "validator": exc.limit,
+        "validator_value": exc.value,
+    }
@@ -0,0 +1,481 @@
+"""Cached lint and consistency engine for the repository's schema files.
+
+Covers the four source files at the repository root (``schema.json``,
+``context.jsonld``, ``meta-schema.json``, ``xml/1.0/schema-resume.xsd``) and
+every copy under ``packages/``. Each distinct file content is parsed once
+into a shared model and rule results are cached by content hash, so
+unchanged files are never parsed or checked again. Rules run sequentially:
+the whole repository takes milliseconds, less than starting worker
+processes would, and threads would only contend for the GIL.
+
+Example:
+    >>> engine = LintEngine("/path/to/schema-resume")
+    >>> report = engine.run()
+    >>> report["errors"]
+    0
+"""
+
+import hashlib
+import json
+import re
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+SCHEMA_FILES = {
+    "schema.json": "schema.json",
+    "context.jsonld": "context.jsonld",
+    "meta-schema.json": "meta-schema.json",
+    "schema-resume.xsd": "xml/1.0/schema-resume.xsd",
+}
+
+CACHE_VERSION = 2
+DEFAULT_CACHE = ".schema-lint-cache.json"
+
+XS = "{http://www.w3.org/2001/XMLSchema}"
+NAMESPACE_KEYS = frozenset(["schema", "xsd", "rdf", "rdfs"])
+
+# A rule result: (severity, message) with severity "error", "warning" or "info".
+Issue = Tuple[str, str]
+FileRule = Callable[[Any], List[Issue]]
+SetRule = Callable[[Dict[str, Any]], List[Issue]]
+
+
+# ---------------------------------------------------------------------------
+# File rules (ported from lint-schemas.py)
+# ---------------------------------------------------------------------------
+
+
+def lint_schema_json(data: Any) -> List[Issue]:
+    """Structure checks for ``schema.json``."""
+    issues: List[Issue] = []
+    for field in ("$schema", "$id", "properties"):
+        if field not in data:
+            issues.append(("error", f"Missing required field: {field}"))
+    properties = data.get("properties", {})
+    if "properties" in data and "basics" not in properties:
+        issues.append(("warning", "Missing 'basics' section"))
+    basics = properties.get("basics", {}).get("properties", {})
+    if basics:
+        for field in ("name", "email", "phone"):
+            if field not in basics:
+                issues.append(("warning", f"Basics missing recommended field: {field}"))
+    if "definitions" not in data:
+        issues.append(("warning", "No definitions section found"))
+    pattern = data.get("definitions", {}).get("iso8601", {}).get("pattern")
+    if pattern is not None:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            issues.append(("error", f"Invalid ISO8601 regex pattern: {exc}"))
+    return issues
+
+
+def lint_context_jsonld(data: Any) -> List[Issue]:
+    """Structure checks for ``context.jsonld``."""
+    if "@context" not in data:
+        return [("error", "Missing required '@context' field")]
+    context = data["@context"]
+    issues: List[Issue] = []
+    for ns in ("schema", "xsd"):
+        if ns not in context:
+            issues.append(("warning", f"Missing namespace: {ns}"))
+    vocab = context.get("@vocab")
+    if vocab is not None and not str(vocab).startswith("http"):
+        issues.append(("warning", f"@vocab should be a URL: {vocab}"))
+    invalid = [
+        key
+        for key, value in context.items()
+        if isinstance(value, dict)
+        and "@id" in value
+        and not str(value["@id"]).startswith(("schema:", "xsd:", "rdf:", "rdfs:"))
+    ]
+    if invalid:
+        issues.append(("warning", f"Fields with non-standard @id: {', '.join(invalid[:5])}"))
+    return issues
+
+
+def lint_meta_schema(data: Any) -> List[Issue]:
+    """Structure checks for ``meta-schema.json``."""
+    issues: List[Issue] = []
+    for field in ("$schema", "$id", "properties"):
+        if field not in data:
+            issues.append(("error", f"Missing required field: {field}"))
+    if "$schema" in data and "$id" in data and data["$schema"] != data["$id"]:
+        issues.append(("warning", "$schema and $id don't match (not self-referential)"))
+    definitions = data.get("definitions")
+    if definitions is not None:
+        for name in ("schemaArray", "nonNegativeInteger", "simpleTypes", "stringArray"):
+            if name not in definitions:
+                issues.append(("warning", f"Missing standard definition: {name}"))
+    properties = data.get("properties")
+    if properties is not None:
+        for keyword in ("type", "properties", "items", "required", "enum", "pattern"):
+            if keyword not in properties:
+                issues.append(("warning", f"Missing JSON Schema keyword: {keyword}"))
+    return issues
+
+
+def lint_xsd(root: Any) -> List[Issue]:
+    """Structure checks for ``schema-resume.xsd``."""
+    issues: List[Issue] = []
+    if root.tag != f"{XS}schema":
+        issues.append(("error", f"Root element should be xs:schema, got {root.tag}"))
+    if not root.get("targetNamespace"):
+        issues.append(("warning", "Missing targetNamespace"))
+    if not root.findall(f"./{XS}element"):
+        issues.append(("warning", "No root element defined"))
+    if root.find(f".//{XS}complexType[@name='BasicsType']") is None:
+        issues.append(("warning", "BasicsType not found"))
+    for element in root.iter(f"{XS}element"):
+        element_type = element.get("type")
+        if element_type and ":" in element_type:
+            prefix = element_type.split(":")[0]
+            if prefix not in ("xs", "sr"):
+                issues.append(("warning", f"Unknown type prefix: {element_type}"))
+    return issues
+
+
+FILE_RULES: Dict[str, List[FileRule]] = {
+    "schema.json": [lint_schema_json],
+    "context.jsonld": [lint_context_jsonld],
+    "meta-schema.json": [lint_meta_schema],
+    "schema-resume.xsd": [lint_xsd],
+}
+
+
+# ---------------------------------------------------------------------------
+# Cross-file rules (ported from compare-schemas.py)
+# ---------------------------------------------------------------------------
+
+
+def schema_field_names(schema: Dict[str, Any]) -> Set[str]:
+    """Collect every property name defined anywhere under ``properties``."""
+    names: Set[str] = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            properties = node.get("properties")
+            if isinstance(properties, dict):
+                names.update(properties)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return {name for name in names if not name.startswith(("$", "@"))}
+
+
+def context_field_names(context: Dict[str, Any]) -> Set[str]:
+    """Collect the field mappings of a JSON-LD context."""
+    return {
+        key
+        for key in context.get("@context", {})
+        if not key.startswith("@") and key not in NAMESPACE_KEYS
+    }
+
+
+def xsd_field_names(root: Any) -> Set[str]:
+    """Collect the element names declared in an XSD."""
+    return {element.get("name") for element in root.iter(f"{XS}element") if element.get("name")}
+
+
+def _field_list(fields: Iterable[str], limit: int = 10) -> str:
+    """Format a sorted, truncated field list."""
+    fields = sorted(fields)
+    more = f" (+{len(fields) - limit} more)" if len(fields) > limit else ""
+    return ", ".join(fields[:limit]) + more
+
+
+def compare_schema_context(models: Dict[str, Any]) -> List[Issue]:
+    """Fields of ``schema.json`` without a JSON-LD mapping, and vice versa."""
+    schema_fields = schema_field_names(models["schema.json"])
+    context_fields = context_field_names(models["context.jsonld"])
+    issues: List[Issue] = []
+    missing = schema_fields - context_fields
+    if missing:
+        message = f"{len(missing)} fields missing from context.jsonld: {_field_list(missing)}"
+        issues.append(("info", message))
+    extra = context_fields - schema_fields
+    if extra:
+        message = f"{len(extra)} context.jsonld terms not in schema.json: {_field_list(extra)}"
+        issues.append(("info", message))
+    return issues
+
+
+def compare_schema_xsd(models: Dict[str, Any]) -> List[Issue]:
+    """Fields of ``schema.json`` without an XSD element, and vice versa."""
+    schema_fields = schema_field_names(models["schema.json"])
+    xsd_fields = xsd_field_names(models["schema-resume.xsd"]) - {"item", "resume"}
+    issues: List[Issue] = []
+    missing = schema_fields - xsd_fields
+    if missing:
+        message = f"{len(missing)} fields missing from the XSD: {_field_list(missing)}"
+        issues.append(("info", message))
+    extra = xsd_fields - schema_fields
+    if extra:
+        message = f"{len(extra)} XSD elements not in schema.json: {_field_list(extra)}"
+        issues.append(("info", message))
+    return issues
+
+
+# Each set rule lists the kinds it reads; it is cached on their hashes.
+SET_RULES: List[Tuple[SetRule, Tuple[str, ...]]] = [
+    (compare_schema_context, ("schema.json", "context.jsonld")),
+    (compare_schema_xsd, ("schema.json", "schema-resume.xsd")),
+]
+
+
+# ---------------------------------------------------------------------------
+# Discovery and engine
+# ---------------------------------------------------------------------------
+
+
+def discover_schema_sets(root: Union[str, Path]) -> Dict[str, Dict[str, Path]]:
+    """
+    Find the root schema files and every copy under ``packages/``.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        ``{set name: {kind: path}}``; the root set is named ``"."``
+    """
+    root = Path(root)
+    sets: Dict[str, Dict[str, Path]] = {}
+    files = {kind: root / rel for kind, rel in SCHEMA_FILES.items() if (root / rel).is_file()}
+    if files:
+        sets["."] = files
+    packages = root / "packages"
+    if packages.is_dir():
+        for schema in sorted(packages.rglob("schema.json")):
+            if "node_modules" in schema.parts:
+                continue
+            directory = schema.parent
+            copies = {
+                kind: directory / kind for kind in SCHEMA_FILES if (directory / kind).is_file()
+            }
+            sets[directory.relative_to(root).as_posix()] = copies
+    return sets
+
+
+def rules_digest() -> str:
+    """
+    Identify the rule implementations, so cached results die with them.
+
+    Returns:
+        The package version and the SHA-256 of this module's source
+    """
+    from . import __version__
+
+    return f"{__version__}:{hashlib.sha256(Path(__file__).read_bytes()).hexdigest()}"
+
+
+def _parse(kind: str, data: bytes) -> Any:
+    """Parse raw file content into the shared model."""
+    if kind.endswith(".xsd"):
+        return ET.fromstring(data)
+    return json.loads(data)
+
+
+class LintEngine:
+    """
+    Lint and cross-format consistency checks over all schema copies.
+
+    The engine keeps parsed models and rule results in memory between
+    :meth:`run` calls, and persists rule results in a JSON cache keyed by
+    content hash (and invalidated by :func:`rules_digest`), so repeated
+    runs only do work for changed files.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = ".",
+        cache_path: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            root: Repository root
+            cache_path: Result cache file (default ``.schema-lint-cache.json``
+                        in ``root``)
+            use_cache: Read and write the result cache
+        """
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path else self.root / DEFAULT_CACHE
+        self.use_cache = use_cache
+        self.rules = rules_digest()
+        self.models: Dict[str, Any] = {}
+        self.results: Dict[str, List[Issue]] = self._load_cache() if use_cache else {}
+        self._dirty = False
+
+    def _load_cache(self) -> Dict[str, List[Issue]]:
+        """Read the persisted rule results."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION or cache.get("rules") != self.rules:
+            return {}
+        return {key: [tuple(issue) for issue in issues] for key, issues in cache["results"].items()}
+
+    def _save_cache(self) -> None:
+        """Persist rule results."""
+        if not (self.use_cache and self._dirty):
+            return
+        payload = {"version": CACHE_VERSION, "rules": self.rules, "results": self.results}
+        tmp = self.cache_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        tmp.replace(self.cache_path)
+        self._dirty = False
+
+    def _model(self, kind: str, digest: str, path: Path) -> Any:
+        """Return the parsed model for a content hash, parsing it at most once."""
+        model = self.models.get(digest)
+        if model is None:
+            model = _parse(kind, path.read_bytes())
+            self.models[digest] = model
+        return model
+
+    def _run_file_rule(
+        self, rule: FileRule, kind: str, digest: str, path: Path
+    ) -> Tuple[str, List[Issue]]:
+        key = f"{rule.__name__}:{digest}"
+        try:
+            return key, rule(self._model(kind, digest, path))
+        except (ValueError, ET.ParseError) as exc:
+            return key, [("error", f"Parse error: {exc}")]
+
+    def _run_set_rule(
+        self, rule: SetRule, kinds: Tuple[str, ...], digests: Dict[str, str], files: Dict[str, Path]
+    ) -> Tuple[str, List[Issue]]:
+        key = f"{rule.__name__}:" + ":".join(digests[kind] for kind in kinds)
+        try:
+            models = {kind: self._model(kind, digests[kind], files[kind]) for kind in kinds}
+        except (ValueError, ET.ParseError):
+            return key, []  # already reported by the file rules
+        return key, rule(models)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every rule on every schema copy.
+
+        Returns:
+            Report dictionary with ``findings`` (each with ``severity``,
+            ``file``, ``rule`` and ``message``), ``errors``, ``warnings``,
+            ``files``, ``unique_files``, ``rules_run``, ``rules_cached``
+            and ``elapsed`` (seconds)
+        """
+        started = time.perf_counter()
+        sets = discover_schema_sets(self.root)
+
+        digests: Dict[Path, str] = {}
+        for files in sets.values():
+            for path in files.values():
+                digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        # Plan every (rule, file or set) pair, deduplicated by cache key.
+        planned: Dict[str, Tuple[Callable[..., Tuple[str, List[Issue]]], tuple]] = {}
+        where: List[Tuple[str, str, str]] = []  # (cache key, display file, rule name)
+        for name, files in sets.items():
+            for kind, path in files.items():
+                for rule in FILE_RULES.get(kind, []):
+                    key = f"{rule.__name__}:{digests[path]}"
+                    job = (self._run_file_rule, (rule, kind, digests[path], path))
+                    planned.setdefault(key, job)
+                    where.append((key, self._display(path), rule.__name__))
+            set_digests = {kind: digests[path] for kind, path in files.items()}
+            for rule, kinds in SET_RULES:
+                if not all(kind in files for kind in kinds):
+                    continue
+                key = f"{rule.__name__}:" + ":".join(set_digests[kind] for kind in kinds)
+                planned.setdefault(key, (self._run_set_rule, (rule, kinds, set_digests, files)))
+                where.append((key, name, rule.__name__))
+
+        pending = {key: job for key, job in planned.items() if key not in self.results}
+        if pending:
+            for func, args in pending.values():
+                key, issues = func(*args)
+                self.results[key] = issues
+            self._dirty = True
+        stale = [key for key in self.results if key not in planned]
+        if stale:
+            for key in stale:
+                del self.results[key]
+            self._dirty = True
+        self._save_cache()
+
+        # Drop models of file versions that no longer exist
+        current = set(digests.values())
+        for digest in [d for d in self.models if d not in current]:
+            del self.models[digest]
+
+        findings: List[Dict[str, str]] = []
+        for key, display, rule_name in where:
+            for severity, message in self.results[key]:
+                findings.append(
+                    {"severity": severity, "file": display, "rule": rule_name, "message": message}
+                )
+        findings.extend(self._sync_findings(sets, digests))
+
+        return {
+            "findings": findings,
+            "errors": sum(1 for f in findings if f["severity"] == "error"),
+            "warnings": sum(1 for f in findings if f["severity"] == "warning"),
+            "files": len(digests),
+            "unique_files": len(set(digests.values())),
+            "rules_run": len(pending),
+            "rules_cached": len(planned) - len(pending),
+            "elapsed": time.perf_counter() - started,
+        }
+
+    def _sync_findings(
+        self, sets: Dict[str, Dict[str, Path]], digests: Dict[Path, str]
+    ) -> List[Dict[str, str]]:
+        """Report package copies that differ from the root source files."""
+        source = sets.get(".", {})
+        findings = []
+        for name, files in sets.items():
+            if name == ".":
+                continue
+            for kind, path in files.items():
+                if kind in source and digests[path] != digests[source[kind]]:
+                    findings.append(
+                        {
+                            "severity": "warning",
+                            "file": self._display(path),
+                            "rule": "copy_in_sync",
+                            "message": (
+                                f"Differs from {SCHEMA_FILES[kind]}; run ./sync-schema-files.sh"
+                            ),
+                        }
+                    )
+        return findings
+
+    def _display(self, path: Path) -> str:
+        """Path relative to the repository root."""
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+
+def format_report(report: Dict[str, Any], verbose: bool = False) -> str:
+    """Render a lint report as text."""
+    lines = []
+    for finding in report["findings"]:
+        if finding["severity"] == "info" and not verbose:
+            continue
+        marker = {"error": "❌", "warning": "⚠️ ", "info": "ℹ️ "}[finding["severity"]]
+        lines.append(f"{marker} [{finding['file']}] {finding['rule']}: {finding['message']}")
+    lines.append(
+        f"{report['files']} files ({report['unique_files']} unique), "
+        f"{report['rules_run']} rules run, {report['rules_cached']} cached, "
+        f"{report['errors']} errors, {report['warnings']} warnings "
+        f"in {report['elapsed'] * 1000:.0f} ms"
+    )
+    return "\n".join(lines)
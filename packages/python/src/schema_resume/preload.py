@@ -0,0 +1,212 @@
+"""Preloaded, fork-friendly validator for prefork servers (gunicorn, uWSGI).
+
+Building a :class:`ResumeValidator` in every worker duplicates the schema
+and compiled validator state N times, and the cyclic garbage collector
+touching inherited objects dirties their pages (copy-on-write) even when
+workers only read them. :func:`preload` builds and warms one validator in
+the master process and moves it into the permanent GC generation with
+``gc.freeze()``, so forked workers share a single read-only copy.
+
+gunicorn (``gunicorn.conf.py``)::
+
+    from schema_resume import preload
+
+    preload_app = True
+
+    def on_starting(server):
+        preload.preload()
+
+    def post_fork(server, worker):
+        preload.post_fork()
+
+uWSGI: call ``preload.preload()`` at import time of the application module
+(without ``lazy-apps``) and register ``preload.post_fork`` with
+``uwsgidecorators.postfork``.
+"""
+
+import gc
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .validator import ResumeValidator
+
+_preloaded: Optional[ResumeValidator] = None
+
+
+def _skeleton(node: Any, root: Dict[str, Any], depth: int = 0) -> Any:
+    """Build an instance that visits every subschema of ``node``."""
+    if not isinstance(node, dict) or depth > 32:
+        return None
+    ref = node.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#/"):
+        target: Any = root
+        for part in ref[2:].split("/"):
+            target = target.get(part, {}) if isinstance(target, dict) else {}
+        return _skeleton(target, root, depth + 1)
+    if "properties" in node or node.get("type") == "object":
+        return {
+            name: _skeleton(sub, root, depth + 1)
+            for name, sub in node.get("properties", {}).items()
+        }
+    if node.get("type") == "array":
+        return [_skeleton(node.get("items", {}), root, depth + 1)]
+    if "enum" in node and node["enum"]:
+        return node["enum"][0]
+    defaults: Dict[Any, Any] = {"number": 0, "integer": 0, "boolean": False}
+    return defaults.get(node.get("type"), "")
+
+
+def _compile_patterns(node: Any) -> None:
+    """Compile every ``pattern`` in the schema into the ``re`` module cache."""
+    if isinstance(node, dict):
+        pattern = node.get("pattern")
+        if isinstance(pattern, str):
+            re.compile(pattern)
+        for value in node.values():
+            _compile_patterns(value)
+    elif isinstance(node, list):
+        for value in node:
+            _compile_patterns(value)
+
+
+def warm_up(validator: ResumeValidator, xml: bool = False) -> None:
+    """
+    Force lazily built validator state to be created now.
+
+    Compiles all schema regexes, resolves every ``$ref`` and exercises the
+    format checker by validating a synthetic document covering the whole
+    schema.
+
+    Args:
+        validator: Validator to warm up
+        xml: Also compile the XSD (requires ``lxml``)
+    """
+    schema = validator.get_schema()
+    _compile_patterns(schema)
+    validator.validate(_skeleton(schema, schema))
+    if xml:
+        validator.validate_xml(b"<resume xmlns=\"https://schema-resume.org/xml/1.0\"/>")
+
+
+def preload(
+    schema_path: Optional[Path] = None, xml: bool = False, freeze: bool = True
+) -> ResumeValidator:
+    """
+    Build, warm and freeze the process-wide validator before forking.
+
+    Call this once in the master process. Afterwards :func:`get_validator`
+    and :func:`~schema_resume.validate_resume` use the shared instance.
+
+    Args:
+        schema_path: Optional path to custom schema file
+        xml: Also compile the XSD (requires ``lxml``)
+        freeze: Move all objects alive now into the permanent GC generation
+                (``gc.freeze()``, Python 3.7+) so workers never touch them
+
+    Returns:
+        The preloaded validator
+    """
+    global _preloaded
+    validator = ResumeValidator(schema_path)
+    warm_up(validator, xml=xml)
+    _preloaded = validator
+    if freeze and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+    return validator
+
+
+def post_fork() -> None:
+    """
+    Worker hook to run right after fork.
+
+    The frozen objects stay in the permanent generation; this only makes
+    sure the worker has a validator even if :func:`preload` was not called
+    in the master (e.g. with lazy apps), so the hook is always safe.
+    """
+    get_validator()
+
+
+def get_validator() -> ResumeValidator:
+    """Return the preloaded validator, building one on first use if needed."""
+    global _preloaded
+    if _preloaded is None:
+        _preloaded = ResumeValidator()
+        warm_up(_preloaded)
+    return _preloaded
+
+
+def is_preloaded() -> bool:
+    """Return True if a process-wide validator exists."""
+    return _preloaded is not None
+
+
+def _private_kb() -> int:
+    """Private (unshared) memory of this process in kB, from /proc/self/smaps_rollup."""
+    total = 0
+    with open("/proc/self/smaps_rollup", "r", encoding="ascii") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def _measure_workers(workers: int, preloaded: bool, freeze: bool = True) -> int:
+    """Fork workers and return their average private memory in kB."""
+    global _preloaded
+    _preloaded = None
+    if hasattr(gc, "unfreeze"):
+        gc.unfreeze()
+    if preloaded:
+        preload(freeze=freeze)
+
+    resume = {"basics": {"name": "Jane Doe", "email": "jane@example.com"}}
+    pipes = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            validator = get_validator() if preloaded else ResumeValidator()
+            for _ in range(200):
+                validator.validate(resume)
+            gc.collect()
+            os.write(write_fd, str(_private_kb()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    sizes = []
+    for pid, read_fd in pipes:
+        sizes.append(int(os.read(read_fd, 64) or b"0"))
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+    return sum(sizes) // len(sizes)
+
+
+def benchmark(workers: int = 4) -> Dict[str, int]:
+    """
+    Measure per-worker private memory with and without preloading (Linux only).
+
+    Returns:
+        Average private kB per worker for ``per_worker`` (every worker
+        builds its own validator), ``preloaded_unfrozen`` (shared copy
+        without ``gc.freeze()``) and ``preloaded`` (shared frozen copy)
+    """
+    return {
+        "per_worker": _measure_workers(workers, preloaded=False),
+        "preloaded_unfrozen": _measure_workers(workers, preloaded=True, freeze=False),
+        "preloaded": _measure_workers(workers, preloaded=True),
+    }
+
+
+if __name__ == "__main__":
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
+    print(f"private memory per worker, own validator:      {result['per_worker']} kB")
+    print(f"private memory per worker, preloaded unfrozen: {result['preloaded_unfrozen']} kB")
+    print(f"private memory per worker, preloaded frozen:   {result['preloaded']} kB")
+    saved = result["per_worker"] - result["preloaded"]
+    print(f"saved per worker:                              {saved} kB")
@@ -0,0 +1,378 @@
+"""Sampling and progressive validation of large resume corpora.
+
+Instead of validating every stored resume, :func:`sample_corpus` validates
+a stratified random sample in rounds and estimates the share of resumes
+that fail, overall and per ``schema_path``, with confidence intervals. It
+stops as soon as the overall interval is narrower than the requested
+precision, the time or sample budget is spent, or the whole corpus has been
+validated (the estimate is then exact).
+
+A corpus is a directory of ``.json``/``.xml`` files, an NDJSON file (one
+resume per line) or any iterable of resume dicts. Files and lines are
+stratified by size (``stratify="size"``), by top-level subdirectory
+(``"directory"``) or not at all (``"none"``); iterables by a ``key``
+function. Rounds allocate the sample to strata in proportion to their
+population, and the estimator weights each stratum by its share, so strata
+with unusual failure rates do not skew the result.
+"""
+
+import math
+import os
+import random
+import time
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .scan import iter_files, validate_file
+from .validator import ResumeValidator, error_entry
+from .workers import WorkerPool, make_validators, worker_state
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# (kind, reference, size): kind is "file", "line" or "doc"
+Item = Tuple[str, Any, int]
+
+
+def _size_stratum(size: int) -> str:
+    """Size class of a document: <4 KiB, <16 KiB, <64 KiB, ..."""
+    limit = 4
+    while size >= limit * 1024:
+        limit *= 4
+    return f"<{limit}KiB"
+
+
+def _ndjson_lines(path: str) -> Iterable[Tuple[int, int]]:
+    """Yield ``(offset, length)`` of the non-empty lines of an NDJSON file."""
+    offset = 0
+    length = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if end < 0:
+                    length += len(chunk) - start
+                    break
+                length += end - start
+                if length:
+                    yield offset, length
+                offset += length + 1
+                length = 0
+                start = end + 1
+    if length:
+        yield offset, length
+
+
+def _population(
+    source: Union[str, Path, Iterable[Dict[str, Any]]],
+    stratify: str,
+    key: Optional[Callable[[Dict[str, Any]], str]],
+    reservoir: int,
+    rng: random.Random,
+) -> Tuple[Dict[str, List[Item]], Dict[str, int]]:
+    """Enumerate a corpus into strata without decoding any documents."""
+    strata: Dict[str, List[Item]] = {}
+    sizes: Dict[str, int] = {}
+
+    def add(stratum: str, item: Item) -> None:
+        strata.setdefault(stratum, []).append(item)
+        sizes[stratum] = sizes.get(stratum, 0) + 1
+
+    if isinstance(source, (str, Path)):
+        root = os.fspath(source)
+        if os.path.isdir(root):
+            for path, size, _ in iter_files(root):
+                if stratify == "size":
+                    stratum = _size_stratum(size)
+                elif stratify == "directory":
+                    relative = os.path.relpath(path, root).split(os.sep)
+                    stratum = relative[0] if len(relative) > 1 else "."
+                else:
+                    stratum = "all"
+                add(stratum, ("file", path, size))
+        elif root.endswith(NDJSON_SUFFIXES):
+            for offset, length in _ndjson_lines(root):
+                stratum = _size_stratum(length) if stratify == "size" else "all"
+                add(stratum, ("line", (root, offset, length), length))
+        else:
+            add("all", ("file", root, os.path.getsize(root)))
+        return strata, sizes
+
+    # Iterables are consumed once, keeping a uniform reservoir per stratum
+    for document in source:
+        stratum = key(document) if key else "all"
+        seen = sizes.get(stratum, 0) + 1
+        sizes[stratum] = seen
+        items = strata.setdefault(stratum, [])
+        if len(items) < reservoir:
+            items.append(("doc", document, 0))
+        else:
+            slot = rng.randrange(seen)
+            if slot < reservoir:
+                items[slot] = ("doc", document, 0)
+    return strata, sizes
+
+
+def validate_item(validator: ResumeValidator, item: Item) -> Dict[str, Any]:
+    """
+    Validate one corpus item.
+
+    Returns:
+        Dictionary with ``valid`` and ``errors``
+    """
+    kind, ref, _ = item
+    if kind == "file":
+        return validate_file(validator, ref)
+    if kind == "line":
+        path, offset, length = ref
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+        except OSError as exc:
+            return {"valid": False, "errors": [error_entry(str(exc))]}
+    else:
+        data = ref
+    try:
+        return validator.validate(data)
+    except ValueError as exc:
+        return {"valid": False, "errors": [error_entry(f"Invalid JSON: {exc}", "json")]}
+
+
+def _validate_in_worker(task: Tuple[str, Item]) -> Tuple[str, List[str]]:
+    """Worker entry point: return the stratum and the failing schema paths."""
+    stratum, item = task
+    (validator,) = worker_state()
+    result = validate_item(validator, item)
+    return stratum, sorted({error["schema_path"] for error in result["errors"]})
+
+
+def wilson_interval(rate: float, n: float, z: float) -> Tuple[float, float]:
+    """
+    Wilson score interval of a proportion.
+
+    Args:
+        rate: Observed proportion
+        n: (Effective) sample size
+        z: Standard normal quantile of the confidence level
+
+    Returns:
+        ``(low, high)`` bounds
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    denominator = 1 + z * z / n
+    center = (rate + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class StratifiedEstimate:
+    """Failure counts of a stratified sample and the estimates derived from them."""
+
+    def __init__(self, populations: Dict[str, int]) -> None:
+        """
+        Args:
+            populations: Number of corpus items per stratum
+        """
+        self.populations = populations
+        self.total = sum(populations.values())
+        self.sampled = {stratum: 0 for stratum in populations}
+        self.failures = {stratum: 0 for stratum in populations}
+        # schema_path -> stratum -> documents failing at that schema path
+        self.paths: Dict[str, Dict[str, int]] = {}
+
+    def add(self, stratum: str, schema_paths: List[str]) -> None:
+        """Record one validated document and the schema paths it failed at."""
+        self.sampled[stratum] += 1
+        if schema_paths:
+            self.failures[stratum] += 1
+        for schema_path in schema_paths:
+            counts = self.paths.setdefault(schema_path, {})
+            counts[stratum] = counts.get(stratum, 0) + 1
+
+    def estimate(self, failures: Dict[str, int], z: float) -> Dict[str, Any]:
+        """
+        Estimate a failure rate from per-stratum failure counts.
+
+        The stratified estimate ``sum(W_h * p_h)`` is turned into a Wilson
+        interval using the effective sample size implied by its variance
+        (with finite population correction).
+        """
+        rate = 0.0
+        variance = 0.0
+        sampled = 0
+        exact = True
+        for stratum, population in self.populations.items():
+            n = self.sampled[stratum]
+            if not n or not population:
+                exact = exact and not population
+                continue
+            weight = population / self.total
+            p = failures.get(stratum, 0) / n
+            rate += weight * p
+            variance += weight * weight * (1 - n / population) * p * (1 - p) / max(n - 1, 1)
+            sampled += n
+            exact = exact and n == population
+        if exact:
+            low, high = rate, rate
+        else:
+            effective = rate * (1 - rate) / variance if variance > 0 else sampled
+            low, high = wilson_interval(rate, effective, z)
+        return {"rate": rate, "low": low, "high": high}
+
+    def report(self, confidence: float) -> Dict[str, Any]:
+        """Summarize the sample: overall and per-``schema_path`` estimates."""
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        overall = self.estimate(self.failures, z)
+        paths = []
+        for schema_path, counts in self.paths.items():
+            estimate = self.estimate(counts, z)
+            estimate["schema_path"] = schema_path
+            estimate["failures"] = sum(counts.values())
+            paths.append(estimate)
+        paths.sort(key=lambda entry: (-entry["rate"], entry["schema_path"]))
+        return {
+            "population": self.total,
+            "sampled": sum(self.sampled.values()),
+            "failures": sum(self.failures.values()),
+            "failure_rate": overall["rate"],
+            "interval": [overall["low"], overall["high"]],
+            "confidence": confidence,
+            "strata": {
+                stratum: {
+                    "population": population,
+                    "sampled": self.sampled[stratum],
+                    "failures": self.failures[stratum],
+                }
+                for stratum, population in sorted(self.populations.items())
+            },
+            "schema_paths": paths,
+        }
+
+
+def sample_corpus(
+    source: Union[str, Path, Iterable[Dict[str, Any]]],
+    precision: float = 0.01,
+    confidence: float = 0.95,
+    max_seconds: Optional[float] = None,
+    max_samples: Optional[int] = None,
+    batch_size: int = 200,
+    stratify: str = "size",
+    key: Optional[Callable[[Dict[str, Any]], str]] = None,
+    workers: Optional[int] = 1,
+    schema_path: Optional[Path] = None,
+    seed: Optional[int] = None,
+    reservoir: int = 100000,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate how many resumes of a corpus fail validation.
+
+    Args:
+        source: Directory, NDJSON file, single file or iterable of resume dicts
+        precision: Stop once the overall interval's half-width is at most this
+        confidence: Confidence level of the intervals
+        max_seconds: Stop after this much time
+        max_samples: Stop once this many resumes were validated (a round
+                     may overshoot by a few to cover every stratum)
+        batch_size: Resumes validated per round
+        stratify: ``size``, ``directory`` or ``none`` for files and lines
+        key: Stratum of a resume dict, for iterable sources
+        workers: Number of worker processes (None: CPU count)
+        schema_path: Optional custom schema file
+        seed: Seed for reproducible samples
+        reservoir: Resumes kept per stratum from iterable sources
+        progress: Called with the current report after every round
+
+    Returns:
+        Report with ``population``, ``sampled``, ``failures``,
+        ``failure_rate``, ``interval``, per-stratum counts, per-path
+        estimates (``schema_paths``: ``schema_path``, ``rate``, ``low``,
+        ``high``, ``failures``), ``elapsed``, ``complete`` (every resume was
+        validated) and ``stopped`` (``precision``, ``time``, ``samples``,
+        ``complete``, or ``exhausted`` when every resume kept in the
+        reservoir of an iterable source was validated but the source held
+        more)
+    """
+    started = time.monotonic()
+    rng = random.Random(seed)
+    strata, populations = _population(source, stratify, key, reservoir, rng)
+    for items in strata.values():
+        rng.shuffle(items)
+    estimate = StratifiedEstimate(populations)
+    cursors = {stratum: 0 for stratum in strata}
+    remaining = sum(len(items) for items in strata.values())
+
+    schema_arg = str(schema_path) if schema_path else None
+    # Running out of items is only "complete" if no reservoir dropped any
+    stopped = "exhausted"
+    report: Dict[str, Any] = estimate.report(confidence)
+    with WorkerPool(workers, make_validators, (schema_arg,)) as pool:
+        while remaining:
+            round_size = batch_size
+            if max_samples is not None:
+                round_size = min(round_size, max_samples - report["sampled"])
+            # Proportional allocation, at least two per stratum so each has a variance
+            tasks: List[Tuple[str, Item]] = []
+            for stratum, items in strata.items():
+                share = populations[stratum] / estimate.total
+                want = max(2, math.ceil(round_size * share))
+                start = cursors[stratum]
+                batch = items[start:start + want]
+                cursors[stratum] = start + len(batch)
+                tasks.extend((stratum, item) for item in batch)
+            remaining -= len(tasks)
+
+            results = pool.map(_validate_in_worker, tasks, chunksize=8, ordered=False)
+            for stratum, schema_paths in results:
+                estimate.add(stratum, schema_paths)
+
+            report = estimate.report(confidence)
+            report["elapsed"] = time.monotonic() - started
+            if progress is not None:
+                progress(report)
+            if not remaining:
+                break
+            if (report["interval"][1] - report["interval"][0]) / 2 <= precision:
+                stopped = "precision"
+                break
+            if max_seconds is not None and report["elapsed"] >= max_seconds:
+                stopped = "time"
+                break
+            if max_samples is not None and report["sampled"] >= max_samples:
+                stopped = "samples"
+                break
+
+    report["elapsed"] = time.monotonic() - started
+    report["complete"] = report["sampled"] == estimate.total
+    report["stopped"] = "complete" if report["complete"] else stopped
+    return report
+
+
+def format_report(report: Dict[str, Any], top: int = 10) -> str:
+    """Render a sampling report as text."""
+
+    def percent(value: float) -> str:
+        return f"{value * 100:.2f}%"
+
+    low, high = report["interval"]
+    lines = [
+        f"sampled {report['sampled']} of {report['population']} resumes "
+        f"in {report['elapsed']:.1f}s (stopped: {report['stopped']})",
+        f"estimated failure rate {percent(report['failure_rate'])} "
+        f"[{percent(low)}, {percent(high)}] at {report['confidence']:.0%} confidence",
+    ]
+    if report["schema_paths"]:
+        lines.append("")
+        lines.append("by schema path:")
+        for entry in report["schema_paths"][:top]:
+            lines.append(
+                f"  {percent(entry['rate']):>8} [{percent(entry['low'])}, {percent(entry['high'])}]"
+                f"  {entry['schema_path']}"
+            )
+    return "\n".join(lines)
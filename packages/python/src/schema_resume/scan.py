@@ -0,0 +1,367 @@
+"""Resumable directory-tree scanner for resume corpora."""
+
+import fnmatch
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .aggregate import ErrorAggregator
+from .validator import ResumeValidator, error_entry
+from .workers import WorkerPool, make_validators, worker_state
+
+DEFAULT_PATTERNS = ("*.json", "*.xml")
+
+# Expected-error sidecars of fixtures (see schema_resume.fixtures), not resumes
+ERRORS_SUFFIX = ".errors.json"
+DEFAULT_EXCLUDE = ("*" + ERRORS_SUFFIX,)
+DEFAULT_CHECKPOINT = ".schema-resume-scan.sqlite"
+
+# Paths per checkpoint query (below SQLite's default limit of 999 parameters)
+_LOOKUP_BATCH = 500
+
+# (path, size, mtime_ns)
+FileEntry = Tuple[str, int, int]
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    valid INTEGER NOT NULL,
+    errors TEXT NOT NULL,
+    scanned_at REAL NOT NULL
+)
+"""
+
+
+def iter_files(
+    root: Union[str, Path],
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+) -> Iterator[FileEntry]:
+    """
+    Recursively enumerate files below ``root`` using ``os.scandir``.
+
+    Hidden directories (names starting with ``.``) are skipped.
+
+    Args:
+        root: Directory to walk
+        patterns: Glob patterns matched against file names
+        exclude: Glob patterns of file names to leave out (default:
+                 ``*.errors.json`` fixture sidecars)
+
+    Yields:
+        ``(path, size, mtime_ns)`` tuples
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith("."):
+                                stack.append(entry.path)
+                        elif (
+                            entry.is_file()
+                            and any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns)
+                            and not any(fnmatch.fnmatch(entry.name, pattern) for pattern in exclude)
+                        ):
+                            stat = entry.stat()
+                            yield entry.path, stat.st_size, stat.st_mtime_ns
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def validate_file(
+    validator: ResumeValidator,
+    path: str,
+    known_digest: Optional[str] = None,
+    use_hash: bool = False,
+) -> Dict[str, Any]:
+    """
+    Validate a single JSON or XML file.
+
+    Args:
+        validator: Validator to use
+        path: File to validate
+        known_digest: SHA-256 recorded by a previous run, if any
+        use_hash: Whether to hash the file contents
+
+    Returns:
+        Dictionary with ``valid``, ``errors``, ``sha256`` and ``unchanged``
+        (true when the content hash equals ``known_digest``; the file is
+        then not validated again)
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as exc:
+        errors = [error_entry(str(exc))]
+        return {"valid": False, "errors": errors, "sha256": None, "unchanged": False}
+
+    digest = hashlib.sha256(data).hexdigest() if use_hash else None
+    if digest is not None and digest == known_digest:
+        return {"valid": None, "errors": [], "sha256": digest, "unchanged": True}
+
+    if path.endswith(".xml"):
+        try:
+            result = validator.validate_xml(data)
+        except ImportError as exc:
+            result = {"valid": False, "errors": [error_entry(str(exc), "xml")]}
+    else:
+        try:
+            result = validator.validate(data)
+        except (ValueError, RecursionError) as exc:
+            result = {"valid": False, "errors": [error_entry(f"Invalid JSON: {exc}", "json")]}
+
+    result["sha256"] = digest
+    result["unchanged"] = False
+    return result
+
+
+def _scan_one(task: Tuple[FileEntry, Optional[str], bool]) -> Tuple[FileEntry, Dict[str, Any]]:
+    """Worker entry point: validate one file with the process-wide validator."""
+    entry, known_digest, use_hash = task
+    (validator,) = worker_state()
+    return entry, validate_file(validator, entry[0], known_digest, use_hash)
+
+
+class Checkpoint:
+    """SQLite record of files already scanned, used to resume interrupted runs."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open (or create) a checkpoint database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(_CHECKPOINT_SCHEMA)
+        self._pending: List[Tuple[Any, ...]] = []
+
+    def lookup(self, paths: Sequence[str]) -> Dict[str, Tuple[int, int, Optional[str], bool]]:
+        """
+        Return ``{path: (size, mtime_ns, sha256, valid)}`` for the recorded files among ``paths``.
+
+        Call with batches of a few hundred paths: the whole checkpoint is
+        never loaded at once.
+        """
+        found: Dict[str, Tuple[int, int, Optional[str], bool]] = {}
+        for start in range(0, len(paths), _LOOKUP_BATCH):
+            batch = paths[start:start + _LOOKUP_BATCH]
+            cursor = self.connection.execute(
+                "SELECT path, size, mtime_ns, sha256, valid FROM files "
+                f"WHERE path IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for row in cursor:
+                found[row[0]] = (row[1], row[2], row[3], bool(row[4]))
+        return found
+
+    def errors(self, path: str) -> List[Dict[str, Any]]:
+        """Return the errors recorded for a file."""
+        row = self.connection.execute("SELECT errors FROM files WHERE path = ?", (path,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def record(self, entry: FileEntry, result: Dict[str, Any]) -> None:
+        """Queue a scanned file for the next :meth:`flush`."""
+        path, size, mtime_ns = entry
+        self._pending.append(
+            (
+                path,
+                size,
+                mtime_ns,
+                result.get("sha256"),
+                1 if result["valid"] else 0,
+                json.dumps(result["errors"], default=str),
+                time.time(),
+            )
+        )
+
+    def touch(self, entry: FileEntry) -> None:
+        """Update size and mtime of a file whose content hash did not change."""
+        path, size, mtime_ns = entry
+        self.connection.execute(
+            "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, path)
+        )
+
+    def flush(self) -> None:
+        """Write queued records in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending
+            )
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush pending records and close the database."""
+        self.flush()
+        self.connection.close()
+
+
+class ScanStats:
+    """Counters and throughput of a scan run."""
+
+    def __init__(self) -> None:
+        self.discovered = 0
+        self.skipped = 0
+        self.skipped_invalid = 0
+        self.scanned = 0
+        self.valid = 0
+        self.invalid = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def failed(self) -> int:
+        """Invalid files, including skipped files that failed in an earlier run."""
+        return self.invalid + self.skipped_invalid
+
+    @property
+    def files_per_second(self) -> float:
+        """Files validated per second."""
+        return self.scanned / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Megabytes validated per second."""
+        return self.bytes / 1e6 / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "discovered": self.discovered,
+            "skipped": self.skipped,
+            "skipped_invalid": self.skipped_invalid,
+            "scanned": self.scanned,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "bytes": self.bytes,
+            "elapsed": round(self.elapsed, 3),
+            "files_per_second": round(self.files_per_second, 1),
+            "megabytes_per_second": round(self.megabytes_per_second, 2),
+        }
+
+
+def scan_directory(
+    root: Union[str, Path],
+    checkpoint: Optional[Union[str, Path]] = None,
+    workers: Optional[int] = None,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    use_hash: bool = False,
+    schema_path: Optional[Path] = None,
+    aggregator: Optional[ErrorAggregator] = None,
+    progress: Optional[Callable[[ScanStats], None]] = None,
+    batch_size: int = 500,
+) -> ScanStats:
+    """
+    Validate every matching file below ``root``.
+
+    Files are scheduled largest first, in small chunks per worker, so that
+    big documents do not end up as stragglers. Completed files are written
+    to a SQLite checkpoint in batches; on the next run files whose size and
+    mtime are unchanged are skipped, and with ``use_hash`` files whose
+    content hash is unchanged are skipped as well. Skipped files that were
+    invalid are counted in ``skipped_invalid`` (and their recorded errors
+    are passed to ``aggregator``), so :attr:`ScanStats.failed` covers the
+    whole tree.
+
+    Args:
+        root: Directory to scan
+        checkpoint: SQLite checkpoint file (default ``.schema-resume-scan.sqlite``
+                    inside ``root``)
+        workers: Number of worker processes (default: CPU count, 1 disables
+                 multiprocessing)
+        patterns: Glob patterns of files to validate
+        use_hash: Also compare SHA-256 content hashes with the checkpoint
+        schema_path: Optional custom schema file
+        aggregator: Optional aggregator receiving every validation result
+        progress: Optional callback invoked with the running stats
+        batch_size: Number of results written per checkpoint transaction
+
+    Returns:
+        Statistics of the run
+    """
+    stats = ScanStats()
+    store = Checkpoint(checkpoint or Path(root) / DEFAULT_CHECKPOINT)
+
+    def skip(path: str, valid: bool) -> None:
+        stats.skipped += 1
+        if not valid:
+            stats.skipped_invalid += 1
+            if aggregator is not None:
+                aggregator.add(path, {"valid": False, "errors": store.errors(path)})
+
+    try:
+        tasks: List[Tuple[FileEntry, Optional[str], bool]] = []
+        files = iter_files(root, patterns)
+        while True:
+            entries = list(itertools.islice(files, _LOOKUP_BATCH))
+            if not entries:
+                break
+            stats.discovered += len(entries)
+            known = store.lookup([entry[0] for entry in entries])
+            for entry in entries:
+                previous = known.get(entry[0])
+                if previous is not None and previous[0] == entry[1] and previous[1] == entry[2]:
+                    skip(entry[0], previous[3])
+                    continue
+                tasks.append((entry, previous[2] if previous else None, use_hash))
+        tasks.sort(key=lambda task: task[0][1], reverse=True)
+
+        schema_arg = str(schema_path) if schema_path else None
+
+        with WorkerPool(
+            workers if len(tasks) > 1 else 1, make_validators, (schema_arg,)
+        ) as pool:
+            # Chunks amortize the per-task IPC; small enough to keep big files first
+            chunksize = max(1, min(32, len(tasks) // (pool.workers * 8)))
+            results = pool.map(_scan_one, tasks, chunksize=chunksize, ordered=False)
+            for count, (entry, result) in enumerate(results, 1):
+                if result["unchanged"]:
+                    store.touch(entry)
+                    skip(entry[0], store.lookup([entry[0]])[entry[0]][3])
+                else:
+                    stats.scanned += 1
+                    stats.bytes += entry[1]
+                    if result["valid"]:
+                        stats.valid += 1
+                    else:
+                        stats.invalid += 1
+                    store.record(entry, result)
+                    if aggregator is not None:
+                        aggregator.add(entry[0], result)
+                if count % batch_size == 0:
+                    store.flush()
+                    stats.elapsed = time.monotonic() - stats.started
+                    if progress is not None:
+                        progress(stats)
+    finally:
+        store.close()
+
+    stats.elapsed = time.monotonic() - stats.started
+    return stats
+
+
+def print_progress(stats: ScanStats) -> None:
+    """Progress callback writing a one-line status to stderr."""
+    sys.stderr.write(
+        f"\r{stats.scanned} scanned, {stats.skipped} skipped, {stats.failed} invalid "
+        f"({stats.files_per_second:.0f} files/s, {stats.megabytes_per_second:.1f} MB/s)"
+    )
+    sys.stderr.flush()
@@ -0,0 +1,236 @@
+"""Snapshot and restore of prepared validator state.
+
+A snapshot is a versioned :mod:`marshal` file in the user cache directory
+holding the source schema, its dereferenced and minified form (see
+:mod:`schema_resume.bundle`), the regular expressions it uses and the
+formats it checks. :func:`restore_validator` reuses it when the SHA-256 of
+the schema file, the package, ``jsonschema`` and Python versions all match,
+and rebuilds (and rewrites) it otherwise. ``marshal`` is used rather than
+``pickle`` because it is built in: restoring imports nothing that
+validating would not import anyway.
+
+Restoring takes about as long as preparing the bundled schema from scratch
+(well under a millisecond), so snapshots do not shorten start-up. Restored
+validators check the dereferenced schema, which makes each validation of a
+full resume about 10% faster. ``SCHEMA_RESUME_CACHE_DIR`` changes where
+snapshots are stored.
+"""
+
+import marshal
+import os
+import re
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+import jsonschema
+
+from . import __version__
+from .limits import ResumeLimits
+from .validator import ResumeValidator
+
+SNAPSHOT_FORMAT = 1
+
+
+def cache_dir() -> Path:
+    """
+    Return the directory snapshots are stored in.
+
+    ``$SCHEMA_RESUME_CACHE_DIR`` if set, otherwise ``schema-resume`` under
+    the platform's user cache directory (``$XDG_CACHE_HOME`` or
+    ``~/.cache`` on Linux, ``~/Library/Caches`` on macOS,
+    ``%LOCALAPPDATA%`` on Windows).
+    """
+    override = os.environ.get("SCHEMA_RESUME_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "schema-resume"
+
+
+def _versions() -> Dict[str, Any]:
+    """Versions a snapshot is only valid for."""
+    # Identify the installed jsonschema by its files: looking up the
+    # distribution version through importlib.metadata costs more than the
+    # whole restore.
+    stat = os.stat(os.path.join(os.path.dirname(jsonschema.__file__), "validators.py"))
+    return {
+        "schema_resume": __version__,
+        "jsonschema": [os.path.dirname(jsonschema.__file__), stat.st_size, stat.st_mtime_ns],
+        "python": "%d.%d" % sys.version_info[:2],
+    }
+
+
+def _file_stat(path: Path) -> List[int]:
+    """Size and modification time of a file."""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _sha256(data: bytes) -> str:
+    """SHA-256 hex digest; ``hashlib`` is only imported when a hash is needed."""
+    import hashlib
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def _collect(node: Any, patterns: Set[str], formats: Set[str]) -> None:
+    """Collect the ``pattern`` and ``format`` values of a schema."""
+    if isinstance(node, dict):
+        if isinstance(node.get("pattern"), str):
+            patterns.add(node["pattern"])
+        if isinstance(node.get("format"), str):
+            formats.add(node["format"])
+        for key, value in node.items():
+            if key == "patternProperties" and isinstance(value, dict):
+                patterns.update(value)
+            if key not in ("enum", "const"):
+                _collect(value, patterns, formats)
+    elif isinstance(node, list):
+        for value in node:
+            _collect(value, patterns, formats)
+
+
+def snapshot_path(schema_path: Path, directory: Optional[Path] = None) -> Path:
+    """Return the snapshot file of a schema file."""
+    key = zlib.crc32(os.path.abspath(schema_path).encode("utf-8"))
+    return (directory or cache_dir()) / f"validator.{key:08x}.marshal"
+
+
+def save_snapshot(schema_path: Path, path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Prepare a schema file and write its snapshot.
+
+    The file is written next to ``path`` and renamed into place, so
+    concurrent processes never read a partial snapshot.
+
+    Args:
+        schema_path: Schema file
+        path: Snapshot file (default: :func:`snapshot_path` in :func:`cache_dir`)
+
+    Returns:
+        The snapshot payload
+    """
+    import json
+
+    from .bundle import dereference, minify
+
+    schema_path = Path(schema_path)
+    stat = _file_stat(schema_path)
+    data = schema_path.read_bytes()
+    schema = json.loads(data)
+    resolved = minify(dereference(schema))
+    patterns: Set[str] = set()
+    formats: Set[str] = set()
+    _collect(resolved, patterns, formats)
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "versions": _versions(),
+        "schema_stat": stat,
+        "schema_sha256": _sha256(data),
+        "schema": schema,
+        "resolved": resolved,
+        "patterns": sorted(patterns),
+        "formats": sorted(formats),
+    }
+
+    _write(payload, Path(path) if path else snapshot_path(schema_path))
+    return payload
+
+
+def _write(payload: Dict[str, Any], path: Path) -> None:
+    """Write a snapshot to a temporary file and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        marshal.dump(payload, f)
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: Union[str, Path], schema_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a snapshot if it is current for a schema file.
+
+    A snapshot is current if it was written by the same package, Python and
+    ``jsonschema`` versions and the schema's SHA-256 matches. The hash is
+    only recomputed when the schema file's size or modification time
+    changed; if it still matches, the snapshot is rewritten with the new
+    size and modification time so the next load skips the hash again.
+
+    Args:
+        path: Snapshot file
+        schema_path: Schema file the snapshot must match
+
+    Returns:
+        The payload, or None if the file is missing, unreadable or stale
+    """
+    try:
+        with open(path, "rb") as f:
+            # One read: marshal.load() on a file object reads in small chunks
+            payload = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != SNAPSHOT_FORMAT
+        or payload.get("versions") != _versions()
+    ):
+        return None
+    stat = _file_stat(schema_path)
+    if payload.get("schema_stat") != stat:
+        if payload.get("schema_sha256") != _sha256(Path(schema_path).read_bytes()):
+            return None
+        payload["schema_stat"] = stat
+        try:
+            _write(payload, Path(path))
+        except OSError:
+            pass  # the snapshot is still usable, only the next load hashes again
+    return payload
+
+
+def _from_payload(payload: Dict[str, Any], limits: Optional[ResumeLimits]) -> ResumeValidator:
+    """Build a validator from snapshot state."""
+    for pattern in payload["patterns"]:
+        re.compile(pattern)
+    validator = ResumeValidator.__new__(ResumeValidator)
+    validator.schema_dir = Path(__file__).parent / "schemas"
+    validator._setup(
+        payload["schema"], limits, resolved=payload["resolved"], formats=payload["formats"]
+    )
+    return validator
+
+
+def restore_validator(
+    schema_path: Optional[Path] = None,
+    limits: Optional[ResumeLimits] = None,
+    directory: Optional[Path] = None,
+) -> ResumeValidator:
+    """
+    Create a validator from its snapshot, writing the snapshot if needed.
+
+    Failing to write the snapshot (e.g. on a read-only file system) is not
+    an error; the validator is then prepared without it.
+
+    Args:
+        schema_path: Optional path to custom schema file
+        limits: Optional size, depth and time limits for untrusted input
+        directory: Snapshot directory (default: :func:`cache_dir`)
+
+    Returns:
+        A ready-to-use validator, equivalent to ``ResumeValidator(schema_path)``
+    """
+    source = Path(schema_path or Path(__file__).parent / "schemas" / "schema.json")
+    path = snapshot_path(source, directory)
+    payload = load_snapshot(path, source)
+    if payload is None:
+        try:
+            payload = save_snapshot(source, path)
+        except OSError:
+            return ResumeValidator(schema_path, limits)
+    return _from_payload(payload, limits)
@@ -2,48 +2,185 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import jsonschema
 from jsonschema import Draft7Validator, validators
 
+from .exceptions import LimitExceededError
+from .limits import Budget, ResumeLimits, check_bytes, check_document, limit_error, read_limited
+
+
+def error_entry(message: str, validator: str = "io") -> Dict[str, Any]:
+    """
+    Build an error entry for a document that could not be validated at all.
+
+    The entry has the same keys as schema errors, with ``/`` as path and
+    schema path, so reports and aggregators handle both alike.
+
+    Args:
+        message: Error message
+        validator: Error kind, e.g. ``io``, ``json`` or ``xml``
+
+    Returns:
+        Error dictionary
+    """
+    return {
+        "path": "/",
+        "message": message,
+        "schema_path": "/",
+        "validator": validator,
+        "validator_value": None,
+    }
+
 
 class ResumeValidator:
     """Validator for Schema Resume JSON documents."""
 
-    def __init__(self, schema_path: Optional[Path] = None) -> None:
+    def __init__(
+        self, schema_path: Optional[Path] = None, limits: Optional[ResumeLimits] = None
+    ) -> None:
         """
         Initialize the resume validator.
 
         Args:
             schema_path: Optional path to custom schema file. If not provided,
                         uses the bundled schema.
+            limits: Optional size, depth and time limits for untrusted input.
+                    Inputs exceeding a limit are rejected with a structured
+                    error instead of being parsed or validated in full.
         """
         self.schema_dir = Path(__file__).parent / "schemas"
         
         if schema_path:
-            self.schema = self._load_json(schema_path)
+            schema = self._load_json(schema_path)
         else:
-            self.schema = self._load_json(self.schema_dir / "schema.json")
-        
-        self.meta_schema = self._load_json(self.schema_dir / "meta-schema.json")
-        self.context = self._load_json(self.schema_dir / "context.jsonld")
-        
+            schema = self._load_json(self.schema_dir / "schema.json")
+        self._setup(schema, limits)
+
+    def _setup(
+        self,
+        schema: Dict[str, Any],
+        limits: Optional[ResumeLimits],
+        resolved: Optional[Dict[str, Any]] = None,
+        formats: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Build the compiled validator state for ``schema``.
+
+        Args:
+            schema: The schema, as returned by :meth:`get_schema`
+            limits: Optional size, depth and time limits
+            resolved: Equivalent dereferenced schema to validate with instead
+            formats: Only set up checkers for these formats
+        """
+        self.schema = schema
+        self._meta_schema: Optional[Dict[str, Any]] = None
+        self._context: Optional[Dict[str, Any]] = None
+
         # Create validator with format checking
-        format_checker = jsonschema.FormatChecker()
-        self.validator = Draft7Validator(self.schema, format_checker=format_checker)
+        if formats is not None:
+            formats = [name for name in formats if name in jsonschema.FormatChecker.checkers]
+        format_checker = jsonschema.FormatChecker(formats)
+        self.validator = Draft7Validator(resolved or self.schema, format_checker=format_checker)
+        self._xml_schema: Any = None
+        self.limits = limits
+        self._root_validator: Any = None
+
+    @classmethod
+    def from_bundle(
+        cls,
+        bundle_path: Union[str, Path],
+        expected_hash: Optional[str] = None,
+        limits: Optional[ResumeLimits] = None,
+    ) -> "ResumeValidator":
+        """
+        Create a validator from a prebuilt schema bundle.
+
+        Bundles are written by ``schema-resume bundle`` (see
+        :mod:`schema_resume.bundle`): the schema is already dereferenced and
+        minified, and the ``.pickle`` form skips JSON decoding altogether.
+        Pin ``expected_hash`` or only load pickled bundles from trusted
+        locations.
+
+        Args:
+            bundle_path: ``.min.json`` or ``.pickle`` bundle file
+            expected_hash: Optional SHA-256 (or a prefix of at least 12 hex
+                           digits) of the bundle file, checked before it is
+                           decoded
+            limits: Optional size, depth and time limits for untrusted input
+
+        Returns:
+            A ready-to-use validator
+        """
+        from .bundle import load_bundle
+
+        validator = cls.__new__(cls)
+        validator.schema_dir = Path(__file__).parent / "schemas"
+        validator._setup(load_bundle(bundle_path, expected_hash), limits)
+        return validator
+
+    @classmethod
+    def with_extensions(
+        cls, *extensions: Union[str, Path, Dict[str, Any]], limits: Optional[ResumeLimits] = None
+    ) -> "ResumeValidator":
+        """
+        Get a validator for the bundled schema with extension schemas overlaid.
+
+        The validator is built once per combination and shared; see
+        :mod:`schema_resume.extensions` for how extensions are merged.
+
+        Args:
+            extensions: Extension schemas (dicts or JSON file paths), in order
+            limits: Optional size, depth and time limits for untrusted input
+
+        Returns:
+            A cached, shared validator
+        """
+        from .extensions import extended_validator
+
+        return extended_validator(*extensions, limits=limits)
+
+    @property
+    def meta_schema(self) -> Dict[str, Any]:
+        """The meta-schema, loaded on first access."""
+        if self._meta_schema is None:
+            self._meta_schema = self._load_json(self.schema_dir / "meta-schema.json")
+        return self._meta_schema
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """The JSON-LD context, loaded on first access."""
+        if self._context is None:
+            self._context = self._load_json(self.schema_dir / "context.jsonld")
+        return self._context
+
+    @property
+    def xml_schema(self) -> Any:
+        """
+        The compiled XSD used by :meth:`validate_xml` (an ``lxml.etree.XMLSchema``).
+
+        None until the bundled XSD is compiled on first use; assign a
+        compiled schema to validate against another XSD, or None to return
+        to the bundled one.
+        """
+        return self._xml_schema
+
+    @xml_schema.setter
+    def xml_schema(self, schema: Any) -> None:
+        self._xml_schema = schema
 
     def _load_json(self, path: Path) -> Dict[str, Any]:
         """Load JSON file from path."""
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
-    def validate(self, resume: Union[Dict[str, Any], str, Path]) -> Dict[str, Any]:
+    def validate(self, resume: Union[Dict[str, Any], str, bytes, Path]) -> Dict[str, Any]:
         """
         Validate a resume document.
 
         Args:
-            resume: Resume data as dict, JSON string, or path to JSON file
+            resume: Resume data as dict, JSON string or bytes, or path to JSON file
 
         Returns:
             Dictionary with validation results:
@@ -55,8 +192,13 @@ class ResumeValidator:
         Raises:
             ValueError: If resume data is invalid
         """
+        if self.limits is not None:
+            return self._validate_limited(resume, self.limits)
+
         # Load resume data
-        if isinstance(resume, (str, Path)):
+        if isinstance(resume, (bytes, bytearray)):
+            resume_data = json.loads(resume)
+        elif isinstance(resume, (str, Path)):
             if isinstance(resume, str) and resume.strip().startswith("{"):
                 # JSON string
                 resume_data = json.loads(resume)
@@ -74,6 +216,98 @@ class ResumeValidator:
             "errors": [self._format_error(error) for error in errors]
         }
 
+    def _validate_limited(
+        self, resume: Union[Dict[str, Any], str, bytes, Path], limits: ResumeLimits
+    ) -> Dict[str, Any]:
+        """Validate while enforcing limits; a violation becomes the last error."""
+        budget = limits.budget()
+        errors: List[Dict[str, Any]] = []
+        try:
+            if isinstance(resume, (bytes, bytearray)):
+                check_bytes(bytes(resume), limits)
+                resume_data = json.loads(resume)
+            elif isinstance(resume, str) and resume.strip().startswith("{"):
+                data = resume.encode("utf-8")
+                check_bytes(data, limits)
+                resume_data = json.loads(data)
+            elif isinstance(resume, (str, Path)):
+                path = Path(resume)
+                if limits.max_bytes is not None and path.stat().st_size > limits.max_bytes:
+                    raise LimitExceededError("max_bytes", limits.max_bytes)
+                with open(path, "rb") as f:
+                    resume_data = json.loads(read_limited(f, limits, budget))
+            else:
+                resume_data = resume
+
+            check_document(resume_data, limits)
+            budget.check()
+            for error in self._iter_errors_budgeted(resume_data, budget):
+                errors.append(self._format_error(error))
+        except LimitExceededError as exc:
+            errors.append(limit_error(exc))
+
+        return {"valid": len(errors) == 0, "errors": errors}
+
+    def _iter_errors_budgeted(
+        self, resume_data: Any, budget: Budget
+    ) -> Iterator[jsonschema.ValidationError]:
+        """
+        Yield validation errors section by section, checking the budget in between.
+
+        Produces the same errors as ``iter_errors`` on the whole document.
+        """
+        # The schema the validator is rooted at: the dereferenced one if given
+        schema = self.validator.schema
+        properties = schema.get("properties")
+        open_schema = schema.get("additionalProperties", True) is True and (
+            "patternProperties" not in schema
+        )
+        if not isinstance(resume_data, dict) or not isinstance(properties, dict) or not open_schema:
+            for error in self.validator.iter_errors(resume_data):
+                yield error
+                budget.check()
+            return
+
+        if self._root_validator is None:
+            root = {key: value for key, value in schema.items() if key != "properties"}
+            self._root_validator = self.validator.evolve(schema=root)
+        yield from self._root_validator.iter_errors(resume_data)
+
+        for key, value in resume_data.items():
+            subschema = properties.get(key)
+            if subschema is None:
+                continue
+            budget.check("/" + key)
+            items = subschema.get("items") if isinstance(subschema, dict) else None
+            if isinstance(value, list) and isinstance(items, dict):
+                # Validate array sections item by item so that one huge
+                # section cannot run past the budget.
+                array_schema = {k: v for k, v in subschema.items() if k != "items"}
+                section_errors = self._iter_items(value, array_schema, items, budget, key)
+            else:
+                section_errors = self.validator.descend(value, subschema, path=key, schema_path=key)
+            for error in section_errors:
+                error.relative_schema_path.appendleft("properties")
+                yield error
+
+    def _iter_items(
+        self,
+        value: List[Any],
+        array_schema: Dict[str, Any],
+        items: Dict[str, Any],
+        budget: Budget,
+        key: str,
+    ) -> Iterator[jsonschema.ValidationError]:
+        """Yield errors of one array section, checking the budget per item."""
+        yield from self.validator.descend(value, array_schema, path=key, schema_path=key)
+        for index, item in enumerate(value):
+            budget.check(f"/{key}/{index}")
+            for error in self.validator.descend(item, items, path=index):
+                error.relative_schema_path.appendleft("items")
+                error.relative_schema_path.appendleft(key)
+                error.relative_path.appendleft(key)
+                yield error
+
     def _format_error(self, error: jsonschema.ValidationError) -> Dict[str, Any]:
         """Format validation error for output."""
         return {
@@ -84,6 +318,58 @@ class ResumeValidator:
             "validator_value": error.validator_value,
         }
 
+    def validate_xml(self, resume: Union[bytes, str, Path]) -> Dict[str, Any]:
+        """
+        Validate an XML resume against the bundled XSD (or :attr:`xml_schema`).
+
+        Requires the optional ``lxml`` dependency
+        (``pip install schema-resume-validator[xml]``).
+
+        Args:
+            resume: XML document as bytes, XML string, or path to XML file
+
+        Returns:
+            Dictionary with validation results in the same shape as
+            :meth:`validate`
+
+        Raises:
+            ImportError: If lxml is not installed
+        """
+        try:
+            from lxml import etree
+        except ImportError as exc:
+            raise ImportError(
+                "XML validation requires lxml: pip install schema-resume-validator[xml]"
+            ) from exc
+
+        if self._xml_schema is None:
+            self._xml_schema = etree.XMLSchema(
+                etree.parse(str(self.schema_dir / "schema-resume.xsd"))
+            )
+
+        try:
+            if isinstance(resume, bytes):
+                document = etree.fromstring(resume)
+            elif isinstance(resume, str) and resume.lstrip().startswith("<"):
+                document = etree.fromstring(resume.encode("utf-8"))
+            else:
+                document = etree.parse(str(resume))
+        except etree.XMLSyntaxError as exc:
+            return {"valid": False, "errors": [error_entry(f"Invalid XML: {exc}", "xml")]}
+
+        self._xml_schema.validate(document)
+        errors = [
+            {
+                "path": entry.path or "/",
+                "message": entry.message,
+                "schema_path": "/",
+                "validator": "xsd",
+                "validator_value": entry.type_name,
+            }
+            for entry in self._xml_schema.error_log
+        ]
+        return {"valid": len(errors) == 0, "errors": errors}
+
     def get_schema(self) -> Dict[str, Any]:
         """Get the JSON Schema."""
         return self.schema
@@ -97,10 +383,16 @@ class ResumeValidator:
         return self.context
 
 
+_default: Optional[ResumeValidator] = None
+
+
 def validate_resume(resume: Union[Dict[str, Any], str, Path]) -> Dict[str, Any]:
     """
     Convenience function to validate a resume.
 
+    Uses the preloaded validator if there is one (see
+    :mod:`schema_resume.preload`), otherwise one validator per process.
+
     Args:
         resume: Resume data as dict, JSON string, or path to JSON file
 
@@ -112,5 +404,13 @@ def validate_resume(resume: Union[Dict[str, Any], str, Path]) -> Dict[str, Any]:
         >>> if result["valid"]:
         ...     print("Resume is valid!")
     """
-    validator = ResumeValidator()
+    from .preload import get_validator, is_preloaded
+
+    global _default
+    if is_preloaded():
+        validator = get_validator()
+    else:
+        if _default is None:
+            _default = ResumeValidator()
+        validator = _default
     return validator.validate(resume)
@@ -0,0 +1,297 @@
+"""Watch mode: re-lint schemas and re-run fixtures whenever a file changes.
+
+:class:`WatchSession` keeps everything that is expensive to rebuild in
+memory between runs:
+
+- a :class:`~schema_resume.lint.LintEngine`, whose parsed models and rule
+  results are keyed by content hash, so only the rules of changed files
+  (and of the schema sets containing them) run again;
+- one :class:`~schema_resume.validator.ResumeValidator` for the repository's
+  ``schema.json``, rebuilt only when ``schema.json`` changes, and the
+  compiled XSD, rebuilt only when the XSD changes;
+- the latest result of every fixture, keyed by the content hashes of the
+  fixture, its ``.errors.json`` sidecar and the schema it is validated
+  against (JSON fixtures against ``schema.json``, XML fixtures against the
+  XSD), so an XSD edit only re-runs XML fixtures.
+
+Changes are detected by polling the size and modification time of the
+watched files, which costs about a millisecond per poll for this
+repository and works the same on every platform. Only the files a poll
+reports as changed are hashed again.
+
+Example:
+    >>> session = WatchSession("/path/to/schema-resume", ["tests"])
+    >>> session.watch(lambda report: print(format_cycle(report)))
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .fixtures import ERRORS_SUFFIX, check_fixture, discover_fixtures
+from .lint import SCHEMA_FILES, LintEngine, discover_schema_sets, format_report
+from .validator import ResumeValidator, error_entry
+
+DEFAULT_INTERVAL = 0.25
+
+# path -> (size, mtime_ns)
+Snapshot = Dict[str, Tuple[int, int]]
+
+# Content hashes of a fixture, its sidecar and the schema it is checked against
+FixtureKey = Tuple[str, str, str]
+
+
+def _digest(path: Union[str, Path]) -> Optional[str]:
+    """SHA-256 of a file, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class WatchSession:
+    """Warm lint engine, validators and fixture results of a repository."""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = ".",
+        fixture_paths: Sequence[Union[str, Path]] = (),
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Args:
+            root: Repository root
+            fixture_paths: Fixture files or directories (default: ``tests``
+                           in ``root``, if it exists)
+            use_cache: Read and write the lint result cache
+        """
+        self.root = Path(root)
+        if not fixture_paths and (self.root / "tests").is_dir():
+            fixture_paths = [self.root / "tests"]
+        self.fixture_paths = [Path(path) for path in fixture_paths]
+        self.schema_path = self.root / SCHEMA_FILES["schema.json"]
+        self.xsd_path = self.root / SCHEMA_FILES["schema-resume.xsd"]
+        self.engine = LintEngine(self.root, use_cache=use_cache)
+
+        self.validator: Optional[ResumeValidator] = None
+        self.schema_error: Optional[str] = None
+        self.xsd_error: Optional[str] = None
+        self._xml_schema: Any = None
+        self._digests: Dict[str, Optional[str]] = {"schema.json": None, "xsd": None}
+        # fixture path -> (key, result)
+        self._fixture_results: Dict[str, Tuple[FixtureKey, Dict[str, Any]]] = {}
+        # file path -> SHA-256, until a poll reports the file as changed
+        self._file_digests: Dict[str, Optional[str]] = {}
+        self._snapshot: Snapshot = {}
+
+    def watched_files(self) -> List[Path]:
+        """Schema files of every schema set, fixtures and their sidecars."""
+        files = [
+            path for files in discover_schema_sets(self.root).values() for path in files.values()
+        ]
+        for fixture in discover_fixtures(self.fixture_paths):
+            path = Path(fixture["path"])
+            files.append(path)
+            files.append(path.with_name(path.stem + ERRORS_SUFFIX))
+        return files
+
+    def poll(self) -> List[str]:
+        """
+        Compare the watched files with the previous poll.
+
+        Returns:
+            Paths that were added, modified or removed since the last poll
+        """
+        snapshot: Snapshot = {}
+        for path in self.watched_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[str(path)] = (stat.st_size, stat.st_mtime_ns)
+        changed = [path for path, stat in snapshot.items() if self._snapshot.get(path) != stat]
+        changed.extend(path for path in self._snapshot if path not in snapshot)
+        self._snapshot = snapshot
+        return sorted(changed)
+
+    def _file_digest(self, path: Path) -> Optional[str]:
+        """SHA-256 of a file, hashed again only after it changed."""
+        key = str(path)
+        if key not in self._file_digests:
+            self._file_digests[key] = _digest(path)
+        return self._file_digests[key]
+
+    def _compile_xsd(self) -> Any:
+        """Compile the repository's XSD, or return None to use the bundled one."""
+        if not self.xsd_path.is_file():
+            return None
+        try:
+            from lxml import etree
+        except ImportError:
+            return None  # validate_xml reports the missing dependency per fixture
+        try:
+            return etree.XMLSchema(etree.parse(str(self.xsd_path)))
+        except (etree.XMLSyntaxError, etree.XMLSchemaParseError) as exc:
+            self.xsd_error = f"{self.xsd_path.name} does not compile: {exc}"
+            return None
+
+    def _refresh_validators(self) -> List[str]:
+        """Rebuild the JSON validator and the compiled XSD if their files changed."""
+        rebuilt = []
+        digest = self._file_digest(self.xsd_path) if self.xsd_path.is_file() else "bundled"
+        if digest != self._digests["xsd"]:
+            self._digests["xsd"] = digest
+            self.xsd_error = None
+            self._xml_schema = self._compile_xsd()
+            if self.validator is not None:
+                self.validator.xml_schema = self._xml_schema
+            rebuilt.append("xsd")
+
+        digest = self._file_digest(self.schema_path) if self.schema_path.is_file() else "bundled"
+        if digest != self._digests["schema.json"]:
+            self._digests["schema.json"] = digest
+            try:
+                self.validator = ResumeValidator(
+                    self.schema_path if self.schema_path.is_file() else None
+                )
+                self.validator.xml_schema = self._xml_schema
+                self.schema_error = None
+            except Exception as exc:  # invalid JSON or an invalid schema
+                self.validator = None
+                self.schema_error = f"{self.schema_path.name} does not compile: {exc}"
+            rebuilt.append("schema.json")
+        return rebuilt
+
+    def run(self, changed: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Lint the schema files and check the fixtures, reusing every result
+        whose inputs did not change.
+
+        Args:
+            changed: Paths that changed since the previous run; only these
+                     are hashed again (as reported by :meth:`poll`)
+
+        Returns:
+            Report dictionary with ``changed``, ``lint`` (see
+            :meth:`LintEngine.run`), ``rebuilt`` (``schema.json`` and/or
+            ``xsd``), ``schema_errors``, ``fixtures`` (results of
+            :func:`check_fixture`), ``fixtures_run``, ``fixtures_cached``
+            and ``elapsed`` (seconds)
+        """
+        started = time.perf_counter()
+        for changed_path in changed:
+            self._file_digests.pop(changed_path, None)
+        lint = self.engine.run()
+        rebuilt = self._refresh_validators()
+
+        results: List[Dict[str, Any]] = []
+        fixture_results: Dict[str, Tuple[FixtureKey, Dict[str, Any]]] = {}
+        fixtures_run = fixtures_cached = 0
+        for fixture in discover_fixtures(self.fixture_paths):
+            fixture_path = Path(fixture["path"])
+            target = "xsd" if fixture_path.suffix == ".xml" else "schema.json"
+            error = self.schema_error or (self.xsd_error if target == "xsd" else None)
+            if error or self.validator is None:
+                results.append(
+                    dict(
+                        fixture,
+                        passed=False,
+                        valid=False,
+                        errors=[error_entry(error or "", "schema")],
+                        missing_paths=[],
+                        elapsed=0.0,
+                    )
+                )
+                continue
+            sidecar = fixture_path.with_name(fixture_path.stem + ERRORS_SUFFIX)
+            key = (
+                self._file_digest(fixture_path) or "",
+                self._file_digest(sidecar) or "",
+                self._digests[target] or "",
+            )
+            cached = self._fixture_results.get(fixture["path"])
+            if cached is not None and cached[0] == key:
+                result = cached[1]
+                fixtures_cached += 1
+            else:
+                result = check_fixture(self.validator, fixture)
+                fixtures_run += 1
+            fixture_results[fixture["path"]] = (key, result)
+            results.append(result)
+        # Keep only the results of fixtures that still exist
+        self._fixture_results = fixture_results
+
+        schema_errors = [error for error in (self.schema_error, self.xsd_error) if error]
+        return {
+            "changed": list(changed),
+            "lint": lint,
+            "rebuilt": rebuilt,
+            "schema_errors": schema_errors,
+            "fixtures": results,
+            "fixtures_run": fixtures_run,
+            "fixtures_cached": fixtures_cached,
+            "elapsed": time.perf_counter() - started,
+        }
+
+    def watch(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        interval: float = DEFAULT_INTERVAL,
+        max_runs: Optional[int] = None,
+    ) -> None:
+        """
+        Run once, then again after every change, until interrupted.
+
+        Args:
+            callback: Called with the report of every run
+            interval: Seconds between polls
+            max_runs: Stop after this many runs (default: run forever)
+        """
+        runs = 0
+        changed = self.poll()
+        self._file_digests.clear()  # files may have changed since an earlier run
+        while True:
+            if changed or runs == 0:
+                callback(self.run(changed if runs else ()))
+                runs += 1
+                if max_runs is not None and runs >= max_runs:
+                    return
+            time.sleep(interval)
+            changed = self.poll()
+
+
+def format_cycle(report: Dict[str, Any], verbose: bool = False) -> str:
+    """Render the report of one watch run as text."""
+    lines = []
+    stamp = time.strftime("%H:%M:%S")
+    if report["changed"]:
+        names = ", ".join(os.path.basename(path) for path in report["changed"][:5])
+        more = len(report["changed"]) - 5
+        lines.append(f"[{stamp}] changed: {names}" + (f" and {more} more" if more > 0 else ""))
+    else:
+        lines.append(f"[{stamp}] initial run")
+    for error in report["schema_errors"]:
+        lines.append(f"❌ {error}")
+    lines.append(format_report(report["lint"], verbose=verbose))
+
+    failed = [result for result in report["fixtures"] if not result["passed"]]
+    for result in failed:
+        lines.append(f"  FAIL  {result['path']}")
+        schema_failed = result["errors"][:1] and result["errors"][0]["validator"] == "schema"
+        if result["expect_valid"] or schema_failed:
+            for error in result["errors"][:3]:
+                lines.append(f"          {error['path']}: {error['message']}")
+        if not result["expect_valid"] and result["valid"]:
+            lines.append("          expected validation to fail, but it passed")
+        for path in result["missing_paths"]:
+            lines.append(f"          expected an error at {path}")
+    rebuilt = f", rebuilt {' and '.join(report['rebuilt'])}" if report["rebuilt"] else ""
+    lines.append(
+        f"fixtures: {len(report['fixtures']) - len(failed)} passed, {len(failed)} failed "
+        f"({report['fixtures_run']} run, {report['fixtures_cached']} cached{rebuilt}) "
+        f"in {report['elapsed'] * 1000:.0f} ms"
+    )
+    return "\n".join(lines)
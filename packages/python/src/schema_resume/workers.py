@@ -0,0 +1,148 @@
+"""Process pools whose workers hold prepared state such as compiled validators.
+
+The corpus tools (scan, fixtures, sampling, dedup, ...) validate in worker
+processes that build their validator once and reuse it for every task.
+:class:`WorkerPool` starts such workers, or with ``workers <= 1`` builds the
+same state in the current process, so callers have a single code path::
+
+    with WorkerPool(workers, make_validators, (schema_path,)) as pool:
+        for result in pool.map(_check_one, tasks, chunksize=64):
+            ...
+
+Task functions get the state with :func:`worker_state`.
+"""
+
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .validator import ResumeValidator
+
+_state: Any = None
+
+
+def _init_state(factory: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+    """Pool initializer: build the per-process state."""
+    global _state
+    _state = factory(*args)
+
+
+def worker_state() -> Any:
+    """
+    Return the state built by the current process's :class:`WorkerPool` factory.
+
+    Raises:
+        RuntimeError: If no pool has initialized this process
+    """
+    if _state is None:
+        raise RuntimeError("worker_state() called outside of a WorkerPool worker")
+    return _state
+
+
+def make_validators(*schema_paths: Optional[str]) -> Tuple[ResumeValidator, ...]:
+    """
+    Factory building one validator per schema file (None: the bundled schema).
+
+    Schema paths are passed as strings so that they pickle cheaply.
+    """
+    return tuple(ResumeValidator(Path(path) if path else None) for path in schema_paths)
+
+
+class _Completed:
+    """Result of a task that already ran in-process, shaped like ``AsyncResult``."""
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+    def ready(self) -> bool:
+        return True
+
+    def get(self) -> Any:
+        return self._value
+
+
+class WorkerPool:
+    """A ``multiprocessing`` pool with per-worker state, or in-process execution."""
+
+    def __init__(
+        self, workers: Optional[int], factory: Callable[..., Any], args: Sequence[Any] = ()
+    ) -> None:
+        """
+        Args:
+            workers: Number of worker processes (None: CPU count; 1 or less
+                     runs tasks in the current process)
+            factory: Picklable callable building the state of each worker
+            args: Arguments of ``factory``
+        """
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        if self.workers <= 1:
+            _init_state(factory, tuple(args))
+            self._pool = None
+        else:
+            self._pool = multiprocessing.Pool(
+                self.workers, initializer=_init_state, initargs=(factory, tuple(args))
+            )
+
+    @property
+    def parallel(self) -> bool:
+        """Whether tasks run in worker processes."""
+        return self._pool is not None
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Lazily apply ``func`` to every item.
+
+        Args:
+            func: Picklable task function
+            iterable: Task arguments
+            chunksize: Tasks sent to a worker at a time
+            ordered: Yield results in input order (otherwise as completed)
+        """
+        if self._pool is None:
+            return map(func, iterable)
+        if ordered:
+            return self._pool.imap(func, iterable, chunksize)
+        return self._pool.imap_unordered(func, iterable, chunksize)
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` asynchronously.
+
+        Returns:
+            An object with ``ready()`` and ``get()``; in-process the task has
+            already run
+        """
+        if self._pool is None:
+            return _Completed(func(*args))
+        return self._pool.apply_async(func, args)
+
+    def close(self) -> None:
+        """Wait for submitted tasks to finish and stop the workers."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self) -> None:
+        """Stop the workers immediately, discarding outstanding tasks."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        # On an error or interrupt, do not wait for work nobody will collect
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -0,0 +1,86 @@
+"""Tests for the streaming error aggregator."""
+
+import io
+import json
+import time
+
+from schema_resume.aggregate import ErrorAggregator, normalize_path
+
+
+def _result(*paths):
+    return {
+        "valid": not paths,
+        "errors": [
+            {"path": path, "schema_path": "/type", "validator": "type", "message": "bad"}
+            for path in paths
+        ],
+    }
+
+
+def test_normalize_path_collapses_indices():
+    assert normalize_path("/work/3/highlights/12") == "/work/*/highlights/*"
+
+
+def test_groups_count_documents_and_errors():
+    aggregator = ErrorAggregator(seed=1)
+    aggregator.add("a", _result("/work/0/name", "/work/1/name"))
+    aggregator.add("b", _result("/work/2/name"))
+    aggregator.add("c", _result())
+    (group,) = aggregator.top()
+    assert (group["path"], group["documents"], group["errors"]) == ("/work/*/name", 2, 3)
+    assert (aggregator.documents, aggregator.invalid_documents, aggregator.errors) == (3, 2, 3)
+    assert sorted(group["samples"]) == ["a", "b"]
+
+
+def test_eviction_keeps_frequent_groups():
+    aggregator = ErrorAggregator(max_groups=3)
+    for i in range(50):
+        aggregator.add(i, _result("/frequent"))
+        aggregator.add(i, _result(f"/rare{i}"))
+    top = aggregator.top(1)[0]
+    assert (top["path"], top["documents"], top["overestimate"]) == ("/frequent", 50, 0)
+    assert len(aggregator.top()) == 3
+
+
+def test_eviction_removes_the_group_with_fewest_documents():
+    aggregator = ErrorAggregator(max_groups=3)
+    for count, path in ((5, "/a"), (2, "/b"), (7, "/c")):
+        for i in range(count):
+            aggregator.add(i, _result(path))
+    aggregator.add("x", _result("/d"))
+    rows = {row["path"]: row for row in aggregator.top()}
+    assert set(rows) == {"/a", "/c", "/d"}
+    assert (rows["/d"]["documents"], rows["/d"]["overestimate"]) == (3, 2)
+    # Counts of /a grew after it was pushed; the stale heap entry must not evict it
+    for i in range(10):
+        aggregator.add(i, _result("/a"))
+    aggregator.add("y", _result("/e"))
+    assert {row["path"] for row in aggregator.top()} == {"/a", "/c", "/e"}
+
+
+def test_eviction_does_not_scan_all_groups():
+    aggregator = ErrorAggregator(max_groups=20000, samples_per_group=0)
+    started = time.perf_counter()
+    for i in range(60000):
+        aggregator.add(i, _result(f"/p{i}"))
+    assert time.perf_counter() - started < 5
+    assert len(aggregator.top()) == 20000
+
+
+def test_merge_combines_partial_aggregates():
+    left, right = ErrorAggregator(seed=1), ErrorAggregator(seed=2)
+    left.add("a", _result("/x"))
+    right.add("b", _result("/x", "/y"))
+    left.merge(right)
+    rows = {row["path"]: row for row in left.top()}
+    assert rows["/x"]["documents"] == 2
+    assert rows["/y"]["documents"] == 1
+    assert left.documents == 2
+
+
+def test_write_json():
+    aggregator = ErrorAggregator()
+    aggregator.add("a", _result("/x"))
+    buffer = io.StringIO()
+    aggregator.write_json(buffer)
+    assert json.loads(buffer.getvalue())["groups"][0]["path"] == "/x"
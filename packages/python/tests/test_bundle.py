@@ -0,0 +1,74 @@
+"""Tests for schema bundles."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from schema_resume import ResumeValidator, SchemaError
+from schema_resume.bundle import content_hash, dereference, load_bundle, minify, write_bundle
+
+SCHEMA = Path(__file__).parents[1] / "src" / "schema_resume" / "schemas" / "schema.json"
+
+RESUMES = [
+    {"basics": {"name": "Jane", "email": "jane@example.com"}},
+    {"basics": {"name": 3}, "work": [{"startDate": "yesterday"}]},
+]
+
+
+def test_dereference_inlines_refs_and_keeps_recursive_ones():
+    schema = {
+        "properties": {"a": {"$ref": "#/definitions/leaf"}, "t": {"$ref": "#/definitions/tree"}},
+        "definitions": {
+            "leaf": {"type": "string"},
+            "tree": {"type": "array", "items": {"$ref": "#/definitions/tree"}},
+        },
+    }
+    result = dereference(schema)
+    assert result["properties"]["a"] == {"type": "string"}
+    assert result["properties"]["t"]["items"] == {"$ref": "#/definitions/tree"}
+    assert "tree" in result["definitions"]
+
+
+def test_minify_keeps_properties_named_like_annotations():
+    schema = {"title": "Root", "properties": {"description": {"description": "x"}}}
+    assert minify(schema) == {"title": "Root", "properties": {"description": {}}}
+
+
+@pytest.mark.parametrize("kind", ["json", "pickle"])
+def test_bundled_validator_reports_the_same_errors(tmp_path, kind):
+    written = write_bundle(SCHEMA, tmp_path)
+    path = written[kind]
+    digest = content_hash(path.read_bytes())
+    assert path.name == f"schema.{digest[:12]}.{'min.json' if kind == 'json' else 'pickle'}"
+    bundled = ResumeValidator.from_bundle(path, expected_hash=digest[:12])
+    source = ResumeValidator()
+    for resume in RESUMES:
+        assert bundled.validate(resume)["valid"] == source.validate(resume)["valid"]
+        assert len(bundled.validate(resume)["errors"]) == len(source.validate(resume)["errors"])
+
+
+def test_tampered_pickle_is_rejected_before_unpickling(tmp_path):
+    path = write_bundle(SCHEMA, tmp_path)["pickle"]
+    expected = content_hash(path.read_bytes())
+    # Not a pickle at all: loading it would raise an UnpicklingError
+    path.write_bytes(b"tampered")
+    with pytest.raises(SchemaError, match="hash mismatch"):
+        load_bundle(path, expected_hash=expected)
+
+
+def test_short_hash_pins_are_refused(tmp_path):
+    path = write_bundle(SCHEMA, tmp_path)["pickle"]
+    expected = content_hash(path.read_bytes())
+    for pin in ("", expected[:1], expected[:11]):
+        with pytest.raises(ValueError, match="at least 12"):
+            load_bundle(path, expected_hash=pin)
+    assert load_bundle(path, expected_hash=expected.upper()[:12])
+
+
+def test_tampered_json_is_rejected(tmp_path):
+    path = write_bundle(SCHEMA, tmp_path, compiled=False)["json"]
+    expected = content_hash(path.read_bytes())
+    path.write_text(json.dumps({"type": "object"}))
+    with pytest.raises(SchemaError):
+        load_bundle(path, expected_hash=expected)
@@ -0,0 +1,60 @@
+"""Tests for the schema-driven canonical form."""
+
+import pytest
+
+from schema_resume.bundle import resolve_pointer
+from schema_resume.canonical import Canonicalizer, normalize_text, normalize_uri
+from schema_resume.exceptions import SchemaError
+
+
+def test_normalize_text_and_uri():
+    assert normalize_text("  Jane \t  Doe\n") == "Jane Doe"
+    assert normalize_uri("HTTP://www.Example.com:80/path/#top") == "https://example.com/path"
+    assert normalize_uri("https://example.com:8443/") == "https://example.com:8443"
+    assert normalize_uri(" not a url ") == "not a url"
+
+
+def test_canonicalize_follows_the_schema():
+    canonicalizer = Canonicalizer(date_precision="month")
+    document = {
+        "basics": {"name": " Jane  Doe ", "email": "Jane@Example.COM", "url": "http://jane.dev/"},
+        "work": [{"name": "Acme", "startDate": "2020-03-15", "url": "https://www.acme.com"}],
+        "extra": {"email": "Not@Touched"},
+    }
+    assert canonicalizer.canonicalize(document) == {
+        "basics": {"name": "Jane Doe", "email": "jane@example.com", "url": "https://jane.dev"},
+        "work": [{"name": "Acme", "startDate": "2020-03", "url": "https://acme.com"}],
+        "extra": {"email": "Not@Touched"},
+    }
+    assert document["basics"]["name"] == " Jane  Doe "
+
+
+def test_equal_resumes_hash_alike():
+    canonicalizer = Canonicalizer(date_precision="year")
+    a = {"basics": {"name": "Jane"}, "work": [{"startDate": "2020-01-01"}]}
+    b = {"work": [{"startDate": "2020-06"}], "basics": {"name": " Jane "}}
+    assert canonicalizer.canonical_bytes(a) == canonicalizer.canonical_bytes(b)
+    assert canonicalizer.canonical_hash(a) == canonicalizer.canonical_hash(b)
+
+
+def test_recursive_references_terminate():
+    schema = {
+        "definitions": {"node": {"type": "object", "properties": {
+            "url": {"type": "string", "format": "uri"},
+            "child": {"$ref": "#/definitions/node"},
+        }}},
+        "$ref": "#/definitions/node",
+    }
+    canonical = Canonicalizer(schema).canonicalize(
+        {"url": "HTTP://A.com/", "child": {"url": "HTTP://B.com/", "child": {"url": " x "}}}
+    )
+    assert canonical["url"] == "https://a.com"
+    # A reference back into itself gets the generic string treatment
+    assert canonical["child"] == {"url": "HTTP://B.com/", "child": {"url": "x"}}
+
+
+def test_resolve_pointer():
+    schema = {"definitions": {"a/b": {"items": [{"type": "string"}]}}}
+    assert resolve_pointer(schema, "#/definitions/a~1b/items/0") == {"type": "string"}
+    with pytest.raises(SchemaError):
+        resolve_pointer(schema, "#/definitions/missing")
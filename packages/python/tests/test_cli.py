@@ -0,0 +1,127 @@
+"""Tests for the schema-resume command line."""
+
+import json
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from schema_resume import __version__
+from schema_resume.cli import main
+from schema_resume.lint import SCHEMA_FILES
+
+REPOSITORY = Path(__file__).parents[3]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    directory = tmp_path / "corpus"
+    directory.mkdir()
+    (directory / "a.json").write_text(json.dumps({"basics": {"name": "Jane"}}))
+    (directory / "b.json").write_text(json.dumps({"basics": {"name": " Jane "}}))
+    (directory / "c.json").write_text(json.dumps({"basics": {"name": 5}}))
+    return directory
+
+
+def _json(capsys):
+    return json.loads(capsys.readouterr().out)
+
+
+def test_version(capsys):
+    with pytest.raises(SystemExit):
+        main(["--version"])
+    assert __version__ in capsys.readouterr().out
+
+
+def test_scan(corpus, tmp_path, capsys):
+    report = tmp_path / "report.csv"
+    args = ["scan", str(corpus), "-j1", "-q", "--report", str(report), "--report-format", "csv"]
+    assert main(args) == 1
+    stats = _json(capsys)
+    assert (stats["valid"], stats["invalid"]) == (2, 1)
+    assert "/basics/name" in report.read_text()
+
+
+def test_bundle(tmp_path, capsys):
+    assert main(["bundle", "-o", str(tmp_path), "--no-pickle"]) == 0
+    written = capsys.readouterr().out.split()
+    assert len(written) == 1 and written[0].endswith(".min.json")
+    assert Path(written[0]).is_file()
+
+
+def test_lint(tmp_path, capsys):
+    for relative in SCHEMA_FILES.values():
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(REPOSITORY / relative, tmp_path / relative)
+    assert main(["lint", str(tmp_path), "--no-cache", "--json"]) == 0
+    assert _json(capsys)["errors"] == 0
+
+
+def test_test(tmp_path, capsys):
+    (tmp_path / "valid-a.json").write_text(json.dumps({"basics": {"name": "Jane"}}))
+    (tmp_path / "invalid-b.json").write_text(json.dumps({"basics": {"name": "Jane"}}))
+    assert main(["test", str(tmp_path), "-j1"]) == 1
+    output = capsys.readouterr().out
+    assert "PASS" in output and "FAIL" in output
+    assert main(["test", str(tmp_path / "missing")]) == 1
+
+
+def test_export(corpus, tmp_path, capsys):
+    assert main(["export", str(tmp_path / "out"), str(corpus), "--format", "csv", "-j1"]) == 0
+    totals = _json(capsys)
+    assert totals["documents"] == 2
+    assert list((tmp_path / "out").glob("*/*.csv"))
+
+
+def test_dedup(corpus, capsys):
+    assert main(["dedup", str(corpus), "-j1", "--unique"]) == 0
+    assert capsys.readouterr().out.split() == [str(corpus / "a.json"), str(corpus / "c.json")]
+    main(["dedup", str(corpus / "a.json"), str(corpus / "b.json"), "-j1"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[1]["duplicate_of"] == str(corpus / "a.json")
+
+
+def test_sample(corpus, capsys):
+    assert main(["sample", str(corpus), "--json", "-q", "--seed", "1", "--precision", "0"]) == 0
+    report = _json(capsys)
+    assert (report["sampled"], report["failures"]) == (3, 1)
+
+
+def test_db(tmp_path, capsys):
+    database = tmp_path / "resumes.db"
+    connection = sqlite3.connect(str(database))
+    connection.execute("CREATE TABLE resumes (id INTEGER PRIMARY KEY, resume TEXT)")
+    connection.executemany(
+        "INSERT INTO resumes VALUES (?, ?)", [(1, '{"basics": {"name": "Jane"}}'), (2, None)]
+    )
+    connection.commit()
+    connection.close()
+    assert main(["db", str(database), "--table", "resumes", "-j1", "-q"]) == 1
+    assert _json(capsys)["invalid"] == 1
+    assert main(["db", str(database), "--table", "resumes", "--pending", "-j1", "-q"]) == 0
+    assert _json(capsys)["rows"] == 0
+
+
+def test_watch(tmp_path, capsys, monkeypatch):
+    from schema_resume.watch import WatchSession
+
+    def watch_once(session, callback, interval):
+        callback(session.run())
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(WatchSession, "watch", watch_once)
+    assert main(["watch", str(tmp_path), "--no-cache"]) == 0
+    assert "initial run" in capsys.readouterr().out
+
+
+def test_diff(corpus, tmp_path, capsys):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    old.write_text(json.dumps({"type": "object"}))
+    new.write_text(json.dumps({"properties": {"basics": {"required": ["email"]}}}))
+    assert main(["diff", str(old), str(new), str(corpus), "-j1", "--status-only"]) == 1
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert len(records) == 3
+    assert {record["change"] for record in records} == {"newly_invalid"}
+    assert json.loads(captured.err)["newly_invalid"] == 3
@@ -0,0 +1,93 @@
+"""Tests for bulk validation of resumes stored in SQL databases."""
+
+import json
+import sqlite3
+
+import pytest
+
+from schema_resume.connector import SQLiteConnector
+
+
+def _database(path, count=20):
+    connection = sqlite3.connect(str(path))
+    connection.execute("CREATE TABLE resumes (id INTEGER PRIMARY KEY, resume TEXT)")
+    rows = []
+    for i in range(count):
+        if i % 7 == 3:
+            document = None
+        elif i % 7 == 5:
+            document = "{not json"
+        else:
+            document = json.dumps({"basics": {"name": f"R{i}" if i % 2 else i}})
+        rows.append((i, document))
+    connection.executemany("INSERT INTO resumes VALUES (?, ?)", rows)
+    connection.commit()
+    connection.close()
+    return rows
+
+
+def _expected_valid(rows):
+    # Names must be strings; NULL and broken documents are invalid
+    return sum(1 for i, document in rows if i % 2 and i % 7 not in (3, 5))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_table(tmp_path, workers):
+    path = tmp_path / "resumes.db"
+    rows = _database(path)
+    seen = []
+    with SQLiteConnector(path, batch_size=4, workers=workers) as connector:
+        stats = connector.validate_table("resumes", progress=lambda stats: seen.append(stats.rows))
+        status = dict(
+            (row[0], row[1:])
+            for row in connector.connection.execute(
+                "SELECT resume_id, valid, error_count, errors FROM resume_validation"
+            )
+        )
+    assert stats.rows == len(rows) == len(status)
+    assert stats.batches == 5
+    assert seen == [4, 8, 12, 16, 20]
+    assert stats.valid == _expected_valid(rows)
+    assert stats.invalid == len(rows) - stats.valid
+    valid, error_count, errors = status[3]
+    assert (valid, error_count) == (0, 1)
+    assert json.loads(errors)[0]["message"] == "Document is NULL"
+    assert json.loads(status[5][2])[0]["message"].startswith("Invalid JSON")
+    assert status[1][:2] == (1, 0)
+
+
+def test_pending_condition_resumes_a_run(tmp_path):
+    path = tmp_path / "resumes.db"
+    rows = _database(path)
+    with SQLiteConnector(path, batch_size=5, workers=1) as connector:
+        first = connector.validate_table("resumes", where="id < ?", params=(8,))
+        assert first.rows == 8
+        rest = connector.validate_table("resumes", where=connector.pending_condition())
+        assert rest.rows == len(rows) - 8
+        again = connector.validate_table("resumes", where=connector.pending_condition())
+        assert again.rows == 0
+        (count,) = connector.connection.execute(
+            "SELECT COUNT(*) FROM resume_validation"
+        ).fetchone()
+    assert count == len(rows)
+
+
+def test_revalidation_replaces_status_rows(tmp_path):
+    path = tmp_path / "resumes.db"
+    _database(path, count=4)
+    with SQLiteConnector(path, workers=1) as connector:
+        connector.validate_table("resumes")
+        connector.connection.execute("UPDATE resumes SET resume = '{}' WHERE id = 0")
+        connector.connection.commit()
+        connector.validate_table("resumes", where="id = 0")
+        assert connector.connection.execute(
+            "SELECT valid FROM resume_validation WHERE resume_id = 0"
+        ).fetchone() == (1,)
+
+
+def test_identifiers_are_checked(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteConnector(tmp_path / "x.db", status_table="status; DROP TABLE resumes")
+    with SQLiteConnector(tmp_path / "x.db", workers=1) as connector:
+        with pytest.raises(ValueError):
+            connector.validate_table("resumes", id_column="id--")
@@ -0,0 +1,88 @@
+"""Tests for exact and near-duplicate detection."""
+
+import json
+
+import pytest
+
+from schema_resume.dedup import (
+    NearDuplicateIndex,
+    content_tokens,
+    dedup_files,
+    lsh_parameters,
+    minhash,
+    similarity,
+)
+
+HIGHLIGHTS = [
+    "Reduced deployment time from two hours to ten minutes with a new pipeline",
+    "Led a team of five engineers building the billing platform from scratch",
+    "Migrated the monolith to services running on Kubernetes across three regions",
+]
+
+
+def _resume(name, highlights=HIGHLIGHTS, keywords=("docker", "python", "aws")):
+    return {
+        "basics": {"name": name, "label": "Engineer"},
+        "work": [{"name": "Acme", "position": "Lead", "highlights": list(highlights)}],
+        "skills": [{"name": "DevOps", "keywords": list(keywords)}],
+    }
+
+
+def test_content_tokens():
+    tokens = content_tokens(_resume("Jane"))
+    assert "basics.name=jane" in tokens
+    assert "skills.keywords=docker" in tokens
+    assert "work.highlights~reduced deployment time" in tokens
+
+
+def test_minhash_estimates_similarity():
+    a = {f"t{i}" for i in range(200)}
+    b = {f"t{i}" for i in range(20, 220)}
+    signature = minhash(a, 256)
+    assert minhash(a, 256) == signature
+    assert similarity(signature, signature) == 1.0
+    assert abs(similarity(signature, minhash(b, 256)) - 180 / 220) < 0.15
+    assert set(minhash((), 16)) == {(1 << 64) - 1}
+
+
+def test_lsh_parameters_stay_below_threshold():
+    bands, rows = lsh_parameters(0.8, 128)
+    assert bands * rows == 128
+    assert (1 / bands) ** (1 / rows) <= 0.8
+
+
+def test_index_query():
+    index = NearDuplicateIndex(threshold=0.5, num_perm=64)
+    signature = minhash({f"t{i}" for i in range(50)}, 64)
+    index.add("a", signature)
+    assert index.query(signature) == [("a", 1.0)]
+    assert index.query(minhash({"other"}, 64)) == []
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dedup_files(tmp_path, workers):
+    documents = {
+        "a.json": _resume("Jane Doe"),
+        # Same resume, different spelling: exact duplicate after canonicalization
+        "b.json": dict(_resume(" Jane  Doe "), work=_resume("Jane Doe")["work"]),
+        # One highlight reworded: near duplicate
+        "c.json": _resume("Jane Doe", HIGHLIGHTS[:2] + ["Migrated the monolith to services"]),
+        "d.json": _resume("John Roe", ["Wrote compilers"], ["rust"]),
+    }
+    paths = []
+    for name, document in documents.items():
+        (tmp_path / name).write_text(json.dumps(document))
+        paths.append(str(tmp_path / name))
+    (tmp_path / "e.json").write_text("{broken")
+    paths.append(str(tmp_path / "e.json"))
+
+    records = list(dedup_files(paths, workers=workers, threshold=0.5))
+    assert [record["path"] for record in records] == paths
+    a, b, c, d, e = records
+    assert a["duplicate_of"] is None and a["near_duplicate_of"] is None
+    assert b["duplicate_of"] == paths[0]
+    assert c["duplicate_of"] is None and c["near_duplicate_of"] == paths[0]
+    assert 0.5 <= c["similarity"] < 1.0
+    assert d["duplicate_of"] is None and d["near_duplicate_of"] is None
+    assert "error" in e
@@ -0,0 +1,81 @@
+"""Tests for differential validation against two schema versions."""
+
+import json
+
+import pytest
+
+from schema_resume import ResumeValidator
+from schema_resume.differential import DiffSummary, diff_corpus, diff_document
+
+OLD = {
+    "type": "object",
+    "required": ["work"],
+    "properties": {"basics": {"type": "object", "properties": {"name": {"type": "string"}}}},
+}
+NEW = dict(OLD, required=["work", "basics"])
+
+
+@pytest.fixture
+def schemas(tmp_path):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    old.write_text(json.dumps(OLD))
+    new.write_text(json.dumps(NEW))
+    return old, new
+
+
+def test_second_error_of_the_same_kind_is_added(schemas):
+    old, new = (ResumeValidator(path) for path in schemas)
+    record = diff_document(old, new, {"skills": []})
+    assert record["change"] == "changed"
+    assert [error["message"] for error in record["added"]] == ["'basics' is a required property"]
+    assert record["removed"] == []
+
+
+def test_changed_message_alone_is_no_difference(tmp_path):
+    old_path, new_path = tmp_path / "old.json", tmp_path / "new.json"
+    old_path.write_text(json.dumps({"properties": {"name": {"maxLength": 3}}}))
+    new_path.write_text(json.dumps({"properties": {"name": {"maxLength": 2}}}))
+    old, new = ResumeValidator(old_path), ResumeValidator(new_path)
+    assert diff_document(old, new, {"name": "Jane"}) is None
+    assert diff_document(old, new, b'{"name": "Joe"}')["change"] == "newly_invalid"
+    assert diff_document(old, new, b"{broken") is None
+
+
+def test_summary_counts_documents_once_per_kind():
+    summary = DiffSummary()
+    summary.documents = 2
+    error = {"path": "/", "validator": "required", "message": "", "schema_path": "/required"}
+    summary.add({"change": "newly_invalid", "added": [error, error], "removed": []})
+    summary.add({"change": "changed", "added": [error], "removed": [error]})
+    counts = summary.as_dict()
+    assert counts["added"] == [
+        {"schema_path": "/required", "validator": "required", "documents": 2}
+    ]
+    assert counts["removed"][0]["documents"] == 1
+    assert counts["unchanged"] == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_diff_corpus(tmp_path, schemas, workers):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "a.json").write_text(json.dumps({"work": [], "basics": {}}))
+    (corpus / "b.json").write_text(json.dumps({"work": []}))
+    ndjson = tmp_path / "more.ndjson"
+    lines = [{"work": []}, {}, {"work": [], "basics": {}}]
+    ndjson.write_text("\n".join(json.dumps(line) for line in lines))
+    summary = DiffSummary()
+    old, new = schemas
+    records = list(
+        diff_corpus(
+            [corpus, ndjson], old, new, workers, summary, files_per_task=1, lines_per_task=2
+        )
+    )
+    assert [(record["path"], record["line"]) for record in records] == [
+        (str(corpus / "b.json"), None),
+        (str(ndjson), 1),
+        (str(ndjson), 2),
+    ]
+    assert [record["change"] for record in records] == ["newly_invalid", "newly_invalid", "changed"]
+    counts = summary.as_dict()
+    assert (counts["documents"], counts["unchanged"], counts["newly_invalid"]) == (5, 2, 2)
@@ -0,0 +1,98 @@
+"""Tests for the columnar analytics export."""
+
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from schema_resume.export import ColumnarExporter, derive_layouts, export_files
+from schema_resume.validator import ResumeValidator
+
+RESUMES = [
+    {
+        "basics": {"name": "Jane", "location": {"city": "Oslo"}},
+        "work": [{"name": "Acme", "highlights": ["a", "b"]}, {"name": "Initech"}],
+        "skills": [{"name": "Python", "keywords": ["asyncio"]}],
+    },
+    {"basics": {"name": "Joe"}},
+    {"basics": {"name": 3}},
+]
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for i, resume in enumerate(RESUMES):
+        path = tmp_path / "in" / f"r{i}.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(resume))
+        paths.append(path)
+    return paths
+
+
+def _sqlite_rows(output, table):
+    total = 0
+    for path in sorted(output.glob("part-*.sqlite")):
+        with sqlite3.connect(str(path)) as connection:
+            try:
+                total += connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            except sqlite3.OperationalError:
+                pass
+    return total
+
+
+def test_layouts_follow_the_schema():
+    layouts = derive_layouts(ResumeValidator().get_schema())
+    assert "basics.location.city" in layouts["resume"].columns
+    assert layouts["work.highlights"].columns == [
+        "document_id",
+        "work_index",
+        "highlights_index",
+        "value",
+    ]
+
+
+def test_export_counts_rows_per_table(tmp_path, files):
+    totals = export_files(files, tmp_path / "out", fmt="sqlite", workers=1)
+    assert (totals["documents"], totals["skipped"]) == (2, 1)
+    assert totals["rows"]["work"] == 2
+    assert totals["rows"]["work.highlights"] == 2
+    assert _sqlite_rows(tmp_path / "out", "work") == 2
+
+
+def test_reexport_replaces_sqlite_rows(tmp_path, files):
+    export_files(files, tmp_path / "out", fmt="sqlite", workers=1)
+    export_files(files, tmp_path / "out", fmt="sqlite", workers=1)
+    assert _sqlite_rows(tmp_path / "out", "resume") == 2
+
+
+def test_reexport_with_fewer_workers_removes_stale_partitions(tmp_path, files):
+    output = tmp_path / "out"
+    export_files(files, output, fmt="csv", workers=2)
+    assert (output / "resume" / "part-00001.csv").exists()
+    export_files(files, output, fmt="csv", workers=1)
+    assert {path.name for path in output.glob("*/part-*.csv")} == {"part-00000.csv"}
+    with open(output / "resume" / "part-00000.csv", newline="") as f:
+        assert len(list(csv.DictReader(f))) == 2
+
+
+def test_exporter_replaces_tables_without_rows(tmp_path):
+    output = tmp_path / "out"
+    with ColumnarExporter(output, fmt="csv") as exporter:
+        exporter.add("a", RESUMES[0])
+    assert (output / "work" / "part-00000.csv").exists()
+    with ColumnarExporter(output, fmt="csv") as exporter:
+        exporter.add("b", RESUMES[1])
+    assert not (output / "work" / "part-00000.csv").exists()
+
+
+def test_parquet_reexport(tmp_path, files):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    export_files(files, tmp_path / "out", fmt="parquet", workers=2)
+    export_files(files, tmp_path / "out", fmt="parquet", workers=1)
+    parts = sorted((tmp_path / "out" / "resume").glob("*.parquet"))
+    assert [path.name for path in parts] == ["part-00000.parquet"]
+    assert pyarrow.parquet.read_table(str(parts[0])).num_rows == 2
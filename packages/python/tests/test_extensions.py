@@ -0,0 +1,82 @@
+"""Tests for extension schemas."""
+
+import json
+
+from schema_resume.extensions import ExtensionRegistry, overlay
+from schema_resume.limits import ResumeLimits
+
+ACME = {
+    "$id": "https://example.com/acme.json",
+    "required": ["acme"],
+    "properties": {
+        "acme": {"type": "object", "required": ["employeeId"]},
+        "work": {"items": {"properties": {"costCenter": {"type": "string"}}}},
+    },
+}
+
+STRICT_DATES = {
+    "properties": {"work": {"items": {"properties": {"startDate": {"minLength": 7}}}}}
+}
+
+
+def test_overlay_merges_and_shares():
+    base = {
+        "required": ["a"],
+        "properties": {"a": {"type": "string"}, "b": {"type": "object"}},
+    }
+    merged = overlay(base, {"required": ["c"], "properties": {"a": {"maxLength": 3}}})
+    assert merged["required"] == ["a", "c"]
+    assert merged["properties"]["a"] == {"type": "string", "maxLength": 3}
+    assert merged["properties"]["b"] is base["properties"]["b"]
+    assert base["properties"]["a"] == {"type": "string"}
+
+
+def test_overlay_wraps_references():
+    base = {"$ref": "#/definitions/iso8601", "description": "Start"}
+    assert overlay(base, {"minLength": 7}) == {"allOf": [base, {"minLength": 7}]}
+    assert overlay(base, {"$ref": "#/definitions/other"})["$ref"] == "#/definitions/other"
+
+
+def test_extended_validator():
+    registry = ExtensionRegistry()
+    validator = registry.validator([ACME])
+    assert not validator.validate({"basics": {"name": "Jane"}})["valid"]
+    document = {"acme": {"employeeId": 7}, "work": [{"name": "Acme", "costCenter": "R&D"}]}
+    assert validator.validate(document)["valid"]
+    document["work"][0]["costCenter"] = 5
+    assert not validator.validate(document)["valid"]
+
+
+def test_extension_of_a_reference_is_enforced():
+    validator = ExtensionRegistry().validator([STRICT_DATES])
+    assert validator.validate({"work": [{"startDate": "2020-01"}]})["valid"]
+    result = validator.validate({"work": [{"startDate": "2020"}]})
+    assert not result["valid"]
+    assert result["errors"][0]["validator"] == "minLength"
+
+
+def test_validators_are_cached_by_limit_values(tmp_path):
+    registry = ExtensionRegistry()
+    path = tmp_path / "acme.json"
+    path.write_text(json.dumps(ACME))
+
+    def limits(depth=8):
+        return ResumeLimits(max_depth=depth, max_items_by_key={"work": 3})
+
+    first = registry.validator([path], limits())
+    assert registry.validator([str(path)], limits()) is first
+    assert registry.validator([ACME], limits()) is first
+    assert registry.validator([path], limits(9)) is not first
+    assert len(registry._validators) == 2
+
+
+def test_changed_extension_files_are_reloaded(tmp_path):
+    registry = ExtensionRegistry()
+    path = tmp_path / "ext.json"
+    path.write_text(json.dumps({"required": ["acme"]}))
+    first = registry.validator([path])
+    assert registry.validator([path]) is first
+    path.write_text(json.dumps({"required": ["acme", "other"]}))
+    second = registry.validator([path])
+    assert second is not first
+    assert second.schema["required"][-2:] == ["acme", "other"]
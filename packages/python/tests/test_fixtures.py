@@ -0,0 +1,55 @@
+"""Tests for the fixture corpus runner."""
+
+import json
+
+import pytest
+
+from schema_resume.cli import main
+from schema_resume.fixtures import discover_fixtures, run_fixtures
+from schema_resume.scan import iter_files, scan_directory
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "valid-basic.json").write_text(json.dumps({"basics": {"name": "Jane"}}))
+    (tmp_path / "invalid-name.json").write_text(json.dumps({"basics": {"name": 3}}))
+    (tmp_path / "invalid-name.errors.json").write_text(json.dumps(["/basics/name"]))
+    (tmp_path / "invalid-work.json").write_text(json.dumps({"work": [{"startDate": 1}]}))
+    (tmp_path / "invalid-work.errors.json").write_text(json.dumps(["/work/0/name"]))
+    (tmp_path / "notes.json").write_text("{}")
+    return tmp_path
+
+
+def test_discovery_by_naming_convention(corpus):
+    fixtures = {fixture["path"]: fixture for fixture in discover_fixtures([corpus])}
+    assert sorted(path.rsplit("/", 1)[1] for path in fixtures) == [
+        "invalid-name.json",
+        "invalid-work.json",
+        "valid-basic.json",
+    ]
+    assert fixtures[str(corpus / "invalid-name.json")]["expected_paths"] == ["/basics/name"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_expected_error_paths_must_be_reported(corpus, workers):
+    results = {
+        result["path"].rsplit("/", 1)[1]: result
+        for result in run_fixtures(discover_fixtures([corpus]), workers=workers)
+    }
+    assert results["valid-basic.json"]["passed"]
+    assert results["invalid-name.json"]["passed"]
+    assert not results["invalid-work.json"]["passed"]
+    assert results["invalid-work.json"]["missing_paths"] == ["/work/0/name"]
+
+
+def test_cli_exit_code(corpus, capsys):
+    assert main(["test", str(corpus), "-j", "1"]) == 1
+    (corpus / "invalid-work.errors.json").unlink()
+    assert main(["test", str(corpus), "-j", "1"]) == 0
+
+
+def test_sidecars_are_not_scanned_as_resumes(corpus):
+    names = sorted(entry[0].rsplit("/", 1)[1] for entry in iter_files(corpus))
+    assert "invalid-name.errors.json" not in names
+    stats = scan_directory(corpus, workers=1)
+    assert stats.discovered == 4
@@ -0,0 +1,79 @@
+"""Tests for the inverted skill index."""
+
+import pytest
+
+from schema_resume import index as index_module
+from schema_resume.index import SkillIndex, extract_terms, normalize_term
+
+RESUMES = {
+    "ana": {
+        "skills": [{"name": "DevOps", "keywords": ["Docker", "Kubernetes"]}],
+        "languages": [{"language": "Spanish"}],
+    },
+    "ben": {"skills": [{"name": "Python", "keywords": ["docker"]}], "tools": [{"name": "Git"}]},
+    "cai": {"skills": [{"name": "  node.JS ", "keywords": ["C++"]}]},
+}
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(index_module, "numpy", None)
+    return request.param
+
+
+@pytest.fixture
+def index(backend):
+    built = SkillIndex()
+    built.add_many(RESUMES.items())
+    return built
+
+
+def test_terms_are_normalized_and_qualified():
+    assert normalize_term("  Node.JS ") == "node.js"
+    assert extract_terms(RESUMES["cai"]) == {"skill:node.js", "keyword:c++"}
+
+
+def test_boolean_search(index):
+    assert index.search(all_of=["docker"]) == ["ana", "ben"]
+    assert index.search(any_of=["git", "c++"]) == ["ben", "cai"]
+    assert index.search(none_of=["docker"]) == ["cai"]
+    assert index.search(all_of=["tool:git"]) == ["ben"]
+    assert index.search(all_of=["docker"], field="skill") == []
+
+
+def test_rank_prefers_more_and_rarer_matches(index):
+    ranked = index.rank(["docker", "devops"])
+    assert [key for key, _ in ranked] == ["ana", "ben"]
+    assert ranked[0][1] > ranked[1][1]
+
+
+def test_remove_and_replace(index):
+    assert index.remove("ana")
+    assert not index.remove("ana")
+    assert index.search(all_of=["docker"]) == ["ben"]
+    index.add("ben", {"skills": [{"name": "Rust"}]})
+    assert index.search(all_of=["docker"]) == []
+    assert len(index) == 2
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    index.remove("cai")
+    path = tmp_path / "skills.idx"
+    index.save(path)
+    loaded = SkillIndex.load(path)
+    assert loaded.search(all_of=["docker"]) == ["ana", "ben"]
+    assert "cai" not in loaded
+    loaded.add("dee", {"skills": [{"name": "Docker"}]})
+    assert loaded.search(any_of=["docker"]) == ["ana", "ben", "dee"]
+    loaded.save(path)
+    assert SkillIndex.load(path).terms == loaded.terms
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.idx"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SkillIndex.load(path)
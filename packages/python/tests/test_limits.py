@@ -0,0 +1,71 @@
+"""Tests for input limits on untrusted resumes."""
+
+import io
+import json
+
+import pytest
+
+from schema_resume import LimitExceededError, ResumeLimits, ResumeValidator
+from schema_resume.limits import DepthScanner, check_document, read_limited
+
+
+def _nested(depth):
+    return "[" * depth + "]" * depth
+
+
+def test_depth_scanner_ignores_brackets_in_strings_and_escapes():
+    scanner = DepthScanner(2)
+    scanner.feed(b'{"a": "[[[[\\"{{{{", "b": [1]}')
+    assert scanner.depth == 0
+    with pytest.raises(LimitExceededError):
+        DepthScanner(2).feed(_nested(3).encode())
+
+
+def test_depth_scanner_carries_escapes_across_chunks():
+    scanner = DepthScanner(1)
+    scanner.feed(b'["\\')
+    scanner.feed(b'"[[["]')
+    assert (scanner.depth, scanner.in_string) == (0, False)
+
+
+def test_read_limited_stops_at_max_bytes():
+    stream = io.BytesIO(b" " * 100)
+    with pytest.raises(LimitExceededError) as info:
+        read_limited(stream, ResumeLimits(max_bytes=10))
+    assert info.value.limit == "max_bytes"
+
+
+def test_check_document_reports_the_offending_path():
+    limits = ResumeLimits(max_items=10, max_items_by_key={"highlights": 2})
+    check_document({"work": [{"highlights": ["a", "b"]}]}, limits)
+    with pytest.raises(LimitExceededError) as info:
+        check_document({"work": [{"highlights": ["a", "b", "c"]}]}, limits)
+    assert (info.value.limit, info.value.path) == ("max_items", "/work/0/highlights")
+
+
+def test_validator_turns_limit_violations_into_errors():
+    validator = ResumeValidator(limits=ResumeLimits(max_depth=8, max_bytes=10000))
+    deep = {"basics": {"name": "Jane"}, "meta": json.loads(_nested(20))}
+    for resume in (deep, json.dumps(deep), json.dumps(deep).encode()):
+        result = validator.validate(resume)
+        assert result["valid"] is False
+        assert result["errors"][-1]["validator"] == "max_depth"
+    assert validator.validate({"basics": {"name": "Jane"}})["valid"] is True
+
+
+def test_limited_validation_matches_unlimited_errors():
+    resume = {"basics": {"name": 3}, "work": [{"startDate": 5}]}
+    limited = ResumeValidator(limits=ResumeLimits(max_seconds=10)).validate(resume)
+    unlimited = ResumeValidator().validate(resume)
+
+    def keys(result):
+        return sorted((error["path"], error["validator"]) for error in result["errors"])
+
+    assert keys(limited) == keys(unlimited)
+
+
+def test_file_input_is_checked_before_reading(tmp_path):
+    path = tmp_path / "big.json"
+    path.write_text(json.dumps({"basics": {"name": "x" * 1000}}))
+    result = ResumeValidator(limits=ResumeLimits(max_bytes=100)).validate(path)
+    assert [error["validator"] for error in result["errors"]] == ["max_bytes"]
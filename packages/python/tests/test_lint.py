@@ -0,0 +1,67 @@
+"""Tests for the cached schema lint engine."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from schema_resume import lint
+from schema_resume.lint import SCHEMA_FILES, LintEngine, format_report
+
+REPOSITORY = Path(__file__).parents[3]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for relative in SCHEMA_FILES.values():
+        target = tmp_path / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(REPOSITORY / relative, target)
+    copy = tmp_path / "packages" / "demo"
+    copy.mkdir(parents=True)
+    for kind in ("schema.json", "context.jsonld"):
+        shutil.copy(tmp_path / kind, copy / kind)
+    return tmp_path
+
+
+def test_repository_schemas_lint_clean(repo):
+    report = LintEngine(repo, use_cache=False).run()
+    assert report["errors"] == 0
+    assert report["files"] == 6
+    assert report["unique_files"] == 4
+    assert "0 errors" in format_report(report)
+
+
+def test_results_are_cached_by_content_hash(repo):
+    first = LintEngine(repo).run()
+    assert first["rules_run"] > 0
+    second = LintEngine(repo).run()
+    assert (second["rules_run"], second["rules_cached"]) == (0, first["rules_run"])
+
+
+def test_cache_is_invalidated_when_the_rules_change(repo, monkeypatch):
+    LintEngine(repo).run()
+    monkeypatch.setattr(lint, "rules_digest", lambda: "upgraded")
+    assert LintEngine(repo).run()["rules_cached"] == 0
+
+
+def test_changed_copy_is_reported_and_only_it_is_rechecked(repo):
+    engine = LintEngine(repo)
+    engine.run()
+    schema = json.loads((repo / "schema.json").read_text())
+    del schema["$id"]
+    (repo / "packages" / "demo" / "schema.json").write_text(json.dumps(schema))
+    report = engine.run()
+    rules = {(finding["file"], finding["rule"]) for finding in report["findings"]}
+    assert ("packages/demo/schema.json", "lint_schema_json") in rules
+    assert ("packages/demo/schema.json", "copy_in_sync") in rules
+    assert report["errors"] == 1
+    # The file rule and the schema/context rule of the changed copy
+    assert report["rules_run"] == 2
+
+
+def test_parse_errors_are_findings(repo):
+    (repo / "context.jsonld").write_text("{")
+    report = LintEngine(repo, use_cache=False).run()
+    assert any("Parse error" in finding["message"] for finding in report["findings"])
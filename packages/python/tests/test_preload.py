@@ -0,0 +1,52 @@
+"""Tests for the preloaded, fork-friendly validator."""
+
+import gc
+
+import pytest
+
+from schema_resume import preload, validate_resume
+
+
+@pytest.fixture(autouse=True)
+def reset_preloaded(monkeypatch):
+    monkeypatch.setattr(preload, "_preloaded", None)
+    yield
+    if hasattr(gc, "unfreeze"):
+        gc.unfreeze()
+
+
+def test_skeleton_covers_the_schema():
+    validator = preload.ResumeValidator()
+    schema = validator.get_schema()
+    skeleton = preload._skeleton(schema, schema)
+    assert {"basics", "work", "education", "skills"} <= set(skeleton)
+    assert isinstance(skeleton["work"], list)
+
+
+def test_preload_shares_one_validator():
+    assert not preload.is_preloaded()
+    validator = preload.preload(freeze=True)
+    assert preload.is_preloaded()
+    assert preload.get_validator() is validator
+    preload.post_fork()
+    assert preload.get_validator() is validator
+
+
+def test_validate_resume_uses_the_preloaded_validator(monkeypatch):
+    validator = preload.preload(freeze=False)
+    calls = []
+    original = validator.validate
+
+    def validate(resume):
+        calls.append(resume)
+        return original(resume)
+
+    monkeypatch.setattr(validator, "validate", validate)
+    assert validate_resume({"basics": {"name": "Jane"}})["valid"]
+    assert calls == [{"basics": {"name": "Jane"}}]
+
+
+def test_get_validator_builds_on_first_use():
+    validator = preload.get_validator()
+    assert preload.is_preloaded()
+    assert validator.validate({"basics": {"name": 1}})["valid"] is False
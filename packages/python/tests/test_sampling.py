@@ -0,0 +1,62 @@
+"""Tests for stratified corpus sampling."""
+
+import json
+
+import pytest
+
+from schema_resume.sampling import format_report, sample_corpus, wilson_interval
+
+
+def _resumes(count, invalid_every=4):
+    for i in range(count):
+        name = i if i % invalid_every == 0 else f"R{i}"
+        yield {"basics": {"name": name}}
+
+
+def test_small_corpus_is_validated_completely(tmp_path):
+    for i, resume in enumerate(_resumes(12)):
+        (tmp_path / f"r{i}.json").write_text(json.dumps(resume))
+    report = sample_corpus(tmp_path, precision=0.0, seed=1)
+    assert report["complete"] is True
+    assert report["stopped"] == "complete"
+    assert report["failures"] == 3
+    assert "stopped: complete" in format_report(report)
+
+
+def test_exhausted_reservoir_is_not_complete():
+    report = sample_corpus(_resumes(50), precision=0.0, reservoir=10, stratify="none", seed=1)
+    assert report["population"] == 50
+    assert report["sampled"] == 10
+    assert report["complete"] is False
+    assert report["stopped"] == "exhausted"
+
+
+def test_max_samples_stops_early():
+    report = sample_corpus(_resumes(500), precision=0.0, max_samples=40, batch_size=20, seed=1)
+    assert report["stopped"] == "samples"
+    assert report["complete"] is False
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ndjson_source(tmp_path, workers):
+    path = tmp_path / "corpus.ndjson"
+    path.write_text("".join(json.dumps(resume) + "\n" for resume in _resumes(40)))
+    report = sample_corpus(path, precision=0.0, workers=workers, seed=1)
+    assert report["complete"] is True
+    assert report["failures"] == 10
+
+
+def test_progress_error_terminates_workers(tmp_path):
+    for i, resume in enumerate(_resumes(20)):
+        (tmp_path / f"r{i}.json").write_text(json.dumps(resume))
+
+    def interrupt(report):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        sample_corpus(tmp_path, precision=0.0, workers=2, progress=interrupt)
+
+
+def test_wilson_interval_contains_rate():
+    low, high = wilson_interval(0.2, 100, 1.96)
+    assert low < 0.2 < high
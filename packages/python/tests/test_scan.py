@@ -0,0 +1,84 @@
+"""Tests for the directory scanner and its checkpoint."""
+
+import json
+
+import pytest
+
+from schema_resume.aggregate import ErrorAggregator
+from schema_resume.cli import main
+from schema_resume.scan import Checkpoint, iter_files, scan_directory, validate_file
+from schema_resume.validator import ResumeValidator
+
+
+def _write_corpus(root, valid=3, invalid=2):
+    for i in range(valid):
+        (root / f"valid-{i}.json").write_text(json.dumps({"basics": {"name": f"R{i}"}}))
+    for i in range(invalid):
+        (root / f"invalid-{i}.json").write_text(json.dumps({"basics": {"name": i}}))
+
+
+def test_iter_files_skips_hidden_directories(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config.json").write_text("{}")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.json").write_text("{}")
+    (tmp_path / "notes.txt").write_text("")
+    assert [entry[0] for entry in iter_files(tmp_path)] == [str(tmp_path / "sub" / "a.json")]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_counts_and_checkpoints(tmp_path, workers):
+    _write_corpus(tmp_path)
+    stats = scan_directory(tmp_path, workers=workers)
+    assert (stats.discovered, stats.scanned, stats.valid, stats.invalid) == (5, 5, 3, 2)
+    assert stats.failed == 2
+
+
+def test_resumed_scan_counts_checkpointed_failures(tmp_path):
+    _write_corpus(tmp_path)
+    scan_directory(tmp_path, workers=1)
+
+    aggregator = ErrorAggregator()
+    stats = scan_directory(tmp_path, workers=1, aggregator=aggregator)
+    assert (stats.scanned, stats.skipped, stats.skipped_invalid) == (0, 5, 2)
+    assert stats.failed == 2
+    assert aggregator.invalid_documents == 2
+
+
+def test_resumed_scan_with_hash_counts_unchanged_failures(tmp_path):
+    _write_corpus(tmp_path, valid=1, invalid=1)
+    scan_directory(tmp_path, workers=1, use_hash=True)
+    # Same content, new mtime: hashed again but not validated again
+    path = tmp_path / "invalid-0.json"
+    path.write_text(path.read_text())
+    stats = scan_directory(tmp_path, workers=1, use_hash=True)
+    assert stats.scanned == 0
+    assert stats.failed == 1
+
+
+def test_deeply_nested_json_is_reported_as_invalid(tmp_path):
+    path = tmp_path / "nested.json"
+    path.write_text("[" * 100000)
+    result = validate_file(ResumeValidator(), str(path))
+    assert result["valid"] is False
+    assert result["errors"][0]["validator"] == "json"
+
+
+def test_cli_exit_code_reflects_checkpointed_failures(tmp_path, capsys):
+    _write_corpus(tmp_path)
+    assert main(["scan", str(tmp_path), "-j", "1", "-q"]) == 1
+    capsys.readouterr()
+    assert main(["scan", str(tmp_path), "-j", "1", "-q"]) == 1
+    assert json.loads(capsys.readouterr().out)["skipped_invalid"] == 2
+
+
+def test_checkpoint_lookup_batches(tmp_path):
+    store = Checkpoint(tmp_path / "checkpoint.sqlite")
+    entries = [(f"/data/{i}.json", i, i) for i in range(1200)]
+    for entry in entries:
+        store.record(entry, {"valid": entry[1] % 2 == 0, "errors": [], "sha256": None})
+    store.flush()
+    found = store.lookup([entry[0] for entry in entries] + ["/data/missing.json"])
+    assert len(found) == 1200
+    assert found["/data/3.json"] == (3, 3, None, False)
+    store.close()
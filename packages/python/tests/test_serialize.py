@@ -0,0 +1,80 @@
+"""Tests for the JSON, NDJSON and XML serializer."""
+
+import json
+import os
+
+import pytest
+
+from schema_resume.serialize import ResumeSerializer
+
+RESUME = {
+    "$schema": "https://schema-resume.org/schema.json",
+    "work": [{"name": "R&D <Lab>", "highlights": ["Shipped", "Scaled"], "startDate": "2020-01"}],
+    "basics": {"name": "Jane", "profiles": [{"network": "GitHub", "username": "jane"}]},
+}
+
+
+def test_json_bytes_are_compact():
+    serializer = ResumeSerializer(ensure_ascii=False)
+    data = serializer.json_bytes({"basics": {"name": "Zoë"}})
+    assert data == '{"basics":{"name":"Zoë"}}'.encode("utf-8")
+    buffer = bytearray(b"x")
+    assert serializer.write_json({"a": 1}, buffer) == 7
+    assert buffer == b'x{"a":1}'
+
+
+def test_write_ndjson_in_batches(tmp_path):
+    documents = [{"basics": {"name": f"R{i}"}} for i in range(50)]
+    path = tmp_path / "out.ndjson"
+    with open(path, "wb") as f:
+        count, written = ResumeSerializer().write_ndjson(f, documents, batch_bytes=64)
+    data = path.read_bytes()
+    assert (count, written) == (50, len(data))
+    assert [json.loads(line) for line in data.splitlines()] == documents
+
+    fd = os.open(tmp_path / "fd.ndjson", os.O_WRONLY | os.O_CREAT)
+    try:
+        assert ResumeSerializer().write_ndjson(fd, documents[:2])[0] == 2
+    finally:
+        os.close(fd)
+
+
+def test_xml_follows_the_xsd_order():
+    xml = ResumeSerializer().xml_bytes(RESUME).decode("utf-8")
+    assert xml.startswith('<?xml version="1.0" encoding="UTF-8"?><resume xmlns=')
+    assert xml.index("<basics>") < xml.index("<work>")
+    assert "<name>R&amp;D &lt;Lab&gt;</name>" in xml
+    assert "<highlights><item>Shipped</item><item>Scaled</item></highlights>" in xml
+    assert "<profiles><profile><network>GitHub</network>" in xml
+    assert "$schema" not in xml
+
+
+def test_xml_validates_against_the_xsd():
+    pytest.importorskip("lxml")
+    from schema_resume import ResumeValidator
+
+    result = ResumeValidator().validate_xml(ResumeSerializer().xml_bytes(RESUME))
+    assert result["valid"], result["errors"]
+
+
+def test_xml_rejects_control_characters():
+    serializer = ResumeSerializer()
+    buffer = bytearray(b"kept")
+    with pytest.raises(ValueError, match="U\\+0001"):
+        serializer.write_xml({"basics": {"name": "a\x01b"}}, buffer)
+    assert buffer == b"kept"
+    assert b"<name>a\tb\nc</name>" in serializer.xml_bytes({"basics": {"name": "a\tb\nc"}})
+
+
+def test_xml_keeps_exact_decimals_and_carriage_returns():
+    serializer = ResumeSerializer()
+    document = {
+        "skills": [{"name": "a\r\nb", "yearsOfExperience": 1e-20}, {"yearsOfExperience": 1.5e22}]
+    }
+    xml = serializer.xml_bytes(document).decode("utf-8")
+    assert "<name>a&#13;\nb</name>" in xml
+    assert "<yearsOfExperience>0.00000000000000000001</yearsOfExperience>" in xml
+    assert "<yearsOfExperience>15000000000000000000000</yearsOfExperience>" in xml
+    lxml = pytest.importorskip("lxml.etree")
+    root = lxml.fromstring(serializer.xml_bytes(document, declaration=False))
+    assert root.find(".//{*}name").text == "a\r\nb"
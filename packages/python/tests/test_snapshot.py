@@ -0,0 +1,77 @@
+"""Tests for validator snapshots."""
+
+import json
+import os
+
+import pytest
+
+import schema_resume.preload as preload
+import schema_resume.snapshot as snapshot
+import schema_resume.validator as validator_module
+from schema_resume import ResumeValidator, validate_resume
+from schema_resume.limits import ResumeLimits
+from schema_resume.snapshot import load_snapshot, restore_validator, save_snapshot, snapshot_path
+
+RESUME = {"basics": {"name": "Jane", "email": "not an email"}, "work": [{"startDate": "2020"}]}
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text((ResumeValidator().schema_dir / "schema.json").read_text(encoding="utf-8"))
+    return path
+
+
+def test_restored_validator_matches_a_fresh_one(tmp_path, schema_file):
+    restored = restore_validator(schema_file, directory=tmp_path / "cache")
+    assert snapshot_path(schema_file, tmp_path / "cache").is_file()
+    again = restore_validator(schema_file, directory=tmp_path / "cache")
+    expected = ResumeValidator(schema_file).validate(RESUME)
+    assert restored.validate(RESUME) == expected
+    assert again.validate(RESUME) == expected
+
+
+def test_restored_validator_with_limits(tmp_path, schema_file):
+    limits = ResumeLimits(max_seconds=5)
+    restored = restore_validator(schema_file, limits, directory=tmp_path / "cache")
+    expected = ResumeValidator(schema_file, limits).validate(RESUME)
+    assert restored.validate(RESUME) == expected
+    assert [error["path"] for error in expected["errors"]] == ["/basics/email"]
+
+
+def test_stale_snapshots_are_rejected(tmp_path, schema_file):
+    path = tmp_path / "validator.marshal"
+    save_snapshot(schema_file, path)
+    assert load_snapshot(path, schema_file) is not None
+    schema = json.loads(schema_file.read_text())
+    schema["required"] = ["basics"]
+    schema_file.write_text(json.dumps(schema))
+    assert load_snapshot(path, schema_file) is None
+    (tmp_path / "broken.marshal").write_bytes(b"\0garbage")
+    assert load_snapshot(tmp_path / "broken.marshal", schema_file) is None
+
+
+def test_touched_schema_updates_the_stored_stat(tmp_path, schema_file, monkeypatch):
+    path = tmp_path / "validator.marshal"
+    save_snapshot(schema_file, path)
+    stat = os.stat(schema_file)
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_snapshot(path, schema_file) is not None
+
+    def fail(data):
+        raise AssertionError("schema hashed again")
+
+    monkeypatch.setattr(snapshot, "_sha256", fail)
+    assert load_snapshot(path, schema_file) is not None
+
+
+def test_validate_resume_does_not_use_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHEMA_RESUME_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(preload, "_preloaded", None)
+    monkeypatch.setattr(validator_module, "_default", None)
+    assert validate_resume({"basics": {"name": "Jane"}})["valid"]
+    default = validator_module._default
+    assert isinstance(default, ResumeValidator)
+    validate_resume({"basics": {"name": "Jane"}})
+    assert validator_module._default is default
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,89 @@
+"""Tests for career-timeline metrics."""
+
+import datetime
+import random
+
+import pytest
+
+from schema_resume.timeline import (
+    METRIC_COLUMNS,
+    TimelineBatch,
+    compute_timeline,
+    parse_date,
+)
+
+AS_OF = datetime.date(2024, 1, 1)
+
+
+def _random_resume(rng):
+    work = []
+    for _ in range(rng.randint(0, 5)):
+        year = rng.randint(2000, 2022)
+        start = f"{year}-{rng.randint(1, 12):02d}"
+        entry = {"name": "X", "startDate": start}
+        if rng.random() < 0.8:
+            entry["endDate"] = f"{year + rng.randint(0, 2)}-{rng.randint(1, 12):02d}"
+        work.append(entry)
+    return {"work": work, "education": [{"startDate": "1998", "endDate": "2001"}]}
+
+
+def test_parse_date_precisions():
+    assert parse_date("2020") == datetime.date(2020, 1, 1).toordinal()
+    assert parse_date("2020-03", end=True) == datetime.date(2020, 4, 1).toordinal()
+    assert parse_date("2020-02-29", end=True) == datetime.date(2020, 3, 1).toordinal()
+
+
+def test_compute_timeline_reports_gaps_and_overlaps():
+    resume = {
+        "work": [
+            {"name": "A", "startDate": "2015-01", "endDate": "2016-12"},
+            {"name": "B", "startDate": "2016-06", "endDate": "2017-12"},
+            {"name": "C", "startDate": "2019-01", "position": "Lead"},
+        ]
+    }
+    timeline = compute_timeline(resume, as_of=AS_OF)
+    assert timeline["gaps"] == [{"start": "2018-01-01", "end": "2018-12-31", "days": 365}]
+    assert timeline["overlapping"] == [(0, 1)]
+    assert timeline["current"] == [{"work": 2, "name": "C", "title": "Lead"}]
+    assert timeline["first_start"] == "2015-01-01"
+
+
+@pytest.mark.parametrize("min_gap_days", [0, 1, 31])
+def test_numpy_and_python_metrics_agree(min_gap_days):
+    numpy = pytest.importorskip("numpy")
+    rng = random.Random(7)
+    batch = TimelineBatch(AS_OF)
+    batch.extend(_random_resume(rng) for _ in range(300))
+    for kinds in (("work",), ("work", "education")):
+        selected = sorted({"work": 0, "education": 2}[name] for name in kinds)
+        fast = batch._metrics_numpy(numpy, min_gap_days, selected)
+        slow = batch._metrics_python(min_gap_days, selected)
+        for column in METRIC_COLUMNS:
+            assert [float(value) for value in fast[column]] == pytest.approx(
+                [float(value) for value in slow[column]]
+            ), column
+
+
+def test_overlapping_entries_are_not_gaps():
+    pytest.importorskip("numpy")
+    batch = TimelineBatch(AS_OF)
+    batch.add(
+        {
+            "work": [
+                {"startDate": "2015", "endDate": "2018"},
+                {"startDate": "2016", "endDate": "2017"},
+                {"startDate": "2018-01", "endDate": "2018-06"},
+            ]
+        }
+    )
+    assert list(batch.metrics(min_gap_days=0)["gap_count"]) == [0]
+
+
+def test_batch_matches_single_resume_timeline():
+    resume = _random_resume(random.Random(3))
+    batch = TimelineBatch(AS_OF)
+    row = batch.add(resume)
+    timeline = compute_timeline(resume, as_of=AS_OF)
+    metrics = batch.metrics()
+    assert metrics["experience_days"][row] == timeline["experience_days"]
+    assert metrics["gap_count"][row] == len(timeline["gaps"])
@@ -0,0 +1,17 @@
+"""Tests for the validator module's shared helpers."""
+
+from schema_resume import ResumeValidator, error_entry
+
+
+def test_error_entry_has_the_keys_of_schema_errors():
+    schema_error = ResumeValidator().validate({"basics": {"name": 3}})["errors"][0]
+    entry = error_entry("Invalid JSON: boom", "json")
+    assert set(entry) == set(schema_error)
+    assert entry == {
+        "path": "/",
+        "message": "Invalid JSON: boom",
+        "schema_path": "/",
+        "validator": "json",
+        "validator_value": None,
+    }
+    assert error_entry("gone")["validator"] == "io"
@@ -0,0 +1,113 @@
+"""Tests for watch mode."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from schema_resume.lint import SCHEMA_FILES
+from schema_resume.watch import WatchSession, format_cycle
+
+REPOSITORY = Path(__file__).parents[3]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for relative in SCHEMA_FILES.values():
+        target = tmp_path / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(REPOSITORY / relative, target)
+    fixtures = tmp_path / "tests"
+    fixtures.mkdir()
+    (fixtures / "valid-basic.json").write_text(json.dumps({"basics": {"name": "Jane"}}))
+    (fixtures / "invalid-name.json").write_text(json.dumps({"basics": {"name": 5}}))
+    (fixtures / "invalid-name.errors.json").write_text(json.dumps(["/basics/name"]))
+    shutil.copy(REPOSITORY / "xml" / "1.0" / "example.xml", fixtures / "valid-example.xml")
+    return tmp_path
+
+
+def _write(path, text):
+    """Write a file and move its mtime forward, so a poll always sees it."""
+    previous = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, max(stat.st_mtime_ns, previous + 10 ** 9)))
+
+
+def _cycle(session):
+    return session.run(session.poll())
+
+
+def test_unchanged_fixtures_are_cached(repo):
+    pytest.importorskip("lxml")
+    session = WatchSession(repo, use_cache=False)
+    first = _cycle(session)
+    assert [result["passed"] for result in first["fixtures"]] == [True, True, True]
+    assert (first["fixtures_run"], first["fixtures_cached"]) == (3, 0)
+    assert sorted(first["rebuilt"]) == ["schema.json", "xsd"]
+    second = _cycle(session)
+    assert (second["fixtures_run"], second["fixtures_cached"]) == (0, 3)
+    assert second["rebuilt"] == []
+    assert "3 passed, 0 failed" in format_cycle(second)
+
+
+def test_changed_fixture_and_sidecar_are_rerun(repo):
+    fixtures = [repo / "tests" / "valid-basic.json", repo / "tests" / "invalid-name.json"]
+    session = WatchSession(repo, fixtures, use_cache=False)
+    _cycle(session)
+    _write(repo / "tests" / "valid-basic.json", json.dumps({"basics": {"name": 1}}))
+    report = _cycle(session)
+    assert report["changed"] == [str(repo / "tests" / "valid-basic.json")]
+    assert (report["fixtures_run"], report["fixtures_cached"]) == (1, 1)
+    assert not report["fixtures"][0]["passed"]
+    assert "FAIL" in format_cycle(report)
+
+    _write(repo / "tests" / "invalid-name.errors.json", json.dumps(["/basics/email"]))
+    report = _cycle(session)
+    assert (report["fixtures_run"], report["fixtures_cached"]) == (1, 1)
+    assert report["fixtures"][1]["missing_paths"] == ["/basics/email"]
+
+
+def test_xsd_edit_only_reruns_xml_fixtures(repo):
+    pytest.importorskip("lxml")
+    session = WatchSession(repo, use_cache=False)
+    _cycle(session)
+    xsd = repo / SCHEMA_FILES["schema-resume.xsd"]
+    _write(xsd, xsd.read_text() + "\n")
+    report = _cycle(session)
+    assert report["rebuilt"] == ["xsd"]
+    assert (report["fixtures_run"], report["fixtures_cached"]) == (1, 2)
+    assert session.validator.xml_schema is session._xml_schema is not None
+
+    _write(xsd, "<not-a-schema")
+    report = _cycle(session)
+    assert report["schema_errors"] and "does not compile" in report["schema_errors"][0]
+    xml = [result for result in report["fixtures"] if result["path"].endswith(".xml")]
+    assert not xml[0]["passed"]
+
+
+def test_results_of_removed_fixtures_are_dropped(repo):
+    session = WatchSession(repo, use_cache=False)
+    _cycle(session)
+    (repo / "tests" / "valid-basic.json").unlink()
+    report = _cycle(session)
+    assert len(report["fixtures"]) == 2
+    assert str(repo / "tests" / "valid-basic.json") not in session._fixture_results
+    assert len(session._fixture_results) == 2
+
+
+def test_only_changed_files_are_hashed(repo, monkeypatch):
+    from schema_resume import watch
+
+    session = WatchSession(repo, use_cache=False)
+    _cycle(session)
+    hashed = []
+    digest = watch._digest
+    monkeypatch.setattr(watch, "_digest", lambda path: hashed.append(str(path)) or digest(path))
+    _cycle(session)
+    assert hashed == []
+    _write(repo / "tests" / "valid-basic.json", json.dumps({"basics": {"name": "Joe"}}))
+    _cycle(session)
+    assert hashed == [str(repo / "tests" / "valid-basic.json")]
@@ -0,0 +1,47 @@
+"""Tests for the shared worker pool."""
+
+import pytest
+
+from schema_resume.workers import WorkerPool, make_validators, worker_state
+
+
+def _name_is_valid(name):
+    (validator,) = worker_state()
+    return validator.validate({"basics": {"name": name}})["valid"]
+
+
+def _fail(value):
+    raise ValueError(value)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_runs_with_per_worker_state(workers):
+    with WorkerPool(workers, make_validators, (None,)) as pool:
+        assert pool.parallel == (workers > 1)
+        assert list(pool.map(_name_is_valid, ["Jane", 3, "Joe"], chunksize=2)) == [
+            True,
+            False,
+            True,
+        ]
+        unordered = sorted(pool.map(_name_is_valid, ["Jane", 3], ordered=False))
+        assert unordered == [False, True]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_submit_returns_result_handle(workers):
+    with WorkerPool(workers, make_validators, (None,)) as pool:
+        result = pool.submit(_name_is_valid, "Jane")
+        assert result.get() is True
+
+
+def test_error_terminates_pool():
+    pool = WorkerPool(2, make_validators, (None,))
+    with pytest.raises(ValueError):
+        with pool:
+            list(pool.map(_fail, [1]))
+    assert not pool.parallel
+
+
+def test_make_validators_builds_one_validator_per_schema():
+    old, new = make_validators(None, None)
+    assert old is not new
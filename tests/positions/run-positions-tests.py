@@ -34,9 +34,8 @@ def load(path: Path):
         return json.load(handle)
 
 
-def validate(schema, document) -> list:
+def validate(validator, document) -> list:
     """Return a list of validation error messages (empty means valid)."""
-    validator = jsonschema.Draft7Validator(schema)
     return [error.message for error in validator.iter_errors(document)]
 
 
@@ -73,9 +72,12 @@ def main() -> int:
         sys.stderr.write("schema.json is missing work[].positions — feature not present.\n")
         return 1
 
+    # Compile the schema once and reuse it for every case.
+    validator = jsonschema.Draft7Validator(schema)
+
     passed = failed = 0
     for path, should_be_valid, description in CASES:
-        errors = validate(schema, load(path))
+        errors = validate(validator, load(path))
         is_valid = not errors
         if is_valid == should_be_valid:
             passed += 1